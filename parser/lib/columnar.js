@@ -0,0 +1,153 @@
+const fs = require('fs');
+const path = require('path');
+const { mergeDatabases } = require('./merge');
+const { NO_PROGRESS } = require('./progress');
+
+/**
+ * Columnar output: one binary file per column instead of row objects.
+ *
+ * Layout of the output directory:
+ *   manifest.json                     table/column index (see below)
+ *   <table>.<column>.i32              Int32 little-endian values
+ *   <table>.<column>.f64              Float64 little-endian values
+ *   <table>.<column>.codes.i32        string codes (-1 = null) ...
+ *   <table>.<column>.dict.json        ... into this dictionary array
+ *   <table>.<column>.valid.u8         1 = value present (only if nulls exist)
+ *
+ * manifest.json:
+ *   {"version": 1, "tables": {"players": {"db": 1, "rows": 18000, "columns": {
+ *       "playerid": {"type": "int32", "file": "players.playerid.i32"}, ...}}},
+ *    "conflicts": [{"table": "teams", "databases": [0, 1], "kept": 1}]}
+ *
+ * Tables with the same name in several databases: the later database wins,
+ * matching the merged JSON output; earlier copies are written as
+ * "<table>@db<n>" (see lib/merge.js).
+ */
+
+const COLUMNAR_VERSION = 1;
+const INT32_MIN = -2147483648;
+const INT32_MAX = 2147483647;
+
+function detectType(values) {
+    let isInt = true;
+    for (const value of values) {
+        if (value === null || value === undefined) {
+            continue;
+        }
+        if (typeof value !== 'number') {
+            return 'string';
+        }
+        if (!Number.isInteger(value) || value < INT32_MIN || value > INT32_MAX) {
+            isInt = false;
+        }
+    }
+    return isInt ? 'int32' : 'float64';
+}
+
+function writeArray(dir, file, typedArray) {
+    fs.writeFileSync(
+        path.join(dir, file),
+        Buffer.from(typedArray.buffer, typedArray.byteOffset, typedArray.byteLength)
+    );
+}
+
+function writeColumn(dir, tableName, column, values) {
+    const prefix = `${tableName}.${column}`;
+    const type = detectType(values);
+    const meta = { type };
+
+    let hasNulls = false;
+    const valid = new Uint8Array(values.length);
+    values.forEach((value, i) => {
+        if (value === null || value === undefined) {
+            hasNulls = true;
+        } else {
+            valid[i] = 1;
+        }
+    });
+
+    if (type === 'int32') {
+        meta.file = `${prefix}.i32`;
+        writeArray(dir, meta.file, Int32Array.from(values, v => v ?? 0));
+    } else if (type === 'float64') {
+        meta.file = `${prefix}.f64`;
+        writeArray(dir, meta.file, Float64Array.from(values, v => v ?? NaN));
+    } else {
+        // Dictionary encoding: each distinct string stored once
+        const dictionary = [];
+        const index = new Map();
+        const codes = Int32Array.from(values, value => {
+            if (value === null || value === undefined) {
+                return -1;
+            }
+            const text = String(value);
+            let code = index.get(text);
+            if (code === undefined) {
+                code = dictionary.length;
+                index.set(text, code);
+                dictionary.push(text);
+            }
+            return code;
+        });
+        meta.file = `${prefix}.codes.i32`;
+        meta.dictionary = `${prefix}.dict.json`;
+        writeArray(dir, meta.file, codes);
+        fs.writeFileSync(path.join(dir, meta.dictionary), JSON.stringify(dictionary), 'utf8');
+    }
+
+    if (hasNulls) {
+        meta.valid = `${prefix}.valid.u8`;
+        writeArray(dir, meta.valid, valid);
+    }
+
+    return meta;
+}
+
+/**
+ * Write every table of every database as columnar files into `dir`.
+ * A "columnar" progress event is reported after each table.
+ */
+function writeColumnar(databases, dir, progress = NO_PROGRESS) {
+    fs.mkdirSync(dir, { recursive: true });
+
+    const merge = mergeDatabases(databases);
+    const tables = new Map();
+    for (const [tableName, rows] of merge.tables) {
+        tables.set(tableName, { db: merge.sources.get(tableName), rows });
+    }
+    for (const [name, rows] of merge.shadowed) {
+        tables.set(name, { db: Number(name.slice(name.lastIndexOf('@db') + 3)), rows });
+    }
+
+    const manifest = { version: COLUMNAR_VERSION, tables: {}, conflicts: merge.conflicts };
+    let totalRecords = 0;
+
+    for (const [tableName, { db, rows }] of tables) {
+        // Union of keys in first-seen order (rows may have missing columns)
+        const columnNames = new Set();
+        for (const row of rows) {
+            for (const key of Object.keys(row)) {
+                columnNames.add(key);
+            }
+        }
+
+        const columns = {};
+        for (const column of columnNames) {
+            columns[column] = writeColumn(dir, tableName, column, rows.map(row => row[column]));
+        }
+
+        manifest.tables[tableName] = { db, rows: rows.length, columns };
+        totalRecords += rows.length;
+        progress.update('columnar', {
+            tablesParsed: Object.keys(manifest.tables).length,
+            rows: totalRecords
+        });
+    }
+
+    // Manifest last: its presence marks a complete output
+    fs.writeFileSync(path.join(dir, 'manifest.json'), JSON.stringify(manifest), 'utf8');
+
+    return { tableCount: merge.tables.size, totalRecords };
+}
+
+module.exports = { COLUMNAR_VERSION, writeColumnar };
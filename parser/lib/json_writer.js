@@ -0,0 +1,95 @@
+const fs = require('fs');
+const zlib = require('zlib');
+
+/**
+ * Compact JSON output written table by table.
+ *
+ * Produces the same document as JSON.stringify(mergedResult) (no indentation)
+ * without ever building the whole string, optionally piped through gzip or
+ * zstd. ParserBridge.load_output() detects the compression from magic bytes.
+ */
+
+const EXTENSIONS = { none: '', gzip: '.gz', zstd: '.zst' };
+
+/**
+ * Fail fast on an unknown or unavailable compression (before parsing).
+ */
+function checkCompression(compress) {
+    if (!(compress in EXTENSIONS)) {
+        throw new Error(`Unknown compression: ${compress} (expected none, gzip or zstd)`);
+    }
+    if (compress === 'zstd' && typeof zlib.createZstdCompress !== 'function') {
+        throw new Error(`zstd needs Node >= 22.15 (running ${process.version}); use --compress gzip`);
+    }
+}
+
+function createCompressor(compress) {
+    checkCompression(compress);
+    switch (compress) {
+        case 'none':
+            return null;
+        case 'gzip':
+            return zlib.createGzip({ level: 6 });
+        case 'zstd':
+            return zlib.createZstdCompress();
+    }
+}
+
+/**
+ * Output path with the extension matching the compression.
+ */
+function outputPathFor(basePath, compress) {
+    return basePath + EXTENSIONS[compress];
+}
+
+/**
+ * Stream `tables` ({name: rows}) as one compact JSON object into `outputPath`.
+ * Rows are serialized in chunks so peak memory stays near one chunk.
+ */
+async function writeCompactJson(tables, outputPath, compress = 'none', chunkSize = 1000) {
+    const file = fs.createWriteStream(outputPath);
+    const compressor = createCompressor(compress);
+    const sink = compressor || file;
+    if (compressor) {
+        compressor.pipe(file);
+    }
+
+    const done = new Promise((resolve, reject) => {
+        file.on('finish', resolve);
+        file.on('error', reject);
+        if (compressor) {
+            compressor.on('error', reject);
+        }
+    });
+
+    const write = async text => {
+        if (!sink.write(text)) {
+            await new Promise(resolve => sink.once('drain', resolve));
+        }
+    };
+
+    await write('{');
+    let firstTable = true;
+    for (const [tableName, rows] of Object.entries(tables)) {
+        await write(`${firstTable ? '' : ','}${JSON.stringify(tableName)}:`);
+        firstTable = false;
+
+        if (!Array.isArray(rows)) {
+            await write(JSON.stringify(rows));
+            continue;
+        }
+
+        await write('[');
+        for (let start = 0; start < rows.length; start += chunkSize) {
+            const chunk = rows.slice(start, start + chunkSize).map(row => JSON.stringify(row));
+            await write((start === 0 ? '' : ',') + chunk.join(','));
+        }
+        await write(']');
+    }
+    await write('}');
+
+    sink.end();
+    await done;
+}
+
+module.exports = { EXTENSIONS, checkCompression, outputPathFor, writeCompactJson };
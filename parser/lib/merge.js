@@ -0,0 +1,75 @@
+/**
+ * Merge per-database parser results into one table index.
+ *
+ * One pass over the tables, no object spreading: cost is linear in the
+ * number of tables whatever the number of embedded databases.
+ *
+ * Duplicate table names keep the old "later database wins" rule, but the
+ * earlier copy is not dropped: it stays available as `<table>@db<index>`
+ * and the clash is listed in `conflicts`.
+ */
+
+const MERGE_META_KEY = '_merge';
+
+function shadowName(tableName, dbIndex) {
+    return `${tableName}@db${dbIndex}`;
+}
+
+/**
+ * Returns {tables, sources, shadowed, conflicts}:
+ *   tables     Map name -> rows (later database wins)
+ *   sources    Map name -> index of the database the rows come from
+ *   shadowed   Map "<table>@db<n>" -> rows of overridden copies
+ *   conflicts  [{table, databases: [...], kept}] one per duplicated name
+ */
+function mergeDatabases(databases) {
+    const tables = new Map();
+    const sources = new Map();
+    const shadowed = new Map();
+    const conflicts = new Map();
+
+    databases.forEach((db, dbIndex) => {
+        for (const [tableName, rows] of Object.entries(db)) {
+            if (!Array.isArray(rows)) {
+                continue;
+            }
+            if (tables.has(tableName)) {
+                const previous = sources.get(tableName);
+                shadowed.set(shadowName(tableName, previous), tables.get(tableName));
+                if (!conflicts.has(tableName)) {
+                    conflicts.set(tableName, { table: tableName, databases: [previous] });
+                }
+                conflicts.get(tableName).databases.push(dbIndex);
+            }
+            tables.set(tableName, rows);
+            sources.set(tableName, dbIndex);
+        }
+    });
+
+    for (const conflict of conflicts.values()) {
+        conflict.kept = sources.get(conflict.table);
+    }
+
+    return { tables, sources, shadowed, conflicts: [...conflicts.values()] };
+}
+
+/**
+ * Output document for a merge: merged tables, shadowed copies and the
+ * `_merge` metadata (provenance and conflicts) read back by ParserBridge.
+ */
+function mergedDocument(merge) {
+    const document = {};
+    for (const [tableName, rows] of merge.tables) {
+        document[tableName] = rows;
+    }
+    for (const [name, rows] of merge.shadowed) {
+        document[name] = rows;
+    }
+    document[MERGE_META_KEY] = {
+        sources: Object.fromEntries(merge.sources),
+        conflicts: merge.conflicts
+    };
+    return document;
+}
+
+module.exports = { MERGE_META_KEY, shadowName, mergeDatabases, mergedDocument };
@@ -0,0 +1,301 @@
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+const parseCareer = require('fifa-career-save-parser');
+const { NO_PROGRESS, readFileWithProgress } = require('./progress');
+const { DB_SIGNATURE, SaveFile, loadShortnames } = require('./save_reader');
+const { applyProjection } = require('./tables');
+
+/**
+ * Parallel parsing of the databases embedded in a career save.
+ *
+ * A save is a header followed by several FIFA databases, each starting with
+ * the "DB\0\x08" signature. The save is split at those signatures and every
+ * database is parsed on its own worker thread (lib/parse_thread.js) with the
+ * same parseCareer() call as the serial path, which scans its input for DB
+ * signatures and so accepts a single-database segment. Results come back in
+ * save order, so the merge downstream sees exactly the serial layout.
+ *
+ * Any thread failure falls back to parsing the segments one by one on the
+ * main thread, and a segment the library rejects to one parse of the whole
+ * save.
+ *
+ * parseSaveLazy() does the same from a SaveFile (lib/save_reader.js): the
+ * whole save is never held in memory, threads read their own segment from
+ * disk and return only the projected tables.
+ */
+
+/**
+ * Byte ranges [{start, end}] of the databases in a save buffer.
+ */
+function splitDatabases(buffer) {
+    const offsets = [];
+    let offset = buffer.indexOf(DB_SIGNATURE);
+    while (offset !== -1) {
+        offsets.push(offset);
+        offset = buffer.indexOf(DB_SIGNATURE, offset + DB_SIGNATURE.length);
+    }
+    return offsets.map((start, i) => ({
+        start,
+        end: i + 1 < offsets.length ? offsets[i + 1] : buffer.length
+    }));
+}
+
+/**
+ * Default thread count: one per core, at most one per database.
+ */
+function defaultJobs() {
+    return typeof os.availableParallelism === 'function'
+        ? os.availableParallelism()
+        : os.cpus().length;
+}
+
+function runThread(workerData, transferList = []) {
+    return new Promise((resolve, reject) => {
+        const worker = new Worker(path.join(__dirname, 'parse_thread.js'), {
+            workerData,
+            transferList
+        });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        // No-op once resolved; catches threads that exit without a result
+        worker.once('exit', code => reject(new Error(`Parse thread exited with code ${code}`)));
+    });
+}
+
+function parseSegment(buffer, { start, end }, parserMode) {
+    // Copy the segment into its own ArrayBuffer so it can be transferred
+    const segment = new Uint8Array(end - start);
+    segment.set(buffer.subarray(start, end));
+    return runThread({ segment, parserMode }, [segment.buffer]);
+}
+
+/**
+ * Run `task(item)` over items with at most `limit` in flight, keeping order.
+ */
+async function mapLimit(items, limit, task) {
+    const results = new Array(items.length);
+    let next = 0;
+    const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await task(items[index]);
+        }
+    });
+    await Promise.all(runners);
+    return results;
+}
+
+/**
+ * Parse database segments one after another on this thread.
+ *
+ * parseCareer() blocks the event loop, so every segment is followed by a
+ * turn of the loop: the "parse" event `done` reports for it is written out
+ * (pipes are asynchronous on Windows) before the next segment blocks again.
+ * The bridge's stall timeout then bounds the time spent on one database, as
+ * with threads, instead of the whole save.
+ *
+ * @param {Array} segments          Segments to parse, in save order
+ * @param {Function} readSegment    Returns the bytes of a segment
+ * @param {number} parserMode
+ * @param {Function} done           Called with each segment's databases
+ */
+async function parseSerially(segments, readSegment, parserMode, done) {
+    const results = [];
+    for (const segment of segments) {
+        const result = await parseCareer(readSegment(segment), parserMode);
+        results.push(done(Array.isArray(result) ? result : [result]));
+        await new Promise(resolve => setImmediate(resolve));
+    }
+    return results;
+}
+
+/**
+ * Parse a save into its list of databases.
+ *
+ * @param {Buffer} buffer   Whole save file
+ * @param {number} parserMode
+ * @param {number} jobs     Max parse threads (1 = serial parse)
+ * @param {Function} log    Progress logger
+ * @param {ProgressReporter} progress  Receives "parse" events (lib/progress.js)
+ */
+async function parseDatabases(buffer, parserMode, jobs = defaultJobs(), log = () => {}, progress = NO_PROGRESS) {
+    const segments = splitDatabases(buffer);
+    const totalDatabases = Math.max(segments.length, 1);
+    progress.update('parse', { databasesParsed: 0, totalDatabases });
+
+    let databasesParsed = 0;
+    const done = databases => {
+        progress.update('parse', { databasesParsed: ++databasesParsed });
+        return databases;
+    };
+
+    if (jobs > 1 && segments.length > 1) {
+        const threads = Math.min(jobs, segments.length);
+        log(`   ℹ️  Parsing ${segments.length} databases on ${threads} threads`);
+        try {
+            const results = await mapLimit(segments, threads, async segment =>
+                done(await parseSegment(buffer, segment, parserMode))
+            );
+            return results.flat();
+        } catch (error) {
+            log(`   ⚠️  Parallel parse failed (${error.message}); parsing serially`);
+            databasesParsed = 0;
+        }
+    }
+
+    if (segments.length > 1) {
+        try {
+            const readSegment = ({ start, end }) => Buffer.from(buffer.subarray(start, end));
+            const results = await parseSerially(segments, readSegment, parserMode, databases => {
+                if (databases.length === 0) {
+                    throw new Error('No database found in segment');
+                }
+                return done(databases);
+            });
+            return results.flat();
+        } catch (error) {
+            log(`   ⚠️  Segment parse failed (${error.message}); parsing the whole save`);
+        }
+    }
+
+    // Single database (or segments the library rejects on their own):
+    // blocks the event loop, with no progress, until the whole save is parsed
+    const result = await parseCareer(buffer, parserMode);
+    progress.update('parse', { databasesParsed: totalDatabases });
+    return Array.isArray(result) ? result : [result];
+}
+
+/**
+ * Segments worth parsing: all of them, unless a projection and the table
+ * shortnames are known, in which case segments without any projected table
+ * are skipped (their header is the only part read).
+ */
+function selectSegments(saveFile, segments, projection, shortnames, log) {
+    if (!projection || !shortnames) {
+        return segments.map(() => true);
+    }
+    const wanted = new Set();
+    for (const tableName of Object.keys(projection)) {
+        const shortname = shortnames.get(tableName);
+        if (shortname) {
+            // Accept both byte orders of the 4-letter name
+            wanted.add(shortname);
+            wanted.add([...shortname].reverse().join(''));
+        }
+    }
+    const selected = segments.map(segment =>
+        saveFile.tableShortnames(segment).some(shortname => wanted.has(shortname))
+    );
+    if (!selected.some(Boolean)) {
+        // Header layout not recognized: parse everything rather than nothing
+        return segments.map(() => true);
+    }
+    const skipped = selected.filter(keep => !keep).length;
+    if (skipped) {
+        log(`   ℹ️  Skipping ${skipped} of ${segments.length} databases (no projected tables)`);
+    }
+    return selected;
+}
+
+/**
+ * Parse a save from disk one database segment at a time.
+ *
+ * Skipped segments yield an empty database so indexes (source_db) match
+ * the full parse. The projection, if any, is applied to every segment as
+ * soon as it is parsed.
+ *
+ * @param {SaveFile} saveFile
+ * @param {number} parserMode
+ * @param {Object} options  {jobs, log, progress, projection, shortnames}
+ */
+async function parseSaveLazy(saveFile, parserMode, options = {}) {
+    const {
+        jobs = defaultJobs(),
+        log = () => {},
+        progress = NO_PROGRESS,
+        projection = null,
+        shortnames = null
+    } = options;
+    const project = databases => (projection ? applyProjection(databases, projection) : databases);
+
+    const segments = saveFile.findDatabases(progress);
+    if (segments.length === 0) {
+        // No recognizable databases: let the library handle the whole file
+        const databases = await parseDatabases(saveFile.read(0, saveFile.size), parserMode, 1, log, progress);
+        return project(databases);
+    }
+
+    const selected = selectSegments(saveFile, segments, projection, shortnames, log);
+    const toParse = segments.filter((_, i) => selected[i]);
+    progress.update('parse', { databasesParsed: 0, totalDatabases: toParse.length });
+
+    let databasesParsed = 0;
+    const done = databases => {
+        progress.update('parse', { databasesParsed: ++databasesParsed });
+        return databases;
+    };
+
+    let results = null;
+    if (jobs > 1 && toParse.length > 1) {
+        log(`   ℹ️  Parsing ${toParse.length} databases on ${Math.min(jobs, toParse.length)} threads`);
+        try {
+            results = await mapLimit(toParse, jobs, async ({ start, end }) =>
+                done(await runThread({ path: saveFile.path, start, end, parserMode, projection }))
+            );
+        } catch (error) {
+            log(`   ⚠️  Parallel parse failed (${error.message}); parsing serially`);
+            databasesParsed = 0;
+        }
+    }
+    if (results === null) {
+        // Only one segment is in memory while it is parsed
+        results = await parseSerially(
+            toParse,
+            ({ start, end }) => saveFile.read(start, end),
+            parserMode,
+            databases => done(project(databases))
+        );
+    }
+
+    const databases = [];
+    let next = 0;
+    segments.forEach((_, i) => {
+        if (selected[i]) {
+            databases.push(...results[next++]);
+        } else {
+            databases.push({});
+        }
+    });
+    return databases;
+}
+
+/**
+ * Parse the save at `savePath` into its (projected) list of databases.
+ *
+ * @param {Object} options  {lazy, jobs, log, progress, projection}; lazy
+ *                          reads segments on demand instead of the whole file
+ */
+async function parseSave(savePath, parserMode, options = {}) {
+    const { lazy = false, jobs = defaultJobs(), log = () => {}, progress = NO_PROGRESS, projection = null } = options;
+
+    if (lazy) {
+        const saveFile = new SaveFile(savePath);
+        try {
+            return await parseSaveLazy(saveFile, parserMode, {
+                jobs,
+                log,
+                progress,
+                projection,
+                shortnames: projection ? loadShortnames(parserMode) : null
+            });
+        } finally {
+            saveFile.close();
+        }
+    }
+
+    const databases = await parseDatabases(readFileWithProgress(savePath, progress), parserMode, jobs, log, progress);
+    return projection ? applyProjection(databases, projection) : databases;
+}
+
+module.exports = { splitDatabases, defaultJobs, parseDatabases, parseSaveLazy, parseSave };
@@ -0,0 +1,40 @@
+const fs = require('fs');
+const { parentPort, workerData } = require('worker_threads');
+const parseCareer = require('fifa-career-save-parser');
+const { applyProjection } = require('./tables');
+
+/**
+ * Worker thread body for lib/parallel.js: parses one database segment and
+ * posts back its list of databases.
+ *
+ * The segment is either transferred in (`segment`) or read from the save
+ * file by this thread (`path`, `start`, `end`, lazy mode). With a
+ * `projection`, only the projected tables are sent back.
+ */
+
+function readRange(filePath, start, end) {
+    const buffer = Buffer.allocUnsafe(end - start);
+    const fd = fs.openSync(filePath, 'r');
+    try {
+        const n = fs.readSync(fd, buffer, 0, buffer.length, start);
+        return buffer.subarray(0, n);
+    } finally {
+        fs.closeSync(fd);
+    }
+}
+
+(async () => {
+    const { segment, path, start, end, parserMode, projection } = workerData;
+    const buffer = path
+        ? readRange(path, start, end)
+        : Buffer.from(segment.buffer, segment.byteOffset, segment.byteLength);
+    const result = await parseCareer(buffer, parserMode);
+    let databases = Array.isArray(result) ? result : [result];
+    if (databases.length === 0) {
+        throw new Error('No database found in segment');
+    }
+    if (projection) {
+        databases = applyProjection(databases, projection);
+    }
+    parentPort.postMessage(databases);
+})();
@@ -0,0 +1,110 @@
+const fs = require('fs');
+
+/**
+ * Structured progress events for ParserBridge.
+ *
+ * Events are single JSON lines:
+ *   {"type": "progress", "stage": "read", "bytesRead": ..., "totalBytes": ..., "elapsed": ...}
+ *   {"type": "progress", "stage": "parse", "databasesParsed": 1, "totalDatabases": 2, ...}
+ *   {"type": "progress", "stage": "stream", "tablesParsed": 3, "rows": 52000, "rowsPerSec": ..., ...}
+ *   {"type": "heartbeat", "elapsed": ...}   while the event loop is free
+ *
+ * parse_save.js writes them to stderr (--progress), the worker sends them on
+ * stdout tagged with the request id. The bridge's stall timeout is reset by
+ * progress events (and table/end messages) only: heartbeats fire whenever
+ * the event loop is idle, even while a parse thread hangs, so they just keep
+ * the display alive. Databases are reported one by one, serial parses
+ * included (lib/parallel.js), so the timeout bounds the time spent on one
+ * database rather than on the whole save.
+ */
+
+const HEARTBEAT_MS = 2000;
+const READ_CHUNK = 8 * 1024 * 1024;
+
+class ProgressReporter {
+    /**
+     * @param {Function} write   Receives each event object
+     * @param {Object} extra     Fields added to every event (e.g. request id)
+     */
+    constructor(write, extra = {}, heartbeatMs = HEARTBEAT_MS) {
+        this.write = write;
+        this.extra = extra;
+        this.heartbeatMs = heartbeatMs;
+        this.startedAt = Date.now();
+        this.stage = null;
+        this.stageStartedAt = this.startedAt;
+        this.state = {};
+        this.timer = null;
+    }
+
+    elapsed() {
+        return (Date.now() - this.startedAt) / 1000;
+    }
+
+    /**
+     * Emit a progress event; `fields` are merged into the current state.
+     */
+    update(stage, fields = {}) {
+        if (stage !== this.stage) {
+            this.stage = stage;
+            this.stageStartedAt = Date.now();
+            this.state = {};
+        }
+        Object.assign(this.state, fields);
+
+        const event = { ...this.extra, type: 'progress', stage, ...this.state, elapsed: this.elapsed() };
+        if (this.state.rows !== undefined) {
+            const seconds = (Date.now() - this.stageStartedAt) / 1000;
+            event.rowsPerSec = seconds > 0 ? Math.round(this.state.rows / seconds) : null;
+        }
+        this.write(event);
+    }
+
+    /**
+     * Start the heartbeat timer. Heartbeats keep the display alive while a
+     * stage is quiet; the timer fires whenever the event loop is idle (even
+     * if a parse thread hangs), so the bridge never treats them as progress.
+     */
+    start() {
+        this.timer = setInterval(() => {
+            this.write({ ...this.extra, type: 'heartbeat', stage: this.stage, elapsed: this.elapsed() });
+        }, this.heartbeatMs);
+        this.timer.unref();
+        return this;
+    }
+
+    stop() {
+        clearInterval(this.timer);
+        this.timer = null;
+    }
+}
+
+/**
+ * Reporter that drops every event (progress not requested).
+ */
+const NO_PROGRESS = { update() {}, start() { return this; }, stop() {} };
+
+/**
+ * Read a whole file in chunks, reporting bytes read.
+ */
+function readFileWithProgress(filePath, progress = NO_PROGRESS) {
+    const totalBytes = fs.statSync(filePath).size;
+    const buffer = Buffer.allocUnsafe(totalBytes);
+    const fd = fs.openSync(filePath, 'r');
+    try {
+        let bytesRead = 0;
+        while (bytesRead < totalBytes) {
+            const n = fs.readSync(fd, buffer, bytesRead, Math.min(READ_CHUNK, totalBytes - bytesRead), bytesRead);
+            if (n === 0) {
+                break;
+            }
+            bytesRead += n;
+            progress.update('read', { bytesRead, totalBytes });
+        }
+        return buffer.subarray(0, bytesRead);
+    } finally {
+        fs.closeSync(fd);
+    }
+}
+
+module.exports = { HEARTBEAT_MS, ProgressReporter, NO_PROGRESS, readFileWithProgress };
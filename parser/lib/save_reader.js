@@ -0,0 +1,125 @@
+const fs = require('fs');
+const path = require('path');
+const { NO_PROGRESS } = require('./progress');
+
+/**
+ * Lazy access to a career save on disk.
+ *
+ * Instead of reading the whole file into one Buffer, the save is scanned in
+ * fixed-size chunks for database signatures and each database segment is
+ * read (positional readSync) only when it is parsed. Segment headers list
+ * the 4-letter shortnames of their tables, which the meta XML maps to table
+ * names, so segments holding none of the projected tables are never read.
+ *
+ * t3db segment header (little-endian):
+ *   0   "DB\0\x08" signature + 4 bytes
+ *   8   uint32 segment length
+ *   12  uint32 (0)
+ *   16  uint32 table count
+ *   20  uint32 crc
+ *   24  table count x (char[4] shortname, uint32 offset)
+ */
+
+const DB_SIGNATURE = Buffer.from([0x44, 0x42, 0x00, 0x08]);
+const SCAN_CHUNK = 4 * 1024 * 1024;
+const HEADER_SIZE = 24;
+const TABLE_ENTRY_SIZE = 8;
+const XML_DIR = path.join(__dirname, '..', 'xml');
+
+class SaveFile {
+    constructor(filePath) {
+        this.path = filePath;
+        this.fd = fs.openSync(filePath, 'r');
+        this.size = fs.fstatSync(this.fd).size;
+    }
+
+    close() {
+        if (this.fd !== null) {
+            fs.closeSync(this.fd);
+            this.fd = null;
+        }
+    }
+
+    /**
+     * Bytes [start, end) of the file in a new Buffer.
+     */
+    read(start, end) {
+        const buffer = Buffer.allocUnsafe(end - start);
+        let offset = 0;
+        while (offset < buffer.length) {
+            const n = fs.readSync(this.fd, buffer, offset, buffer.length - offset, start + offset);
+            if (n === 0) {
+                break;
+            }
+            offset += n;
+        }
+        return buffer.subarray(0, offset);
+    }
+
+    /**
+     * Byte ranges [{start, end}] of the databases, found with a chunked scan
+     * (memory stays at one chunk whatever the save size).
+     */
+    findDatabases(progress = NO_PROGRESS) {
+        const offsets = [];
+        const overlap = DB_SIGNATURE.length - 1;
+        for (let chunkStart = 0; chunkStart < this.size; chunkStart += SCAN_CHUNK) {
+            // Overlap the previous chunk so a signature across the boundary is found
+            const readStart = Math.max(chunkStart - overlap, 0);
+            const chunk = this.read(readStart, Math.min(chunkStart + SCAN_CHUNK, this.size));
+            let index = chunk.indexOf(DB_SIGNATURE);
+            while (index !== -1) {
+                const offset = readStart + index;
+                if (offsets[offsets.length - 1] !== offset) {
+                    offsets.push(offset);
+                }
+                index = chunk.indexOf(DB_SIGNATURE, index + 1);
+            }
+            progress.update('read', {
+                bytesRead: Math.min(chunkStart + SCAN_CHUNK, this.size),
+                totalBytes: this.size
+            });
+        }
+        return offsets.map((start, i) => ({
+            start,
+            end: i + 1 < offsets.length ? offsets[i + 1] : this.size
+        }));
+    }
+
+    /**
+     * Shortnames of the tables stored in a database segment (header only).
+     */
+    tableShortnames({ start, end }) {
+        const header = this.read(start, Math.min(start + HEADER_SIZE, end));
+        if (header.length < HEADER_SIZE) {
+            return [];
+        }
+        const tableCount = header.readUInt32LE(16);
+        const list = this.read(start + HEADER_SIZE, Math.min(start + HEADER_SIZE + tableCount * TABLE_ENTRY_SIZE, end));
+        const shortnames = [];
+        for (let offset = 0; offset + TABLE_ENTRY_SIZE <= list.length; offset += TABLE_ENTRY_SIZE) {
+            shortnames.push(list.toString('latin1', offset, offset + 4));
+        }
+        return shortnames;
+    }
+}
+
+/**
+ * Table name -> shortname map from xml/<mode>/*.xml, or null if unavailable.
+ */
+function loadShortnames(parserMode) {
+    const dir = path.join(XML_DIR, String(parserMode));
+    if (!fs.existsSync(dir)) {
+        return null;
+    }
+    const shortnames = new Map();
+    for (const file of fs.readdirSync(dir).filter(name => name.endsWith('.xml'))) {
+        const xml = fs.readFileSync(path.join(dir, file), 'utf8');
+        for (const match of xml.matchAll(/<table name="([^"]+)" shortname="([^"]+)"/g)) {
+            shortnames.set(match[1], match[2]);
+        }
+    }
+    return shortnames.size ? shortnames : null;
+}
+
+module.exports = { DB_SIGNATURE, SaveFile, loadShortnames };
@@ -0,0 +1,114 @@
+const fs = require('fs');
+const path = require('path');
+const { NO_PROGRESS } = require('./progress');
+
+/**
+ * Shared helpers for parse_save.js and parser_worker.js
+ */
+
+const PARSER_MODE = 21; // FIFA 21 mode for FC 26 compatibility
+
+/**
+ * Default save path from .env (FC26_SAVES_PATH) or the original dev machine.
+ */
+function defaultSavePath() {
+    return process.env.FC26_SAVES_PATH
+        ? path.join(process.env.FC26_SAVES_PATH, 'CmMgrC20251119080713440')
+        : 'C:\\Users\\mateu\\AppData\\Local\\EA SPORTS FC 26\\settings\\CmMgrC20251119080713440';
+}
+
+/**
+ * Load a projection spec from a JSON file path or an inline JSON object.
+ */
+function loadProjection(value) {
+    if (!value) {
+        throw new Error('--projection requires a file path or JSON object');
+    }
+    if (typeof value === 'object') {
+        return value;
+    }
+    const text = value.trim().startsWith('{')
+        ? value
+        : fs.readFileSync(path.resolve(value), 'utf8');
+    return JSON.parse(text);
+}
+
+/**
+ * Keep only the tables and columns listed in the projection spec.
+ */
+function applyProjection(databases, projection) {
+    return databases.map(db => {
+        const projected = {};
+        for (const [tableName, columns] of Object.entries(projection)) {
+            const rows = db[tableName];
+            if (!Array.isArray(rows)) {
+                continue;
+            }
+            projected[tableName] = columns
+                ? rows.map(row => {
+                    const picked = {};
+                    for (const column of columns) {
+                        if (column in row) {
+                            picked[column] = row[column];
+                        }
+                    }
+                    return picked;
+                })
+                : rows;
+        }
+        return projected;
+    });
+}
+
+/**
+ * Write one NDJSON message to a stream, honoring pipe backpressure.
+ */
+async function writeMessage(stream, message) {
+    if (!stream.write(JSON.stringify(message) + '\n')) {
+        await new Promise(resolve => stream.once('drain', resolve));
+    }
+}
+
+/**
+ * Send every table of every database as row batches.
+ * Message shape: {"type": "table", "db": 0, "table": "players", "rows": [...]}
+ * `send` receives each message; `extra` fields are merged into every message.
+ * A "stream" progress event is reported after each table.
+ */
+async function streamTables(databases, batchSize, send, extra = {}, progress = NO_PROGRESS) {
+    let tableCount = 0;
+    let totalRecords = 0;
+
+    for (let dbIndex = 0; dbIndex < databases.length; dbIndex++) {
+        for (const [tableName, rows] of Object.entries(databases[dbIndex])) {
+            if (!Array.isArray(rows)) {
+                continue;
+            }
+            tableCount++;
+            totalRecords += rows.length;
+
+            // Empty tables still get one message so the reader sees them
+            for (let start = 0; start === 0 || start < rows.length; start += batchSize) {
+                await send({
+                    ...extra,
+                    type: 'table',
+                    db: dbIndex,
+                    table: tableName,
+                    rows: rows.slice(start, start + batchSize)
+                });
+            }
+            progress.update('stream', { tablesParsed: tableCount, rows: totalRecords });
+        }
+    }
+
+    return { tableCount, totalRecords };
+}
+
+module.exports = {
+    PARSER_MODE,
+    defaultSavePath,
+    loadProjection,
+    applyProjection,
+    writeMessage,
+    streamTables
+};
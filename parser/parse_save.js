@@ -1,66 +1,205 @@
 const fs = require('fs');
 const path = require('path');
-const parseCareer = require('fifa-career-save-parser');
 require('dotenv').config({ path: '../.env' });
+const {
+    PARSER_MODE,
+    defaultSavePath,
+    loadProjection,
+    writeMessage,
+    streamTables
+} = require('./lib/tables');
+const { writeColumnar } = require('./lib/columnar');
+const { defaultJobs, parseSave } = require('./lib/parallel');
+const { ProgressReporter, NO_PROGRESS } = require('./lib/progress');
+const { mergeDatabases, mergedDocument } = require('./lib/merge');
+const { checkCompression, outputPathFor, writeCompactJson } = require('./lib/json_writer');
 
 /**
  * FC26 Save Parser - Dynamic Script
  * Accepts save path as command line argument
+ *
+ * Usage:
+ *   node parse_save.js [savePath] [--stream] [--batch-size N] [--projection SPEC]
+ *                      [--columnar DIR] [--compact] [--compress none|gzip|zstd]
+ *                      [--output PATH] [--jobs N] [--progress] [--lazy]
+ *
+ * --stream      Emit tables as NDJSON on stdout instead of writing
+ *               output/test_parse.json. Human-readable logs go to stderr.
+ * --batch-size  Max rows per NDJSON message in stream mode (default 5000)
+ * --projection  Table/column spec (JSON file path or inline JSON object, see
+ *               projection.json). Unlisted tables and columns are dropped
+ *               before serialization; a null column list keeps every column.
+ * --columnar    Write per-table columnar files into DIR (see lib/columnar.js)
+ *               instead of JSON. With --stream, only the end marker is sent.
+ * --compact     Write output JSON without indentation, table by table
+ * --compress    Compress the output JSON (implies --compact); the file gets a
+ *               .gz / .zst extension
+ * --output      Output JSON path (default output/test_parse.json)
+ * --jobs        Parse the save's databases on up to N threads (default: one
+ *               per core; 1 = serial parse, see lib/parallel.js)
+ * --progress    Write JSON progress events and heartbeats to stderr, one per
+ *               line (see lib/progress.js)
+ * --lazy        Read the save one database segment at a time instead of
+ *               loading it whole; with --projection, segments without any
+ *               projected table are skipped (see lib/save_reader.js)
  */
 
-// Get save path from command line argument or use default (fallback)
-const defaultSavePath = process.env.FC26_SAVES_PATH 
-    ? path.join(process.env.FC26_SAVES_PATH, 'CmMgrC20251119080713440')
-    : 'C:\\Users\\mateu\\AppData\\Local\\EA SPORTS FC 26\\settings\\CmMgrC20251119080713440';
+// Parse command line: first positional argument is the save path, rest are flags
+function parseArgs(argv) {
+    const args = {
+        savePath: null,
+        stream: false,
+        batchSize: 5000,
+        projection: null,
+        columnar: null,
+        compact: false,
+        compress: 'none',
+        output: null,
+        jobs: defaultJobs(),
+        progress: false,
+        lazy: false
+    };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        if (arg === '--stream') {
+            args.stream = true;
+        } else if (arg === '--batch-size') {
+            args.batchSize = parseInt(argv[++i], 10);
+        } else if (arg === '--compact') {
+            args.compact = true;
+        } else if (arg === '--compress') {
+            args.compress = argv[++i];
+            args.compact = true;
+        } else if (arg === '--output') {
+            args.output = argv[++i];
+        } else if (arg === '--lazy') {
+            args.lazy = true;
+        } else if (arg === '--progress') {
+            args.progress = true;
+        } else if (arg === '--jobs') {
+            args.jobs = parseInt(argv[++i], 10);
+        } else if (arg === '--columnar') {
+            args.columnar = argv[++i];
+        } else if (arg === '--projection') {
+            args.projection = loadProjection(argv[++i]);
+        } else if (!args.savePath) {
+            args.savePath = arg;
+        }
+    }
+    if (!Number.isInteger(args.batchSize) || args.batchSize <= 0) {
+        throw new Error('--batch-size must be a positive integer');
+    }
+    if (!Number.isInteger(args.jobs) || args.jobs <= 0) {
+        throw new Error('--jobs must be a positive integer');
+    }
+    checkCompression(args.compress);
+    return args;
+}
 
-const saveFilePath = process.argv[2] || defaultSavePath;
+const args = parseArgs(process.argv.slice(2));
 
-const outputPath = path.join(__dirname, 'output', 'test_parse.json');
-const parserMode = 21; // FIFA 21 mode for FC 26 compatibility
+const saveFilePath = args.savePath || defaultSavePath();
+
+const outputPath = outputPathFor(
+    args.output ? path.resolve(args.output) : path.join(__dirname, 'output', 'test_parse.json'),
+    args.compress
+);
+const parserMode = PARSER_MODE;
+
+// In stream mode stdout carries NDJSON only, so logs are redirected to stderr
+const log = args.stream ? console.error : console.log;
+
+const progress = args.progress
+    ? new ProgressReporter(event => process.stderr.write(JSON.stringify(event) + '\n'))
+    : NO_PROGRESS;
 
 async function parseCareerSave() {
-    console.log('🎮 FC26 Save Parser');
-    console.log('='.repeat(60));
-    console.log('');
+    log('🎮 FC26 Save Parser');
+    log('='.repeat(60));
+    log('');
     
+    progress.start();
     try {
         // Step 1: Verify save file exists
-        console.log('📂 Step 1: Locating save file...');
-        console.log(`   Path: ${saveFilePath}`);
+        log('📂 Step 1: Locating save file...');
+        log(`   Path: ${saveFilePath}`);
         
         if (!fs.existsSync(saveFilePath)) {
             throw new Error(`Save file not found at: ${saveFilePath}`);
         }
         
         const stats = fs.statSync(saveFilePath);
-        console.log(`   ✅ Found save file (${(stats.size / 1024 / 1024).toFixed(2)} MB)`);
-        console.log('');
+        log(`   ✅ Found save file (${(stats.size / 1024 / 1024).toFixed(2)} MB)`);
+        log('');
         
         // Step 2: Parse save file
-        console.log('⚙️  Step 2: Parsing save file...');
-        console.log('   This may take 10-30 seconds...');
+        log('⚙️  Step 2: Parsing save file...');
+        log('   This may take 10-30 seconds...');
         
         const startTime = Date.now();
-        const fileBuffer = fs.readFileSync(saveFilePath);
-        const result = await parseCareer(fileBuffer, parserMode);
+        const databases = await parseSave(saveFilePath, parserMode, {
+            lazy: args.lazy,
+            jobs: args.jobs,
+            log,
+            progress,
+            projection: args.projection
+        });
         
         const parseTime = ((Date.now() - startTime) / 1000).toFixed(2);
-        console.log(`   ✅ Parsing completed in ${parseTime}s`);
-        console.log('');
-        
-        // Step 3: Merge databases if array
-        let mergedResult = {};
-        if (Array.isArray(result)) {
-            console.log(`   ℹ️  Found ${result.length} databases in save file`);
-            result.forEach(db => {
-                mergedResult = { ...mergedResult, ...db };
-            });
-        } else {
-            mergedResult = result;
+        log(`   ✅ Parsing completed in ${parseTime}s`);
+        log('');
+        
+        if (args.projection) {
+            log(`   ℹ️  Projection applied: ${Object.keys(args.projection).length} tables kept`);
+            log('');
         }
         
+        if (args.columnar) {
+            log('🗂️  Step 3: Writing columnar tables...');
+            const { tableCount, totalRecords } = writeColumnar(databases, args.columnar, progress);
+            log(`   ✅ Wrote ${tableCount} tables (${totalRecords.toLocaleString()} records) to ${args.columnar}`);
+            log('');
+            if (args.stream) {
+                await writeMessage(process.stdout, { type: 'end', tableCount, totalRecords });
+            }
+            
+            return {
+                success: true,
+                tableCount,
+                totalRecords,
+                parseTime,
+                outputPath: args.columnar
+            };
+        }
+        
+        if (args.stream) {
+            log('📡 Step 3: Streaming tables to stdout...');
+            const send = message => writeMessage(process.stdout, message);
+            const { tableCount, totalRecords } = await streamTables(databases, args.batchSize, send, {}, progress);
+            // End marker lets the reader detect truncated output
+            await send({ type: 'end', tableCount, totalRecords });
+            log(`   ✅ Streamed ${tableCount} tables (${totalRecords.toLocaleString()} records)`);
+            log('');
+            
+            return {
+                success: true,
+                tableCount,
+                totalRecords,
+                parseTime
+            };
+        }
+        
+        // Step 3: Merge databases (single pass, duplicates kept as <table>@db<n>)
+        log(`   ℹ️  Found ${databases.length} databases in save file`);
+        const merge = mergeDatabases(databases);
+        for (const conflict of merge.conflicts) {
+            log(`   ⚠️  Table ${conflict.table} found in databases ${conflict.databases.join(', ')}; ` +
+                `using database ${conflict.kept}, others kept as ${conflict.table}@db<n>`);
+        }
+        const mergedResult = mergedDocument(merge);
+        
         // Step 4: Calculate statistics
-        console.log('📈 Step 3: Statistics:');
+        log('📈 Step 3: Statistics:');
         
         let totalRecords = 0;
         const tableSummary = {};
@@ -72,44 +211,49 @@ async function parseCareerSave() {
             }
         }
         
-        const tableCount = Object.keys(mergedResult).length;
-        console.log(`   Total tables: ${tableCount}`);
-        console.log(`   Total records: ${totalRecords.toLocaleString()}`);
-        console.log('');
+        const tableCount = merge.tables.size;
+        log(`   Total tables: ${tableCount}`);
+        log(`   Total records: ${totalRecords.toLocaleString()}`);
+        log('');
         
         // Show top tables
-        console.log('   Top 5 largest tables:');
+        log('   Top 5 largest tables:');
         const sortedTables = Object.entries(tableSummary)
             .sort((a, b) => b[1] - a[1])
             .slice(0, 5);
         
         for (const [tableName, count] of sortedTables) {
-            console.log(`   - ${tableName}: ${count.toLocaleString()} records`);
+            log(`   - ${tableName}: ${count.toLocaleString()} records`);
         }
-        console.log('');
+        log('');
         
         // Step 5: Save output
-        console.log('💾 Step 4: Saving output...');
+        log('💾 Step 4: Saving output...');
         
         const outputDir = path.dirname(outputPath);
         if (!fs.existsSync(outputDir)) {
             fs.mkdirSync(outputDir, { recursive: true });
         }
         
-        fs.writeFileSync(
-            outputPath, 
-            JSON.stringify(mergedResult, null, 2),
-            'utf8'
-        );
+        if (args.compact) {
+            await writeCompactJson(mergedResult, outputPath, args.compress);
+        } else {
+            fs.writeFileSync(
+                outputPath, 
+                JSON.stringify(mergedResult, null, 2),
+                'utf8'
+            );
+        }
         
-        console.log(`   ✅ Saved to: ${outputPath}`);
-        console.log('');
+        const outputSize = fs.statSync(outputPath).size;
+        log(`   ✅ Saved to: ${outputPath} (${(outputSize / 1024 / 1024).toFixed(2)} MB)`);
+        log('');
         
         // Final message
-        console.log('='.repeat(60));
-        console.log('🎉 PARSING COMPLETE');
-        console.log('='.repeat(60));
-        console.log('');
+        log('='.repeat(60));
+        log('🎉 PARSING COMPLETE');
+        log('='.repeat(60));
+        log('');
         
         return {
             success: true,
@@ -120,28 +264,31 @@ async function parseCareerSave() {
         };
         
     } catch (error) {
-        console.log('');
-        console.log('='.repeat(60));
-        console.log('❌ PARSING FAILED');
-        console.log('='.repeat(60));
-        console.log('');
-        console.log('Error:', error.message);
-        console.log('');
-        console.log('Stack trace:');
-        console.log(error.stack);
-        console.log('');
+        log('');
+        log('='.repeat(60));
+        log('❌ PARSING FAILED');
+        log('='.repeat(60));
+        log('');
+        log('Error:', error.message);
+        log('');
+        log('Stack trace:');
+        log(error.stack);
+        log('');
         
         return {
             success: false,
             error: error.message
         };
+    } finally {
+        progress.stop();
     }
 }
 
 // Run parser
 parseCareerSave()
     .then(result => {
-        process.exit(result.success ? 0 : 1);
+        // exitCode instead of exit() so buffered stdout (stream mode) is flushed
+        process.exitCode = result.success ? 0 : 1;
     })
     .catch(error => {
         console.error('Unexpected error:', error);
@@ -0,0 +1,132 @@
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+require('dotenv').config({ path: path.join(__dirname, '..', '.env') });
+const {
+    PARSER_MODE,
+    defaultSavePath,
+    loadProjection,
+    writeMessage,
+    streamTables
+} = require('./lib/tables');
+const { writeColumnar } = require('./lib/columnar');
+const { defaultJobs, parseSave } = require('./lib/parallel');
+const { ProgressReporter, NO_PROGRESS } = require('./lib/progress');
+
+/**
+ * FC26 Save Parser - Persistent Worker
+ *
+ * Long-lived process driven by ParserBridge over stdin/stdout, so Node
+ * startup and module loading are paid once instead of on every import.
+ *
+ * Requests (one JSON object per line on stdin):
+ *   {"id": 1, "cmd": "ping"}
+ *   {"id": 2, "cmd": "parse", "savePath": "...", "projection": {...}, "batchSize": 5000,
+ *    "jobs": 4, "progress": true, "lazy": true}         jobs: parse threads (default: cores)
+ *                                                       lazy: read the save segment by segment
+ *   {"id": 3, "cmd": "parse", "savePath": "...", "columnar": "/output/dir"}
+ *   {"id": 4, "cmd": "shutdown"}
+ *
+ * Responses (NDJSON on stdout, tagged with the request id):
+ *   {"type": "ready", "pid": ...}                       once, at startup
+ *   {"id": 1, "type": "pong", "pid": ..., "uptime": ..., "requests": ...}
+ *   {"id": 2, "type": "table", "db": 0, "table": "...", "rows": [...]}
+ *   {"id": 2, "type": "progress", "stage": "...", ...}  with "progress": true
+ *   {"id": 2, "type": "heartbeat", "elapsed": ...}      (see lib/progress.js)
+ *   {"id": 2, "type": "end", "tableCount": ..., "totalRecords": ..., "parseTime": ...}
+ *   (columnar requests write files instead of sending table messages)
+ *   {"id": N, "type": "error", "message": "..."}
+ *
+ * Logs go to stderr. Requests are handled one at a time, in order.
+ */
+
+const startedAt = Date.now();
+let handledRequests = 0;
+
+const send = message => writeMessage(process.stdout, message);
+
+async function handleParse(request) {
+    const savePath = request.savePath || defaultSavePath();
+    const batchSize = request.batchSize || 5000;
+    const jobs = request.jobs || defaultJobs();
+
+    if (!fs.existsSync(savePath)) {
+        throw new Error(`Save file not found at: ${savePath}`);
+    }
+
+    // Progress events share stdout with the response, tagged with the request id
+    const progress = request.progress
+        ? new ProgressReporter(event => send(event), { id: request.id }).start()
+        : NO_PROGRESS;
+
+    try {
+        console.error(`⚙️  Parsing ${savePath}...`);
+        const startTime = Date.now();
+        const databases = await parseSave(savePath, PARSER_MODE, {
+            lazy: Boolean(request.lazy),
+            jobs,
+            log: console.error,
+            progress,
+            projection: request.projection ? loadProjection(request.projection) : null
+        });
+        const parseTime = ((Date.now() - startTime) / 1000).toFixed(2);
+        console.error(`   ✅ Parsing completed in ${parseTime}s`);
+
+        const { tableCount, totalRecords } = request.columnar
+            ? writeColumnar(databases, request.columnar, progress)
+            : await streamTables(databases, batchSize, send, { id: request.id }, progress);
+        await send({ id: request.id, type: 'end', tableCount, totalRecords, parseTime });
+    } finally {
+        progress.stop();
+    }
+}
+
+async function handleRequest(request) {
+    handledRequests++;
+
+    switch (request.cmd) {
+        case 'ping':
+            await send({
+                id: request.id,
+                type: 'pong',
+                pid: process.pid,
+                uptime: (Date.now() - startedAt) / 1000,
+                requests: handledRequests
+            });
+            break;
+        case 'parse':
+            await handleParse(request);
+            break;
+        case 'shutdown':
+            await send({ id: request.id, type: 'bye' });
+            process.exit(0);
+            break;
+        default:
+            throw new Error(`Unknown command: ${request.cmd}`);
+    }
+}
+
+// Serialize requests: each one waits for the previous to finish
+let queue = Promise.resolve();
+
+readline.createInterface({ input: process.stdin }).on('line', line => {
+    if (!line.trim()) {
+        return;
+    }
+
+    queue = queue.then(async () => {
+        let request = {};
+        try {
+            request = JSON.parse(line);
+            await handleRequest(request);
+        } catch (error) {
+            console.error('❌ Request failed:', error.stack || error.message);
+            await send({ id: request.id, type: 'error', message: error.message });
+        }
+    });
+}).on('close', () => {
+    // Parent went away: finish pending work and exit
+    queue.then(() => process.exit(0));
+});
+
+send({ type: 'ready', pid: process.pid });
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the SQLite connection profiles (see src/database/models/base.py).
+
+Each profile runs in its own process against a fresh temporary database:
+a full import of synthetic players, re-imports with every player changed,
+and the `info` command (re-imports and info are medians over --repeat
+runs). Imports go through SaveImporter.import_save() with the profile as
+its connection profile; only the parser is replaced by a stream of the
+synthetic tables. Times are compared with the "safe" profile (SQLite
+defaults).
+
+Usage:
+    python scripts/benchmark_sqlite_profiles.py [--players 20000] [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+PROFILES = ("safe", "read", "import")
+
+
+def synthetic_save(players: int, overall: int) -> list:
+    """Parser stream batches (db, table, rows) shaped like the importer's projection"""
+    return [
+        (0, "dcplayernames", [{"nameid": i, "name": f"Name{i}"} for i in range(1, 500)]),
+        (
+            1,
+            "players",
+            [
+                {"playerid": i, "firstnameid": i % 500, "lastnameid": (i * 7) % 500, "nationality": i % 200}
+                for i in range(1, players + 1)
+            ],
+        ),
+        (
+            1,
+            "career_playergrowthuserseason",
+            [
+                {"playerid": i, "overall": overall + i % 20, "potential": 80, "age": 18 + i % 15}
+                for i in range(1, players + 1)
+            ],
+        ),
+    ]
+
+
+def run_profile(profile: str, players: int, repeat: int) -> dict:
+    """Worker: time import and info under one profile"""
+    sys.path.insert(0, str(ROOT))
+    from typer.testing import CliRunner
+
+    from src.cli.main import app
+    from src.core.importer import SaveImporter
+    from src.core.parser_bridge import parser_bridge
+
+    importer = SaveImporter()
+    importer.profile = profile
+
+    def timed_import(overall: int) -> float:
+        batches = synthetic_save(players, overall)
+        parser_bridge.iter_database_tables = lambda *args, **kwargs: iter(batches)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            importer.import_save("synthetic", use_cache=False)
+        return time.perf_counter() - start
+
+    results = {"import": timed_import(60)}
+    results["reimport"] = statistics.median(timed_import(61 + run % 2) for run in range(repeat))
+
+    runner = CliRunner()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = runner.invoke(app, ["info"])
+        timings.append(time.perf_counter() - start)
+        if outcome.exit_code != 0:
+            raise RuntimeError(outcome.output)
+    results["info"] = statistics.median(timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5, help="re-import/info runs per profile (median)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_profile(os.environ["FC26_DB_PROFILE"], args.players, args.repeat)))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in PROFILES:
+            env = dict(
+                os.environ,
+                FC26_DB_PROFILE=profile,
+                FC26_DATABASE_URL=f"sqlite:///{Path(tmp) / f'{profile}.db'}",
+            )
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", "--players", str(args.players), "--repeat", str(args.repeat)],
+                env=env,
+                cwd=str(ROOT),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            results[profile] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.players:,} players, re-import/info median of {args.repeat} runs")
+    print(f"{'profile':<8} {'import':>16} {'reimport':>16} {'info':>16}")
+    baseline = results["safe"]
+    for profile, timings in results.items():
+        cells = []
+        for phase in ("import", "reimport", "info"):
+            cell = f"{timings[phase] * 1000:.0f} ms"
+            if profile != "safe":
+                cell += f" ({(timings[phase] / baseline[phase] - 1) * 100:+.0f}%)"
+            cells.append(f"{cell:>16}")
+        print(f"{profile:<8} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
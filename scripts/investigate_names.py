@@ -24,25 +24,40 @@ class Colors:
 
 
 def load_parser_output(path: str = "parser/output/test_parse.json") -> List[Dict]:
-    """Carrega o JSON do parser e normaliza para lista de tabelas"""
+    """Carrega o JSON do parser e normaliza para lista de tabelas
+
+    Aceita tambem um diretorio columnar (parse_save.js --columnar): as tabelas
+    viram ColumnarTable, lidas sob demanda via memory-map em vez de dicts.
+    """
     print("Loading parser output...")
-    with open(path, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
-
-    tables = []
-    if isinstance(raw_data, list):
-        for db_index, db in enumerate(raw_data):
-            for table_name, rows in db.items():
-                tables.append(
-                    {"tablename": table_name, "rows": rows, "source_db": db_index}
-                )
-    elif isinstance(raw_data, dict):
-        for table_name, rows in raw_data.items():
-            tables.append({"tablename": table_name, "rows": rows, "source_db": 0})
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    if Path(path).is_dir():
+        from src.core.columnar import load_columnar
+
+        columnar = load_columnar(path)
+        tables = [
+            {"tablename": name, "rows": table, "source_db": table.db}
+            for name, table in columnar.items()
+        ]
+        print(f"Loaded {len(tables)} columnar tables\n")
+        return tables
+
+    from src.core.merge import TableMerger
+    from src.core.parser_bridge import open_output
+
+    # JSON bruto, compacto ou comprimido (.gz/.zst): detectado pelos magic bytes
+    with open_output(Path(path)) as f:
+        merger = TableMerger.from_output(json.load(f))
+
+    # Tabelas duplicadas entre databases continuam separadas, com source_db real
+    tables = [
+        {"tablename": table_name, "rows": rows, "source_db": db_index}
+        for db_index, table_name, rows in merger.iter_all()
+    ]
 
-    print(
-        f"Loaded {len(tables)} tables from {len(raw_data) if isinstance(raw_data, list) else 1} databases\n"
-    )
+    databases = {table["source_db"] for table in tables}
+    print(f"Loaded {len(tables)} tables from {len(databases)} databases\n")
     return tables
 
 
@@ -213,6 +228,16 @@ def step4_check_career_tables(data: List[Dict]) -> Dict:
     return findings
 
 
+def _column_ids(rows, field: str) -> set:
+    """IDs nao-nulos de uma coluna (direto do array se a tabela for columnar)"""
+    if hasattr(rows, "column"):
+        if field not in rows.columns:
+            return set()
+        values = rows.column(field)
+        return set(values[values != 0].tolist())
+    return {row.get(field) for row in rows if row.get(field)}
+
+
 def step5_analyze_overlap(data: List[Dict]) -> Dict:
     """Step 5: Análise de overlap de playerids"""
     print(f"\n{'='*60}")
@@ -225,11 +250,7 @@ def step5_analyze_overlap(data: List[Dict]) -> Dict:
         print("Players table not found")
         return {}
 
-    player_ids = {
-        row.get("playerid")
-        for row in players_table.get("rows", [])
-        if row.get("playerid")
-    }
+    player_ids = _column_ids(players_table.get("rows", []), "playerid")
     print(f"Players table has {len(player_ids)} unique playerids\n")
 
     # Buscar tabelas com playerid field
@@ -250,9 +271,7 @@ def step5_analyze_overlap(data: List[Dict]) -> Dict:
                 break
 
         if playerid_field:
-            table_player_ids = {
-                row.get(playerid_field) for row in rows if row.get(playerid_field)
-            }
+            table_player_ids = _column_ids(rows, playerid_field)
             overlap = player_ids & table_player_ids
             overlap_pct = (len(overlap) / len(player_ids)) * 100 if player_ids else 0
 
@@ -400,7 +419,8 @@ def main():
 
     try:
         # Load data
-        data = load_parser_output()
+        # Caminho opcional: JSON do parser ou diretorio columnar
+        data = load_parser_output(*sys.argv[1:2])
 
         # Execute investigation steps
         all_findings = {}
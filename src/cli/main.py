@@ -6,10 +6,12 @@ import sys
 
 import typer
 from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
 from typing import Optional
 
 from src.core.importer import importer
+from src.core.parser_bridge import parser_bridge
 
 app = typer.Typer(help="FC26 Career Analyzer - AI-powered career mode analysis")
 
@@ -30,6 +32,20 @@ def import_save(
         None,
         help="Path to FC 26 save file (optional, uses .env default if not provided)",
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-parse the save even if it is in the parse cache"
+    ),
+    columnar: bool = typer.Option(
+        False, "--columnar", help="Parse into columnar tables (no row dicts in between)"
+    ),
+    fast_load: bool = typer.Option(
+        False,
+        "--fast-load",
+        help="Full reload: load index-free staging tables, then swap them in and build indexes",
+    ),
+    label: Optional[str] = typer.Option(
+        None, "--label", help="History snapshot name, e.g. the season (defaults to the save name)"
+    ),
 ):
     """
     Import FC 26 save file into database.
@@ -39,11 +55,44 @@ def import_save(
         python -m src.cli.main import "C:\\path\\to\\save\\CmMgrC..."
     """
     try:
-        stats = importer.import_save(save_path)
+        # Live parser progress (stage, counters, rows/s) while the save is parsed
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            console=console,
+            transient=True,
+        ) as progress_bar:
+            task = progress_bar.add_task("Parsing save", total=None)
+
+            def on_progress(progress):
+                fraction = progress.fraction
+                progress_bar.update(
+                    task,
+                    description=progress.describe(),
+                    total=None if fraction is None else 1.0,
+                    completed=fraction or 0,
+                )
+
+            parser_bridge.progress_callback = on_progress
+            try:
+                stats = importer.import_save(
+                    save_path,
+                    use_cache=not no_cache,
+                    columnar=columnar,
+                    fast_load=fast_load,
+                    label=label,
+                )
+            finally:
+                parser_bridge.progress_callback = None
 
         console.print("\n[green]Import successful![/green]\n")
         console.print(
-            f"Players in database: {stats['players_imported'] + stats['players_updated']}"
+            f"Players in database: {stats['players_imported'] + stats['players_updated'] + stats['players_unchanged']}"
+        )
+        console.print(
+            f"[dim]{stats['players_imported']} new, {stats['players_updated']} changed, "
+            f"{stats['players_unchanged']} unchanged, {stats['players_removed']} removed[/dim]"
         )
 
     except Exception as e:
@@ -56,13 +105,15 @@ def info():
     """
     Show database information and statistics.
     """
-    from src.database.models import SessionLocal, Player
+    from src.database.models import SessionLocal
+    from src.database.stats import get_snapshot
 
     db = SessionLocal()
 
     try:
-        # Get stats
-        total_players = db.query(Player).count()
+        # Every aggregate comes from the snapshot stored at import
+        stats = get_snapshot(db)
+        total_players = stats.total_players
 
         if total_players == 0:
             console.print("[yellow]⚠️  No data found. Run 'import' first.[/yellow]")
@@ -83,35 +134,21 @@ def info():
         # Top players by OVR
         console.print("\n[cyan]🏆 Top 10 Players by Overall Rating:[/cyan]\n")
 
-        top_players = (
-            db.query(Player)
-            .filter(Player.overallrating.isnot(None))
-            .order_by(Player.overallrating.desc())
-            .limit(10)
-            .all()
-        )
-
-        for i, player in enumerate(top_players, 1):
+        for i, player in enumerate(stats.top_players, 1):
             console.print(f"  {i:2d}. {player.detailed_display}")
 
         # Sample of players with resolved names
         console.print("\n[cyan]✨ Players with Resolved Names:[/cyan]\n")
 
-        named_players = (
-            db.query(Player).filter(~Player.firstname.like("Unknown_%")).limit(5).all()
-        )
-
-        if named_players:
-            for player in named_players:
+        if stats.named_sample:
+            for player in stats.named_sample:
                 console.print(f"  • {player.detailed_display}")
         else:
             console.print("  [yellow]⚠️  No players with resolved names found[/yellow]")
 
         # Name resolution stats
-        total_named = (
-            db.query(Player).filter(~Player.firstname.like("Unknown_%")).count()
-        )
-        total_unknown = total_players - total_named
+        total_named = stats.named_players
+        total_unknown = stats.unknown_players
 
         console.print("\n[cyan]📋 Name Resolution Statistics:[/cyan]")
         console.print(f"  • Resolved names: [green]{total_named}[/green]")
@@ -133,6 +170,176 @@ def info():
         db.close()
 
 
+@app.command()
+def search(
+    name: str = typer.Argument(..., help="Name or name prefixes (e.g. 'cristiano ron')"),
+    limit: int = typer.Option(10, "--limit", "-l", help="Maximum players to show"),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", "-f", help="Match any of the words instead of all of them"
+    ),
+):
+    """
+    Search players by name (accents and case are ignored).
+    """
+    from src.database.models import SessionLocal
+    from src.database.search import search_players
+
+    db = SessionLocal()
+
+    try:
+        players = search_players(db, name, limit=limit, fuzzy=fuzzy)
+
+        if not players:
+            console.print(f"[yellow]⚠️  No players found for '{name}'[/yellow]")
+            return
+
+        console.print(f"\n[cyan]🔎 Players matching '{name}':[/cyan]\n")
+        for player in players:
+            console.print(f"  • {player.detailed_display} [dim](ID {player.playerid})[/dim]")
+        console.print()
+
+    finally:
+        db.close()
+
+
+@app.command()
+def history(
+    player: Optional[int] = typer.Option(
+        None, "--player", "-p", help="Show one player's evolution across snapshots"
+    ),
+):
+    """
+    List imported snapshots, or a player's evolution across them.
+    """
+    from src.database.history import list_snapshots, player_evolution
+    from src.database.models import SessionLocal
+
+    db = SessionLocal()
+
+    try:
+        if player is None:
+            snapshots = list_snapshots(db)
+            if not snapshots:
+                console.print("[yellow]⚠️  No snapshots found. Run 'import' first.[/yellow]")
+                return
+
+            console.print("\n[cyan]🗂️  Snapshots:[/cyan]\n")
+            for snapshot in snapshots:
+                console.print(
+                    f"  #{snapshot.id:<4d} {snapshot.label or '-':<24} "
+                    f"{snapshot.imported_at:%Y-%m-%d %H:%M}  "
+                    f"{snapshot.player_count} players [dim]({snapshot.changed_count} changed)[/dim]"
+                )
+            console.print()
+            return
+
+        rows = player_evolution(db, player)
+        if not rows:
+            console.print(f"[yellow]⚠️  No history for player {player}[/yellow]")
+            return
+
+        console.print(f"\n[cyan]📈 Evolution of player {player}:[/cyan]\n")
+        for row in rows:
+            where = f"  #{row.snapshot_id:<4d} {row.label or '-':<24}"
+            if row.removed:
+                console.print(f"{where} [dim]left the save[/dim]")
+            else:
+                console.print(
+                    f"{where} OVR {row.overallrating} / POT {row.potential}, "
+                    f"age {row.age}, {row.preferredposition1 or '?'}, value {row.value}"
+                )
+        console.print()
+
+    finally:
+        db.close()
+
+
+@app.command()
+def diff(
+    before: Optional[str] = typer.Argument(
+        None, help="Older save file or snapshot id (defaults to the second to last snapshot)"
+    ),
+    after: Optional[str] = typer.Argument(
+        None, help="Newer save file or snapshot id (defaults to the last snapshot)"
+    ),
+    limit: int = typer.Option(10, "--limit", "-l", help="Players shown per section"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-parse save files even if they are in the parse cache"
+    ),
+):
+    """
+    Show how players evolved between two snapshots or two save files.
+
+    Example:
+        python -m src.cli.main diff
+        python -m src.cli.main diff 3
+        python -m src.cli.main diff 3 5
+        python -m src.cli.main diff old_save new_save
+    """
+    from src.core.diff import diff_sources
+    from src.database.models import SessionLocal
+
+    db = SessionLocal()
+
+    try:
+        try:
+            report = diff_sources(db, before, after, use_cache=not no_cache)
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+
+        if report is None:
+            console.print("[yellow]⚠️  Need two snapshots to compare. Run 'import' twice.[/yellow]")
+            return
+
+        counts = report.counts
+
+        console.print(f"\n[cyan]📈 {report.before_label} → {report.after_label}[/cyan]\n")
+        console.print(
+            f"  Improved: [green]{counts['improved']}[/green]  "
+            f"Declined: [red]{counts['declined']}[/red]  "
+            f"Potential up/down: {counts['potential_up']}/{counts['potential_down']}"
+        )
+        console.print(
+            f"  Appeared: {counts['appeared']}  Disappeared: {counts['disappeared']}  "
+            f"Position changes: {counts['position_changed']}  Value changes: {counts['value_changed']}"
+        )
+
+        for title, frame, column in (
+            ("⬆️  Biggest improvements", report.improved, "overallrating"),
+            ("⬇️  Biggest declines", report.declined, "overallrating"),
+            ("🌱 Potential rises", report.potential_up, "potential"),
+            ("🥀 Potential drops", report.potential_down, "potential"),
+            ("💰 Value changes", report.value_changes, "value"),
+        ):
+            if frame.empty:
+                continue
+            console.print(f"\n[cyan]{title}:[/cyan]")
+            rows = frame.itertuples()
+            for player, row in zip(report.views(frame, limit=limit), rows):
+                old, new = getattr(row, f"{column}_before"), getattr(row, f"{column}_after")
+                console.print(f"  • {player.detailed_display}: {old} → {new}")
+
+        if not report.position_changes.empty:
+            console.print("\n[cyan]🔀 Position changes:[/cyan]")
+            frame = report.position_changes
+            for player, row in zip(report.views(frame, limit=limit), frame.itertuples()):
+                console.print(
+                    f"  • {player.display_name}: "
+                    f"{row.preferredposition1_before or '?'} → {row.preferredposition1_after or '?'}"
+                )
+
+        for title, frame in (("✨ Appeared", report.appeared), ("👋 Disappeared", report.disappeared)):
+            if frame.empty:
+                continue
+            console.print(f"\n[cyan]{title}:[/cyan]")
+            for player in report.views(frame, limit=limit):
+                console.print(f"  • {player.detailed_display}")
+        console.print()
+
+    finally:
+        db.close()
+
+
 @app.command()
 def query(
     question: Optional[str] = typer.Argument(
@@ -143,7 +350,7 @@ def query(
         "top_players",
         "--context",
         "-c",
-        help="Tipo de contexto: summary, top_players, filtered",
+        help="Tipo de contexto: summary, top_players, search, diff, filtered",
     ),
     limit: int = typer.Option(
         10, "--limit", "-l", help="Número máximo de jogadores no contexto"
@@ -241,7 +448,9 @@ def _process_query(db, question: str, context_type: str, limit: int):
         # Build context
         with console.status("[bold yellow]Preparando contexto...[/bold yellow]"):
             context_builder = ContextBuilder(db)
-            context = context_builder.build_context(context_type, limit=limit)
+            context = context_builder.build_context(
+                context_type, limit=limit, query=question
+            )
 
         # Build prompt
         prompt_builder = PromptBuilder()
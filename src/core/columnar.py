@@ -0,0 +1,188 @@
+"""
+Reader for the parser's columnar output (see parser/lib/columnar.js).
+Columns are memory-mapped NumPy arrays, so reading them copies nothing.
+"""
+
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+COLUMNAR_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Manifest column type -> on-disk dtype (little-endian)
+DTYPES = {
+    "int32": np.dtype("<i4"),
+    "float64": np.dtype("<f8"),
+    "string": np.dtype("<i4"),  # dictionary codes
+}
+
+
+def _map(path: Path, dtype: np.dtype, length: int) -> np.ndarray:
+    """Read-only memory map (empty files cannot be mapped)."""
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(length,))
+
+
+class ColumnarTable(Sequence):
+    """
+    One parsed table stored column by column.
+
+    Column access (column(), strings()) is zero-copy. The table also behaves
+    as a read-only sequence of row dicts, built lazily one row at a time, so
+    code written for the JSON row format keeps working.
+    """
+
+    def __init__(self, directory: Path, name: str, meta: Dict[str, Any]):
+        """
+        Args:
+            directory: Columnar output directory
+            name: Table name
+            meta: Table entry from manifest.json
+        """
+        self.directory = directory
+        self.name = name
+        self.db: int = meta["db"]
+        self.num_rows: int = meta["rows"]
+        self._columns: Dict[str, Dict[str, Any]] = meta["columns"]
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._masks: Dict[str, Optional[np.ndarray]] = {}
+        self._dictionaries: Dict[str, List[str]] = {}
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in parser order"""
+        return list(self._columns)
+
+    def column_type(self, column: str) -> str:
+        """Manifest type of a column: int32, float64 or string"""
+        return self._columns[column]["type"]
+
+    def column(self, column: str) -> np.ndarray:
+        """
+        Raw column array (memory-mapped).
+
+        For string columns this returns the dictionary codes (-1 = null);
+        use strings() or decoded() to get text.
+        """
+        if column not in self._arrays:
+            meta = self._columns[column]
+            self._arrays[column] = _map(
+                self.directory / meta["file"], DTYPES[meta["type"]], self.num_rows
+            )
+        return self._arrays[column]
+
+    def valid(self, column: str) -> Optional[np.ndarray]:
+        """Boolean mask of present values, or None if the column has no nulls"""
+        if column not in self._masks:
+            meta = self._columns[column]
+            mask = None
+            if "valid" in meta:
+                raw = _map(self.directory / meta["valid"], np.dtype("u1"), self.num_rows)
+                mask = raw.view(bool)
+            self._masks[column] = mask
+        return self._masks[column]
+
+    def strings(self, column: str) -> Tuple[np.ndarray, List[str]]:
+        """Dictionary-encoded string column as (codes, dictionary)"""
+        if column not in self._dictionaries:
+            path = self.directory / self._columns[column]["dictionary"]
+            with open(path, "r", encoding="utf-8") as f:
+                self._dictionaries[column] = json.load(f)
+        return self.column(column), self._dictionaries[column]
+
+    def decoded(self, column: str) -> np.ndarray:
+        """Column as an object array of Python values (None for nulls)"""
+        if self.column_type(column) == "string":
+            codes, dictionary = self.strings(column)
+            lookup = np.array(dictionary + [None], dtype=object)
+            return lookup[codes]  # code -1 picks the trailing None
+
+        values = self.column(column).astype(object)
+        mask = self.valid(column)
+        if mask is not None:
+            values[~mask] = None
+        return values
+
+    def _value(self, column: str, index: int) -> Any:
+        mask = self.valid(column)
+        if mask is not None and not mask[index]:
+            return None
+        if self.column_type(column) == "string":
+            codes, dictionary = self.strings(column)
+            code = codes[index]
+            return dictionary[code] if code >= 0 else None
+        return self.column(column)[index].item()
+
+    # Sequence of row dicts
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.num_rows))]
+        if index < 0:
+            index += self.num_rows
+        if not 0 <= index < self.num_rows:
+            raise IndexError(index)
+        row = {}
+        for column in self._columns:
+            value = self._value(column, index)
+            if value is not None:
+                row[column] = value
+        return row
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a dict (column-wise, much faster than indexing)"""
+        decoded = {column: self.decoded(column) for column in self._columns}
+        rows = []
+        for i in range(self.num_rows):
+            rows.append(
+                {
+                    column: values[i]
+                    for column, values in decoded.items()
+                    if values[i] is not None
+                }
+            )
+        return rows
+
+    def __repr__(self):
+        return f"<ColumnarTable {self.name} ({self.num_rows} rows, db {self.db})>"
+
+
+def is_columnar_dir(path: Path) -> bool:
+    """True if path holds a complete columnar output"""
+    return (Path(path) / MANIFEST_FILE).is_file()
+
+
+def load_columnar(directory: Path) -> Dict[str, ColumnarTable]:
+    """
+    Open a columnar output directory.
+
+    Args:
+        directory: Directory written by parse_save.js --columnar
+
+    Returns:
+        Mapping of table name to ColumnarTable
+
+    Raises:
+        FileNotFoundError: If the manifest is missing (incomplete output)
+        ValueError: If the format version is not supported
+    """
+    directory = Path(directory)
+    with open(directory / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != COLUMNAR_VERSION:
+        raise ValueError(
+            f"Unsupported columnar format version: {manifest.get('version')}"
+        )
+
+    return {
+        name: ColumnarTable(directory, name, meta)
+        for name, meta in manifest["tables"].items()
+    }
@@ -0,0 +1,258 @@
+"""
+Diff engine: player evolution between two saves.
+
+Either side is a history snapshot (see src/database/history.py) or a save
+file parsed on the fly (a save in the parse cache is read back without
+running the parser), so two saves can be compared without importing
+either; diff_sources() takes any mix of the two. Both sides become one
+frame per side keyed by playerid; a single outer hash join (pandas merge)
+then classifies every player at once.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.core.importer import SaveImporter, normalize_frame
+from src.database.history import latest_snapshot_ids, state_at
+from src.database.models import PlayerHistory, Snapshot
+from src.database.models.snapshot import HISTORY_COLUMNS
+from src.database.queries import LIST_COLUMNS, PlayerView
+
+DIFF_COLUMNS = ["playerid", *HISTORY_COLUMNS]
+
+# Columns whose changes the report follows
+RATING_COLUMNS = ("overallrating", "potential", "value")
+TRACKED_COLUMNS = (*RATING_COLUMNS, "preferredposition1")
+
+
+def _differs(before: pd.Series, after: pd.Series) -> np.ndarray:
+    """Element-wise inequality where two nulls are equal"""
+    equal = before.eq(after).fillna(False) | (before.isna() & after.isna())
+    return ~equal.to_numpy(dtype=bool)
+
+
+class SaveDiff:
+    """
+    Differences between two sides (before, after) of a comparison.
+
+    appeared/disappeared hold the player columns of the side the player is
+    on; changed holds every player present on both sides whose tracked
+    columns differ, with <column>_before/<column>_after pairs and
+    <column>_delta for the rating columns.
+    """
+
+    def __init__(
+        self,
+        before_label: str,
+        after_label: str,
+        appeared: pd.DataFrame,
+        disappeared: pd.DataFrame,
+        changed: pd.DataFrame,
+    ):
+        self.before_label = before_label
+        self.after_label = after_label
+        self.appeared = appeared
+        self.disappeared = disappeared
+        self.changed = changed
+
+    def _mask(self, column: str, up: bool) -> np.ndarray:
+        delta = self.changed[f"{column}_delta"]
+        return ((delta > 0) if up else (delta < 0)).fillna(False).to_numpy(dtype=bool)
+
+    def _moved(self, column: str, up: bool) -> pd.DataFrame:
+        moved = self.changed[self._mask(column, up)]
+        return moved.sort_values(f"{column}_delta", ascending=not up, kind="stable")
+
+    def _position_mask(self) -> np.ndarray:
+        return _differs(self.changed["preferredposition1_before"], self.changed["preferredposition1_after"])
+
+    @property
+    def improved(self) -> pd.DataFrame:
+        """Players whose overall went up, biggest rise first"""
+        return self._moved("overallrating", up=True)
+
+    @property
+    def declined(self) -> pd.DataFrame:
+        """Players whose overall went down, biggest drop first"""
+        return self._moved("overallrating", up=False)
+
+    @property
+    def potential_up(self) -> pd.DataFrame:
+        return self._moved("potential", up=True)
+
+    @property
+    def potential_down(self) -> pd.DataFrame:
+        return self._moved("potential", up=False)
+
+    @property
+    def value_changes(self) -> pd.DataFrame:
+        """Players whose value changed, largest change first"""
+        changed = self.changed[self._mask("value", up=True) | self._mask("value", up=False)]
+        order = changed["value_delta"].abs().sort_values(ascending=False, kind="stable").index
+        return changed.loc[order]
+
+    @property
+    def position_changes(self) -> pd.DataFrame:
+        return self.changed[self._position_mask()]
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Players per report section (masks only, nothing is sorted)"""
+        return {
+            "appeared": len(self.appeared),
+            "disappeared": len(self.disappeared),
+            "improved": int(self._mask("overallrating", up=True).sum()),
+            "declined": int(self._mask("overallrating", up=False).sum()),
+            "potential_up": int(self._mask("potential", up=True).sum()),
+            "potential_down": int(self._mask("potential", up=False).sum()),
+            "position_changed": int(self._position_mask().sum()),
+            "value_changed": int((self._mask("value", up=True) | self._mask("value", up=False)).sum()),
+        }
+
+    @staticmethod
+    def views(frame: pd.DataFrame, side: str = "after", limit: Optional[int] = None) -> List[PlayerView]:
+        """
+        PlayerViews of the first rows of a report frame.
+
+        Args:
+            frame: appeared/disappeared or one of the changed listings
+            side: Which values to show for changed players ("before" or "after")
+            limit: Max players
+        """
+        if limit is not None:
+            frame = frame.head(limit)
+        names = [column.key for column in LIST_COLUMNS]
+        if "overallrating" not in frame.columns:
+            names = [name if name == "playerid" else f"{name}_{side}" for name in names]
+        rows = frame[names].astype(object).where(frame[names].notna(), None)
+        return [PlayerView(*row) for row in rows.itertuples(index=False, name=None)]
+
+    def __repr__(self):
+        return f"<SaveDiff {self.before_label} -> {self.after_label} {self.counts}>"
+
+
+def diff_frames(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    before_label: str = "before",
+    after_label: str = "after",
+) -> SaveDiff:
+    """
+    Compare two player frames (playerid plus HISTORY_COLUMNS).
+
+    Args:
+        before: Players of the older side
+        after: Players of the newer side
+        before_label: Name of the older side in reports
+        after_label: Name of the newer side in reports
+
+    Returns:
+        SaveDiff of the two sides
+    """
+    # Same dtypes whether a side was read from history or parsed
+    table = PlayerHistory.__table__
+    before = normalize_frame(before[DIFF_COLUMNS], table)
+    after = normalize_frame(after[DIFF_COLUMNS], table)
+
+    merged = before.merge(
+        after, on="playerid", how="outer", suffixes=("_before", "_after"), indicator=True
+    )
+    side = merged.pop("_merge")
+
+    def side_only(indicator: str, suffix: str) -> pd.DataFrame:
+        rows = merged[side.eq(indicator).to_numpy()]
+        columns = {f"{name}_{suffix}": name for name in HISTORY_COLUMNS}
+        return rows[["playerid", *columns]].rename(columns=columns).reset_index(drop=True)
+
+    common = merged[side.eq("both").to_numpy()]
+    changed = np.zeros(len(common), dtype=bool)
+    for column in TRACKED_COLUMNS:
+        changed |= _differs(common[f"{column}_before"], common[f"{column}_after"])
+    common = common[changed].reset_index(drop=True)
+    for column in RATING_COLUMNS:
+        common[f"{column}_delta"] = common[f"{column}_after"] - common[f"{column}_before"]
+
+    return SaveDiff(
+        before_label,
+        after_label,
+        appeared=side_only("right_only", "after"),
+        disappeared=side_only("left_only", "before"),
+        changed=common,
+    )
+
+
+def snapshot_frame(db: Session, snapshot_id: int) -> pd.DataFrame:
+    """Players as of a history snapshot, as a diff frame"""
+    rows = state_at(db, snapshot_id)
+    return pd.DataFrame(rows, columns=[*DIFF_COLUMNS, "row_hash"])[DIFF_COLUMNS]
+
+
+def save_frame(save_path: str, use_cache: bool = True) -> pd.DataFrame:
+    """Players of a save file, parsed (or read from the parse cache), as a diff frame"""
+    return SaveImporter().load_players(save_path, use_cache=use_cache)[DIFF_COLUMNS]
+
+
+# A diff side: snapshot id (int or digit string) or save file path
+Source = Union[int, str]
+
+
+def source_frame(db: Session, source: Source, use_cache: bool = True) -> Tuple[pd.DataFrame, str]:
+    """
+    Diff frame and report label of one side.
+
+    An existing file is a save (parsed or read from the parse cache);
+    otherwise an int or digit string is a snapshot id.
+
+    Raises:
+        ValueError: If the source is neither, or the snapshot does not exist
+    """
+    if isinstance(source, str) and Path(source).exists():
+        return save_frame(source, use_cache), source
+    if isinstance(source, int) or source.isdigit():
+        snapshot = db.get(Snapshot, int(source))
+        if snapshot is None:
+            raise ValueError(f"No snapshot #{source}")
+        return snapshot_frame(db, snapshot.id), snapshot.label or f"#{snapshot.id}"
+    raise ValueError(f"'{source}' is neither a save file nor a snapshot id")
+
+
+def diff_sources(
+    db: Session,
+    before: Optional[Source] = None,
+    after: Optional[Source] = None,
+    use_cache: bool = True,
+) -> Optional[SaveDiff]:
+    """
+    Compare two sides, each a snapshot or a save file.
+
+    Without after, before is compared with the latest snapshot; without
+    either, the last two snapshots are compared.
+
+    Args:
+        db: Database session (snapshot sides)
+        before: Older side
+        after: Newer side
+        use_cache: Serve save sides from the parse cache
+
+    Returns:
+        SaveDiff, or None if the defaults need snapshots that do not exist
+
+    Raises:
+        ValueError: If a side is neither a save nor an existing snapshot
+    """
+    if after is None:
+        needed = 2 if before is None else 1
+        latest = latest_snapshot_ids(db, needed)
+        if len(latest) < needed:
+            return None
+        if before is None:
+            before = latest[0]
+        after = latest[-1]
+
+    before_frame, before_label = source_frame(db, before, use_cache)
+    after_frame, after_label = source_frame(db, after, use_cache)
+    return diff_frames(before_frame, after_frame, before_label, after_label)
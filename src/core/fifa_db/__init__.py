@@ -0,0 +1,8 @@
+"""
+Native (pure Python + NumPy) reader for the FIFA database format.
+"""
+
+from .meta import DatabaseMeta, FieldMeta, TableMeta, load_meta
+from .reader import SaveReader, TableReader
+
+__all__ = ["DatabaseMeta", "FieldMeta", "TableMeta", "load_meta", "SaveReader", "TableReader"]
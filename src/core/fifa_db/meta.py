@@ -0,0 +1,223 @@
+"""
+Schema of the FIFA database, read from parser/xml/<version>/fifa_ng_db-meta.xml.
+The parsed schema is compiled once per XML file into data/schema_cache.
+"""
+
+import hashlib
+import os
+import pickle
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+ROOT_DIR = Path(__file__).parent.parent.parent.parent
+XML_DIR = ROOT_DIR / "parser" / "xml"
+META_FILE = "fifa_ng_db-meta.xml"
+SCHEMA_CACHE_DIR = ROOT_DIR / "data" / "schema_cache"
+
+# Bump when the compiled layout changes so stale schemas are never read
+SCHEMA_FORMAT_VERSION = 1
+
+# Meta XML field types
+INTEGER = "DBOFIELDTYPE_INTEGER"
+REAL = "DBOFIELDTYPE_REAL"
+STRING = "DBOFIELDTYPE_STRING"
+DATE = "DBOFIELDTYPE_DATE"
+
+# Decoding kinds, precomputed per field
+KIND_INTEGER = 0
+KIND_REAL = 1
+KIND_STRING = 2
+KINDS = {INTEGER: KIND_INTEGER, DATE: KIND_INTEGER, REAL: KIND_REAL, STRING: KIND_STRING}
+TYPES = [INTEGER, REAL, STRING, DATE]
+
+
+class FieldMeta:
+    """
+    One column: stored as `depth` bits, integers offset by rangelow.
+
+    `kind` and `mask` are precomputed so decoding never looks at the type
+    strings again.
+    """
+
+    __slots__ = ("name", "shortname", "type", "depth", "rangelow", "rangehigh", "kind", "mask")
+
+    def __init__(
+        self,
+        name: str,
+        shortname: str,
+        type: str,
+        depth: int,
+        rangelow: int = 0,
+        rangehigh: int = 0,
+    ):
+        self.name = name
+        self.shortname = shortname
+        self.type = type
+        self.depth = depth
+        self.rangelow = rangelow
+        self.rangehigh = rangehigh
+        self.kind = KINDS.get(type, KIND_INTEGER)
+        self.mask = (1 << depth) - 1
+
+    @property
+    def is_integer(self) -> bool:
+        """Integers and dates are both bit-packed offsets from rangelow"""
+        return self.kind == KIND_INTEGER
+
+    def __repr__(self):
+        return f"<FieldMeta {self.name} ({self.type}, {self.depth} bits)>"
+
+
+class TableMeta:
+    """One table and its fields, by name and by shortname"""
+
+    def __init__(self, name: str, shortname: str, fields: Dict[str, FieldMeta]):
+        self.name = name
+        self.shortname = shortname
+        self.fields = fields
+        self.by_shortname = {field.shortname: field for field in fields.values()}
+
+    def __repr__(self):
+        return f"<TableMeta {self.name} ({len(self.fields)} fields)>"
+
+
+class DatabaseMeta:
+    """All tables of one game version's database"""
+
+    def __init__(self, version: int, tables: Dict[str, TableMeta]):
+        self.version = version
+        self.tables = tables
+        self.by_shortname = {table.shortname: table for table in tables.values()}
+
+    def table_for_shortname(self, shortname: str) -> Optional[TableMeta]:
+        """Table for a shortname as stored in the file (either byte order)"""
+        return self.by_shortname.get(shortname) or self.by_shortname.get(shortname[::-1])
+
+    def __repr__(self):
+        return f"<DatabaseMeta v{self.version} ({len(self.tables)} tables)>"
+
+
+def meta_path(version: int) -> Path:
+    """Path of the meta XML for a game version (17-21)"""
+    return XML_DIR / str(version) / META_FILE
+
+
+def parse_meta(path: Path, version: int = 0) -> DatabaseMeta:
+    """
+    Parse a fifa_ng_db-meta.xml file.
+
+    Args:
+        path: Meta XML file
+        version: Game version the file belongs to
+
+    Returns:
+        DatabaseMeta with every table and field
+    """
+    root = ET.parse(path).getroot()
+
+    tables = {}
+    for table_el in root.iter("table"):
+        fields = {}
+        for field_el in table_el.iter("field"):
+            field = FieldMeta(
+                name=field_el.get("name"),
+                shortname=field_el.get("shortname"),
+                type=field_el.get("type"),
+                depth=int(field_el.get("depth", 0)),
+                rangelow=int(field_el.get("rangelow", 0)),
+                rangehigh=int(field_el.get("rangehigh", 0)),
+            )
+            fields[field.name] = field
+        name = table_el.get("name")
+        tables[name] = TableMeta(name, table_el.get("shortname"), fields)
+
+    return DatabaseMeta(version, tables)
+
+
+def compile_meta(meta: DatabaseMeta) -> bytes:
+    """Compact binary form of a schema: nested tuples, type strings as indexes"""
+    tables = [
+        (
+            table.name,
+            table.shortname,
+            [
+                (f.name, f.shortname, TYPES.index(f.type) if f.type in TYPES else -1,
+                 f.depth, f.rangelow, f.rangehigh)
+                for f in table.fields.values()
+            ],
+        )
+        for table in meta.tables.values()
+    ]
+    return pickle.dumps((SCHEMA_FORMAT_VERSION, meta.version, tables), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_compiled(data: bytes) -> DatabaseMeta:
+    """
+    Rebuild a schema from compile_meta() output.
+
+    Raises:
+        ValueError: If the data was compiled by another format version
+    """
+    format_version, version, tables = pickle.loads(data)
+    if format_version != SCHEMA_FORMAT_VERSION:
+        raise ValueError(f"Unsupported schema format version: {format_version}")
+
+    return DatabaseMeta(
+        version,
+        {
+            name: TableMeta(
+                name,
+                shortname,
+                {
+                    field[0]: FieldMeta(
+                        field[0], field[1], TYPES[field[2]] if field[2] >= 0 else "",
+                        field[3], field[4], field[5],
+                    )
+                    for field in fields
+                },
+            )
+            for name, shortname, fields in tables
+        },
+    )
+
+
+def _schema_cache_path(version: int, xml_path: Path, cache_dir: Path) -> Path:
+    """Compiled schema path, keyed by the XML content hash"""
+    digest = hashlib.blake2b(xml_path.read_bytes(), digest_size=12).hexdigest()
+    return cache_dir / f"fifa{version}-v{SCHEMA_FORMAT_VERSION}-{digest}.schema"
+
+
+@lru_cache(maxsize=None)
+def load_meta(version: int, cache_dir: Path = SCHEMA_CACHE_DIR) -> DatabaseMeta:
+    """
+    Schema for a game version, loaded once per process.
+
+    The compiled schema cache is used when it matches the XML's hash;
+    otherwise the XML is parsed and the compiled form written for next time.
+
+    Raises:
+        FileNotFoundError: If no meta XML exists for the version
+    """
+    path = meta_path(version)
+    if not path.exists():
+        raise FileNotFoundError(f"No database meta for version {version}: {path}")
+
+    cache_path = _schema_cache_path(version, path, cache_dir)
+    try:
+        return load_compiled(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Discarding unreadable schema cache {cache_path.name}: {e}")
+
+    meta = parse_meta(path, version)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".tmp-{os.getpid()}")
+        tmp_path.write_bytes(compile_meta(meta))
+        os.replace(tmp_path, cache_path)  # Atomic: readers never see partial files
+    except OSError as e:
+        print(f"Could not write schema cache {cache_path.name}: {e}")
+    return meta
@@ -0,0 +1,395 @@
+"""
+Native reader for the FIFA database format (t3db) embedded in career saves.
+The save is memory-mapped and columns are decoded with NumPy, table by table.
+"""
+
+import hashlib
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.fifa_db.meta import (
+    KIND_REAL,
+    KIND_STRING,
+    DatabaseMeta,
+    FieldMeta,
+    TableMeta,
+    load_meta,
+)
+
+DB_SIGNATURE = b"DB\x00\x08"
+
+# signature (8), segment length, 0, table count, crc
+DB_HEADER = struct.Struct("<8sIIII")
+# shortname, offset from the end of the table list
+TABLE_ENTRY = struct.Struct("<4sI")
+# unknown, record size, bits per record, compressed strings length,
+# records, valid records, unknown, field count, padding, crc
+TABLE_HEADER = struct.Struct("<IIIIHHIB7xI")
+# type, bit offset, shortname, depth (bits)
+FIELD_DESCRIPTOR = struct.Struct("<II4sI")
+CRC = struct.Struct("<I")
+
+# Field type codes stored in the file, used when a field is missing from the meta
+FILE_STRING = 0
+FILE_REAL = 4
+
+
+def _decode_bits(records: np.ndarray, field: "FieldLayout") -> np.ndarray:
+    """
+    Unsigned values of a bit-packed field in every record.
+
+    Records are little-endian bit streams: the field's bytes are assembled
+    into one uint64 per record, then shifted and masked (byte range, shift
+    and mask are precomputed in FieldLayout).
+    """
+    chunk = records[:, field.start:field.start + field.n_bytes].astype(np.uint64)
+
+    values = np.zeros(len(records), dtype=np.uint64)
+    for k in range(field.n_bytes):
+        values |= chunk[:, k] << np.uint64(8 * k)
+    return (values >> np.uint64(field.shift)) & np.uint64(field.mask)
+
+
+def _decode_strings(records: np.ndarray, bit_offset: int, depth: int) -> np.ndarray:
+    """Fixed-width, NUL-terminated strings as an object array of str"""
+    start = bit_offset // 8
+    width = depth // 8
+    raw = np.ascontiguousarray(records[:, start:start + width]).view(f"S{width}").ravel()
+    return np.array(
+        [value.split(b"\x00", 1)[0].decode("utf-8", errors="replace") for value in raw],
+        dtype=object,
+    )
+
+
+def _decode_reals(records: np.ndarray, bit_offset: int) -> np.ndarray:
+    start = bit_offset // 8
+    # astype copies, so the result never points into the mapped file
+    return np.ascontiguousarray(records[:, start:start + 4]).view("<f4").ravel().astype(np.float32)
+
+
+class FieldLayout:
+    """
+    Where a field sits in a record, as stored in the table's descriptors,
+    with its decoding plan (byte range, shift, mask, kind) precomputed.
+    """
+
+    __slots__ = (
+        "shortname", "type_code", "bit_offset", "depth", "meta",
+        "start", "shift", "n_bytes", "mask", "kind",
+    )
+
+    def __init__(self, shortname: str, type_code: int, bit_offset: int, depth: int, meta: Optional[FieldMeta]):
+        self.shortname = shortname
+        self.type_code = type_code
+        self.bit_offset = bit_offset
+        self.depth = depth
+        self.meta = meta
+        self.start, self.shift = divmod(bit_offset, 8)
+        self.n_bytes = (self.shift + depth + 7) // 8
+        self.mask = (1 << depth) - 1
+        if meta is not None:
+            self.kind = meta.kind
+        else:
+            self.kind = {FILE_STRING: KIND_STRING, FILE_REAL: KIND_REAL}.get(type_code)
+
+    @property
+    def name(self) -> str:
+        return self.meta.name if self.meta is not None else self.shortname
+
+
+class TableReader:
+    """
+    One table of a database segment.
+
+    Only the table header and field descriptors are read up front; column()
+    decodes a single column straight from the mapped record bytes. Tables
+    whose header announces compressed strings cannot be decoded: their
+    string fields point into a compressed block this reader does not
+    implement, so column() refuses them instead of returning garbage.
+    """
+
+    def __init__(self, data: memoryview, offset: int, shortname: str, meta: Optional[TableMeta]):
+        """
+        Args:
+            data: Segment bytes
+            offset: Table header offset within the segment
+            shortname: Table shortname from the table list
+            meta: Table schema (None if the table is not in the meta XML)
+        """
+        self.shortname = shortname
+        self.meta = meta
+        self.name = meta.name if meta is not None else shortname
+
+        (
+            _,
+            self.record_size,
+            _,
+            self.compressed_strings_length,
+            self.num_records,
+            self.num_rows,
+            _,
+            num_fields,
+            _,
+        ) = TABLE_HEADER.unpack_from(data, offset)
+
+        self.fields: Dict[str, FieldLayout] = {}
+        position = offset + TABLE_HEADER.size
+        for _ in range(num_fields):
+            type_code, bit_offset, raw_shortname, depth = FIELD_DESCRIPTOR.unpack_from(data, position)
+            position += FIELD_DESCRIPTOR.size
+            field_shortname = raw_shortname.decode("latin-1")
+            field_meta = None
+            if meta is not None:
+                field_meta = meta.by_shortname.get(field_shortname) or meta.by_shortname.get(
+                    field_shortname[::-1]
+                )
+            layout = FieldLayout(field_shortname, type_code, bit_offset, depth, field_meta)
+            self.fields[layout.name] = layout
+
+        records_offset = position + CRC.size
+        self._records = np.frombuffer(
+            data,
+            dtype=np.uint8,
+            count=self.num_rows * self.record_size,
+            offset=records_offset,
+        ).reshape(self.num_rows, self.record_size)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in record layout order"""
+        return list(self.fields)
+
+    @property
+    def has_compressed_strings(self) -> bool:
+        """True if the table stores compressed strings (not decodable natively)"""
+        return self.compressed_strings_length > 0
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Decode one column.
+
+        Returns:
+            int64 array for integers/dates (rangelow applied), float32 for
+            reals, object array of str for strings
+
+        Raises:
+            ValueError: If the table stores compressed strings
+        """
+        if self.has_compressed_strings:
+            raise ValueError(
+                f"Table {self.name} stores compressed strings, which the native reader cannot decode"
+            )
+        field = self.fields[name]
+
+        if field.kind == KIND_STRING:
+            return _decode_strings(self._records, field.bit_offset, field.depth)
+        if field.kind == KIND_REAL:
+            return _decode_reals(self._records, field.bit_offset)
+
+        values = _decode_bits(self._records, field).astype(np.int64)
+        if field.meta is not None and field.meta.rangelow:
+            values += field.meta.rangelow
+        return values
+
+    def read(self, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Decode the given columns (all by default) into typed arrays"""
+        names = self.columns if columns is None else [c for c in columns if c in self.fields]
+        return {name: self.column(name) for name in names}
+
+    def to_rows(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Rows as dicts, the same shape the Node.js parser produces"""
+        arrays = self.read(columns)
+        if not arrays:
+            return [{} for _ in range(self.num_rows)]
+
+        names = list(arrays)
+        values = [array.tolist() for array in arrays.values()]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self):
+        return f"<TableReader {self.name} ({self.num_rows} rows)>"
+
+
+class DatabaseSegment:
+    """One database embedded in the save: header and lazily opened tables"""
+
+    def __init__(self, data: memoryview, meta: DatabaseMeta):
+        """
+        Args:
+            data: Segment bytes, starting at its DB signature
+            meta: Schema used to name tables and fields
+        """
+        self.data = data
+        self.meta = meta
+
+        _, _, _, num_tables, _ = DB_HEADER.unpack_from(data, 0)
+        position = DB_HEADER.size
+        entries = []
+        for _ in range(num_tables):
+            raw_shortname, offset = TABLE_ENTRY.unpack_from(data, position)
+            entries.append((raw_shortname.decode("latin-1"), offset))
+            position += TABLE_ENTRY.size
+        tables_start = position + CRC.size
+
+        # name -> (shortname, absolute offset); tables are opened on first use
+        self._entries: Dict[str, Tuple[str, int]] = {}
+        for shortname, offset in entries:
+            table_meta = meta.table_for_shortname(shortname)
+            name = table_meta.name if table_meta is not None else shortname
+            self._entries[name] = (shortname, tables_start + offset)
+        self._tables: Dict[str, TableReader] = {}
+
+        # A table's bytes run up to the next table (or the segment end)
+        starts = sorted(offset for _, offset in self._entries.values())
+        ends = dict(zip(starts, starts[1:] + [len(data)]))
+        self._spans = {
+            name: (offset, ends[offset]) for name, (_, offset) in self._entries.items()
+        }
+
+    @property
+    def table_names(self) -> List[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def shortname(self, name: str) -> str:
+        """Table shortname as stored in the file"""
+        return self._entries[name][0]
+
+    def fingerprint(self, name: str) -> str:
+        """
+        Checksum of a table's raw bytes (header, descriptors and records).
+
+        Equal fingerprints mean the table decodes to the same rows, so it
+        identifies unchanged tables across saves of the same career.
+        """
+        start, end = self._spans[name]
+        return hashlib.blake2b(self.data[start:end], digest_size=16).hexdigest()
+
+    def table(self, name: str) -> TableReader:
+        """Open a table by name (header and descriptors only)"""
+        if name not in self._tables:
+            shortname, offset = self._entries[name]
+            self._tables[name] = TableReader(
+                self.data, offset, shortname, self.meta.table_for_shortname(shortname)
+            )
+        return self._tables[name]
+
+
+class SaveReader:
+    """
+    Memory-mapped career save, read without the Node.js parser.
+
+    The file is mapped read-only; a table's bytes are only touched when one
+    of its columns is decoded, so single tables can be pulled cheaply.
+    """
+
+    def __init__(self, path: str, version: int = 21):
+        """
+        Args:
+            path: Career save file
+            version: Game version whose meta XML describes the save (17-21)
+        """
+        self.path = Path(path)
+        self.meta = load_meta(version)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.databases = [
+            DatabaseSegment(self._view[start:end], self.meta)
+            for start, end in self._find_segments()
+        ]
+
+    def _find_segments(self) -> List[Tuple[int, int]]:
+        offsets = []
+        position = self._map.find(DB_SIGNATURE)
+        while position != -1:
+            offsets.append(position)
+            position = self._map.find(DB_SIGNATURE, position + len(DB_SIGNATURE))
+        ends = offsets[1:] + [len(self._map)]
+        return list(zip(offsets, ends))
+
+    def table(self, name: str, db: Optional[int] = None) -> TableReader:
+        """
+        Open a table by name.
+
+        Args:
+            name: Table name
+            db: Database index (defaults to the last database holding the
+                table, like the merged parser output)
+
+        Raises:
+            KeyError: If no database holds the table
+        """
+        if db is not None:
+            return self.databases[db].table(name)
+        for segment in reversed(self.databases):
+            if name in segment:
+                return segment.table(name)
+        raise KeyError(f"Table not found in save: {name}")
+
+    def iter_segments(
+        self, projection: Optional[Dict[str, Optional[List[str]]]] = None
+    ) -> Iterator[Tuple[int, str, DatabaseSegment, Optional[List[str]]]]:
+        """
+        Projected tables without decoding them, database by database.
+
+        Yields:
+            (db_index, table_name, segment, columns) where columns is None
+            for every column
+        """
+        for db_index, segment in enumerate(self.databases):
+            for name in segment.table_names:
+                if projection is not None and name not in projection:
+                    continue
+                columns = projection.get(name) if projection is not None else None
+                yield db_index, name, segment, columns
+
+    def compressed_tables(
+        self, projection: Optional[Dict[str, Optional[List[str]]]] = None
+    ) -> List[str]:
+        """Projected tables the native reader cannot decode (compressed strings)"""
+        return [
+            name
+            for _, name, segment, _ in self.iter_segments(projection)
+            if segment.table(name).has_compressed_strings
+        ]
+
+    def iter_tables(
+        self, projection: Optional[Dict[str, Optional[List[str]]]] = None
+    ) -> Iterator[Tuple[int, str, List[Dict[str, Any]]]]:
+        """
+        Decode tables as rows, database by database.
+
+        Args:
+            projection: Tables/columns to decode (everything if not provided)
+
+        Yields:
+            (db_index, table_name, rows)
+        """
+        for db_index, name, segment, columns in self.iter_segments(projection):
+            yield db_index, name, segment.table(name).to_rows(columns)
+
+    def close(self):
+        """Release the mapping (decoded arrays are copies and stay valid)"""
+        self.databases = []
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass  # Table readers still referenced elsewhere: freed with them
+        self._file.close()
+
+    def __enter__(self) -> "SaveReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,12 +3,144 @@ Import pipeline for FC 26 save data.
 Processes parser output and inserts into SQLite.
 """
 
-from typing import Dict, Any, Optional, List
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Boolean, Integer, MetaData, String, Table as SQLTable, bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.sqlite import insert
 
-from src.database.models import Player, PlayerInfo, Base, engine, SessionLocal
+from src.database.history import latest_snapshot_id, select_state
+from src.database.models import (
+    Player,
+    PlayerHistory,
+    PlayerInfo,
+    SessionLocal,
+    Snapshot,
+    SquadStats,
+    ensure_schema,
+    profile_engine,
+)
+from src.database.models.snapshot import HISTORY_COLUMNS
+from src.database.search import sync_search_index
+from src.database.stats import SNAPSHOT_ID, refresh_snapshot
+from src.core.columnar import ColumnarTable
+from src.core.merge import TableMerger
 from src.core.parser_bridge import parser_bridge
+from src.core.projection import IMPORT_PROJECTION
+
+# Tables consumed by the importer (see parser/projection.json for columns)
+PLAYER_TABLES = ("players", "career_playergrowthuserseason")
+NAME_TABLES = ("dcplayernames", "editedplayernames")
+
+NAME_COLUMNS = ("firstname", "surname", "commonname")
+
+# UPDATE ... FROM (used by fast load) needs SQLite 3.33+
+UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+# (column, lowest, highest) allowed by the Player check constraints
+PLAYER_CLAMPS = (("overallrating", 40, 99), ("potential", 40, 99), ("age", 16, 50))
+
+# A parsed table: row dicts (JSON/stream), a ColumnarTable, or {column: array}
+# as returned by ParserBridge.read_table()
+Table = Union[List[Dict[str, Any]], ColumnarTable, Dict[str, np.ndarray]]
+
+
+def table_frame(table: Table, columns: List[str]) -> pd.DataFrame:
+    """
+    Load a parsed table into a DataFrame with exactly the given columns.
+
+    Columns missing from the table are filled with nulls. Columnar tables
+    are read column by column without building row dicts; integer columns
+    with nulls become nullable Int64.
+    """
+    if isinstance(table, ColumnarTable):
+        data = {}
+        for column in columns:
+            if column not in table.columns:
+                continue
+            if table.column_type(column) == "string":
+                data[column] = table.decoded(column)
+                continue
+            values = np.asarray(table.column(column))
+            mask = table.valid(column)
+            if mask is not None and values.dtype.kind == "i":
+                values = pd.arrays.IntegerArray(values.astype(np.int64), ~np.asarray(mask))
+            elif mask is not None:
+                values = np.where(mask, values, np.nan)
+            data[column] = values
+        frame = pd.DataFrame(data)
+    elif isinstance(table, dict):
+        frame = pd.DataFrame({c: table[c] for c in columns if c in table})
+    else:
+        # Only the wanted columns: cheaper than building every key of every row
+        frame = pd.DataFrame({c: [row.get(c) for row in table] for c in columns})
+
+    return frame.reindex(columns=columns)
+
+
+def table_length(table: Table) -> int:
+    """Number of rows of a parsed table in any of its forms"""
+    if isinstance(table, dict):
+        return len(next(iter(table.values()), []))
+    return len(table)
+
+
+def normalize_frame(frame: pd.DataFrame, table: Optional[SQLTable] = None) -> pd.DataFrame:
+    """
+    Give every column one dtype whatever the input form (row dicts, arrays
+    or columnar), so values and hashes match between parse paths.
+
+    With a table, each column takes the dtype of its table column: nullable
+    Int64 for Integer, object str/None for String, nullable boolean for
+    Boolean. An all-null column thus hashes the same whether it arrived as
+    None objects (row path) or NA integers (columnar path). Columns the
+    table does not type this way keep the rule below.
+
+    Without a table, integer columns and float columns holding only whole
+    numbers (integers widened by a join) become Int64.
+    """
+    columns = {}
+    for name, series in frame.items():
+        column_type = table.c[name].type if table is not None and name in table.c else None
+        if isinstance(column_type, Integer):
+            series = series.astype("Int64")
+        elif isinstance(column_type, String):
+            series = series.astype(object).where(series.notna(), None)
+        elif isinstance(column_type, Boolean):
+            if series.dtype != bool:
+                series = series.astype("boolean")
+        elif series.dtype.kind in "iu" or (
+            series.dtype.kind == "f" and (series.dropna() % 1 == 0).all()
+        ):
+            series = series.astype("Int64")
+        columns[name] = series
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def row_hashes(frame: pd.DataFrame, table: Optional[SQLTable] = None) -> np.ndarray:
+    """Content hash of every row (int64, storable in an SQLite INTEGER)"""
+    hashes = pd.util.hash_pandas_object(normalize_frame(frame, table), index=False)
+    return hashes.to_numpy().view(np.int64)
+
+
+def frame_columns(frame: pd.DataFrame, table: Optional[SQLTable] = None) -> Dict[str, List[Any]]:
+    """
+    Columns of a frame as lists of plain Python values, ready for the driver.
+
+    Nulls become None and integer columns give int (see normalize_frame()).
+    """
+    columns = {}
+    for name, series in normalize_frame(frame, table).items():
+        if series.hasnans:
+            series = series.astype(object).where(series.notna(), None)
+        columns[name] = series.tolist()
+    return columns
 
 
 class NameResolver:
@@ -20,43 +152,52 @@ class NameResolver:
     2. dcplayernames: Generic name ID lookup (fallback)
     """
 
-    def __init__(self, parsed_data: Dict[str, Any]):
+    def __init__(self, parsed_data: Optional[Dict[str, Any]] = None):
         """
         Initialize name resolver with parser data
 
         Args:
-            parsed_data: Parsed data dictionary (merged)
+            parsed_data: Parsed data dictionary (merged). When omitted, the
+                lookup tables are filled incrementally through add_rows().
         """
         self.dcplayernames: Dict[int, str] = {}
         self.editedplayernames: Dict[int, Dict[str, str]] = {}
 
+        if parsed_data is None:
+            return
+
         print("   Building name lookup tables...")
-        self._build_dcplayernames(parsed_data)
-        self._build_editedplayernames(parsed_data)
+        self._build_dcplayernames(parsed_data.get("dcplayernames", []))
+        self._build_editedplayernames(parsed_data.get("editedplayernames", []))
+        self.report()
+
+    def report(self):
+        """Print lookup table sizes"""
+        if not self.dcplayernames:
+            print("   Warning: dcplayernames table not found")
+        if not self.editedplayernames:
+            print("   Warning: editedplayernames table not found")
 
         print(f"   Loaded {len(self.dcplayernames)} generic names")
         print(f"   Loaded {len(self.editedplayernames)} edited player names")
 
-    def _build_dcplayernames(self, parser_data: Dict[str, Any]):
-        """Build dcplayernames lookup dict"""
-        rows = parser_data.get("dcplayernames", [])
-        if not rows:
-            print("   Warning: dcplayernames table not found")
-            return
+    def add_rows(self, table_name: str, rows: List[Dict[str, Any]]):
+        """Feed a (possibly partial) batch of a name table into the lookups"""
+        if table_name == "dcplayernames":
+            self._build_dcplayernames(rows)
+        elif table_name == "editedplayernames":
+            self._build_editedplayernames(rows)
 
+    def _build_dcplayernames(self, rows: List[Dict[str, Any]]):
+        """Build dcplayernames lookup dict"""
         for row in rows:
             nameid = row.get("nameid")
             name = row.get("name")
             if nameid is not None and name:
                 self.dcplayernames[nameid] = name
 
-    def _build_editedplayernames(self, parser_data: Dict[str, Any]):
+    def _build_editedplayernames(self, rows: List[Dict[str, Any]]):
         """Build editedplayernames lookup dict"""
-        rows = parser_data.get("editedplayernames", [])
-        if not rows:
-            print("   Warning: editedplayernames table not found")
-            return
-
         for row in rows:
             playerid = row.get("playerid")
             if playerid is not None:
@@ -95,26 +236,102 @@ class NameResolver:
             else None,
         }
 
+    def resolve_frame(self, players: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized resolve_player_names() for a whole players frame
+
+        Args:
+            players: Frame with playerid, firstnameid, lastnameid, commonnameid
+
+        Returns:
+            Frame with firstname, surname, commonname (None if unresolved),
+            aligned with players
+        """
+        # Fallback: dcplayernames lookup (ID 0 means no name)
+        lookup = pd.Series(self.dcplayernames, dtype=object)
+        names = pd.DataFrame(index=players.index)
+        for column, id_column in zip(NAME_COLUMNS, ("firstnameid", "lastnameid", "commonnameid")):
+            ids = players[id_column].astype("Int64")
+            names[column] = ids.map(lookup).where(ids.notna() & (ids != 0), None).astype(object)
+
+        # Edited names take priority for every player that has them
+        if self.editedplayernames:
+            edited = pd.DataFrame.from_dict(self.editedplayernames, orient="index")
+            edited = edited.reindex(columns=list(NAME_COLUMNS)).astype(object)
+            edited = edited.where(edited.notna() & (edited != ""), None)
+            is_edited = players["playerid"].isin(edited.index).to_numpy()
+            names.loc[is_edited, list(NAME_COLUMNS)] = edited.loc[
+                players["playerid"][is_edited]
+            ].to_numpy()
+
+        return names.where(names.notna(), None)
+
 
 class SaveImporter:
     """
     Imports FC 26 save data into SQLite database.
     """
 
-    def __init__(self):
+    def __init__(self, batch_size: int = 5000):
+        """
+        Args:
+            batch_size: Rows per executemany() call when upserting
+        """
         self.db: Session = None
         self.name_resolver: Optional[NameResolver] = None
+        self.batch_size = batch_size
+        self.fast_load = False
+        # Connection profile the import runs under (see SQLITE_PROFILES)
+        self.profile = "import"
+        # Seconds spent per phase of the last import
+        self.timings: Dict[str, float] = {}
+        # table name -> (playerids written, playerids removed) by the last import
+        self.changes: Dict[str, Tuple[List[int], List[int]]] = {}
+        # Save and label recorded with the snapshot, and the snapshot written
+        # by the last import (None if the save matched the previous one)
+        self.save_path: Optional[str] = None
+        self.label: Optional[str] = None
+        self.snapshot_id: Optional[int] = None
+
+    @contextmanager
+    def _timed(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the block to self.timings[phase]"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start
 
-    def import_save(self, save_path: str = None) -> Dict[str, int]:
+    def import_save(
+        self,
+        save_path: str = None,
+        use_cache: bool = True,
+        columnar: bool = False,
+        fast_load: bool = False,
+        label: Optional[str] = None,
+    ) -> Dict[str, int]:
         """
         Complete import pipeline.
 
         Args:
             save_path: Path to save file (optional)
+            use_cache: Reuse the parse of an unchanged save from the parse cache
+            columnar: Parse into columnar tables and feed their columns to the
+                player pipeline directly, without building row dicts
+            fast_load: Reload the player tables through index-free staging
+                tables swapped in at the end (for first or full imports)
+            label: Name of the history snapshot (e.g. the season; defaults
+                to the save file name)
 
         Returns:
             Dictionary with import statistics
         """
+        self.fast_load = fast_load
+        self.timings = {}
+        self.changes = {}
+        self.save_path = save_path
+        self.label = label
+
         print("=" * 60)
         print("FC26 Career Analyzer - Save Import Pipeline")
         print("=" * 60)
@@ -122,22 +339,28 @@ class SaveImporter:
 
         # Step 1: Initialize database
         print("Step 1: Initializing database...")
-        Base.metadata.create_all(bind=engine)
+        with self._timed("schema"):
+            ensure_schema(profile_engine(self.profile))
         print("Database ready")
         print()
 
-        # Step 2: Parse save file
+        # Step 2: Parse save file, building name lookups while tables stream in
         print("Step 2: Parsing save file...")
+        self.name_resolver = NameResolver()
         try:
-            parsed_data = parser_bridge.parse_save(save_path)
+            with self._timed("parse"):
+                if columnar:
+                    parsed_data = self._collect_columnar(save_path, use_cache)
+                else:
+                    parsed_data = self._collect_tables(save_path, use_cache)
         except Exception as e:
             print(f"Failed to parse save: {e}")
             raise
         print()
 
-        # Initialize NameResolver
+        # Step 3: Name lookups were filled during streaming
         print("Step 3: Initializing Name Resolver...")
-        self.name_resolver = NameResolver(parsed_data)
+        self.name_resolver.report()
         print()
 
         # Step 4: Import players (merging identity and attributes)
@@ -150,163 +373,532 @@ class SaveImporter:
         print("IMPORT COMPLETE")
         print("=" * 60)
         print()
-        print(
-            f"Players imported/updated: {player_stats['players_imported'] + player_stats['players_updated']}"
-        )
+        print(f"Players imported:  {player_stats['players_imported']}")
+        print(f"Players updated:   {player_stats['players_updated']}")
+        print(f"Players unchanged: {player_stats['players_unchanged']}")
+        print(f"Players removed:   {player_stats['players_removed']}")
+        print()
+        print("Phase timings:")
+        for phase, seconds in self.timings.items():
+            print(f"   {phase:<10} {seconds * 1000:8.0f} ms")
         print()
 
         return player_stats
 
+    def load_players(self, save_path: str = None, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Parse a save into its Player rows without touching the database.
+
+        Uses the columnar parse, so a save already in the parse cache is
+        read back without running the parser.
+
+        Args:
+            save_path: Path to save file (optional)
+            use_cache: Reuse the parse of an unchanged save from the parse cache
+
+        Returns:
+            Frame with the Player columns, one row per player
+        """
+        self.name_resolver = NameResolver()
+        tables = self._collect_columnar(save_path, use_cache)
+        players, _ = self._build_player_frames(
+            tables.get("players", []), tables.get("career_playergrowthuserseason", [])
+        )
+        return players
+
+    def _collect_tables(
+        self, save_path: str = None, use_cache: bool = True
+    ) -> Dict[str, List[dict]]:
+        """
+        Consume the parser stream, keeping only the tables the importer uses.
+
+        Name tables are indexed as soon as their batches arrive, so the
+        resolver is ready by the time the last table has been serialized.
+        Player tables are merged like merge_save() and the columnar path do:
+        when a table shows up in several databases, the last one wins.
+
+        Args:
+            save_path: Path to save file (optional)
+            use_cache: Reuse the parse of an unchanged save from the parse cache
+
+        Returns:
+            Dictionary with the player tables (players, attributes)
+        """
+        merger = TableMerger()
+
+        for db, table_name, rows in parser_bridge.iter_database_tables(
+            save_path, projection=IMPORT_PROJECTION, use_cache=use_cache
+        ):
+            if table_name in PLAYER_TABLES:
+                merger.add(db, table_name, rows)
+            elif table_name in NAME_TABLES:
+                self.name_resolver.add_rows(table_name, rows)
+
+        return {name: merger.tables.get(name, []) for name in PLAYER_TABLES}
+
+    def _collect_columnar(
+        self, save_path: str = None, use_cache: bool = True
+    ) -> Dict[str, Table]:
+        """
+        Parse the save into columnar tables.
+
+        Args:
+            save_path: Path to save file (optional)
+            use_cache: Reuse the parse of an unchanged save from the parse cache
+
+        Returns:
+            Dictionary with the player tables as ColumnarTables
+        """
+        tables = parser_bridge.parse_columnar(
+            save_path, projection=IMPORT_PROJECTION, use_cache=use_cache
+        )
+        for table_name in NAME_TABLES:
+            if table_name in tables:
+                self.name_resolver.add_rows(table_name, tables[table_name].to_rows())
+
+        return {name: tables[name] for name in PLAYER_TABLES if name in tables}
+
     def _import_players(self, parsed_data: Dict[str, Any]) -> Dict[str, int]:
         """
         Import players merging identity (players) and attributes (career_playergrowthuserseason).
 
+        The join, name resolution and clamping run column-wise on
+        DataFrames (see _build_player_frames()). Only new and changed rows
+        are written and players missing from the save are deleted; rows are
+        compared through their stored row_hash. The name search index
+        follows the written and removed players, a history snapshot records
+        the players that changed since the previous one and the squad stats
+        snapshot is refreshed when anything changed, in the same transaction.
+
         Args:
-            parsed_data: Parsed save data
+            parsed_data: Parsed save data (tables as row dicts, ColumnarTables
+                or {column: array})
 
         Returns:
-            Statistics dictionary
+            Statistics dictionary (players imported, updated, unchanged, removed)
         """
         # Get data tables
         players_rows = parsed_data.get("players", [])
         attributes_rows = parsed_data.get("career_playergrowthuserseason", [])
 
-        if not players_rows:
+        if not table_length(players_rows):
             print("Warning: No player identity data found in save")
-            return {"players_imported": 0, "players_updated": 0}
+            return {
+                "players_imported": 0,
+                "players_updated": 0,
+                "players_unchanged": 0,
+                "players_removed": 0,
+            }
 
-        print(f"   Found {len(players_rows)} players in 'players' table")
+        print(f"   Found {table_length(players_rows)} players in 'players' table")
         print(
-            f"   Found {len(attributes_rows)} players in 'career_playergrowthuserseason' table"
+            f"   Found {table_length(attributes_rows)} players in 'career_playergrowthuserseason' table"
         )
 
-        # Index attributes by playerid for fast lookup
-        attributes_map = {
-            row["playerid"]: row for row in attributes_rows if "playerid" in row
-        }
+        with self._timed("transform"):
+            players_frame, info_frame = self._build_player_frames(players_rows, attributes_rows)
 
-        # Create session
-        db = SessionLocal()
+        # Session on the import profile's own engine (bigger cache for the
+        # bulk writes), leaving the shared engine's connections alone
+        db = SessionLocal(bind=profile_engine(self.profile))
 
         try:
-            imported = 0
-            updated = 0
-
-            # We iterate over players_rows as it contains the master list of players
-            for player_row in players_rows:
-                playerid = player_row.get("playerid")
-                if playerid is None:
-                    continue
-
-                # Debug first few players
-                if imported + updated < 5:
-                    print(
-                        f"   Processing player {playerid} (Raw ID: {player_row.get('playerid')})"
-                    )
-
-                # Get attributes (if any)
-                attrs = attributes_map.get(playerid, {})
-
-                # Resolve names
-                resolved_names = self.name_resolver.resolve_player_names(
-                    playerid=playerid,
-                    firstnameid=player_row.get("firstnameid"),
-                    lastnameid=player_row.get("lastnameid"),
-                    commonnameid=player_row.get("commonnameid"),
-                )
+            sync = self._fast_load_table if self.fast_load else self._sync_table
+            stats = sync(db, Player, players_frame)
+            sync(db, PlayerInfo, info_frame)
+            with self._timed("search"):
+                sync_search_index(db, *self.changes[Player.__tablename__])
+            with self._timed("history"):
+                self.snapshot_id = self._record_snapshot(db, players_frame)
+            changed = stats["imported"] or stats["updated"] or stats["removed"]
+            if changed or db.get(SquadStats, SNAPSHOT_ID) is None:
+                with self._timed("stats"):
+                    refresh_snapshot(db)
+            with self._timed("commit"):
+                db.commit()
+
+            print(
+                f"   Processed {len(players_frame)} players: {stats['imported']} new, "
+                f"{stats['updated']} changed, {stats['unchanged']} unchanged, "
+                f"{stats['removed']} removed"
+            )
+
+            return {f"players_{key}": count for key, count in stats.items()}
 
-                # Determine final names (fallback to Unknown if resolution failed)
-                firstname = resolved_names["firstname"] or f"Unknown_{playerid}"
-                surname = resolved_names["surname"] or ""
-                commonname = resolved_names["commonname"]
-
-                # Map fields to Player model
-                player_dict = {
-                    "playerid": playerid,
-                    "firstname": firstname,
-                    "surname": surname,
-                    "commonname": commonname,
-                    # Attributes (use defaults if missing)
-                    "overallrating": attrs.get(
-                        "overall", attrs.get("overallrating", 40)
-                    ),  # Default to min 40 to satisfy constraint
-                    "potential": attrs.get("potential", 40),
-                    "age": attrs.get("age", 16),
-                    "height": attrs.get("height"),
-                    "weight": attrs.get("weight"),
-                    "preferredposition1": attrs.get("preferredposition1"),
-                    "weakfootabilitytypecode": attrs.get("weakfootabilitytypecode"),
-                    "skillmoves": attrs.get("skillmoves"),
-                    "value": attrs.get("value"),
-                }
+        except Exception as e:
+            db.rollback()
+            print(f"   Error importing players: {e}")
+            raise
+        finally:
+            db.close()
+
+    def _build_player_frames(
+        self, players_rows: Table, attributes_rows: Table
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Join identity and attributes, resolve names and clamp ratings, column-wise.
+
+        Args:
+            players_rows: players table (master list of players)
+            attributes_rows: career_playergrowthuserseason table
+
+        Returns:
+            (players, info) frames with the Player and PlayerInfo columns,
+            one row per player
+        """
+        players = table_frame(players_rows, IMPORT_PROJECTION["players"])
+        players = players[players["playerid"].notna()].drop_duplicates("playerid", keep="last")
+        players["playerid"] = players["playerid"].astype(np.int64)
+        players = players.reset_index(drop=True)
+
+        attributes = table_frame(attributes_rows, IMPORT_PROJECTION["career_playergrowthuserseason"])
+        attributes = attributes[attributes["playerid"].notna()].drop_duplicates("playerid", keep="last")
+        attributes["playerid"] = attributes["playerid"].astype(np.int64)
+
+        # Players without a growth row keep null attributes (defaults below)
+        merged = players[["playerid"]].merge(attributes, on="playerid", how="left")
+
+        # Resolve names (fallback to Unknown if resolution failed)
+        names = self.name_resolver.resolve_frame(players)
+        firstname = names["firstname"].fillna("Unknown_" + players["playerid"].astype(str))
+        surname = names["surname"].fillna("")
+        commonname = names["commonname"]
+
+        result = pd.DataFrame(
+            {
+                "playerid": players["playerid"],
+                "firstname": firstname,
+                "surname": surname,
+                "commonname": commonname,
+                # Attributes (defaults satisfy the check constraints)
+                "overallrating": merged["overall"].fillna(merged["overallrating"]).fillna(40),
+                "potential": merged["potential"].fillna(40),
+                "age": merged["age"].fillna(16),
+                "height": merged["height"],
+                "weight": merged["weight"],
+                "preferredposition1": merged["preferredposition1"],
+                "weakfootabilitytypecode": merged["weakfootabilitytypecode"],
+                "skillmoves": merged["skillmoves"],
+                "value": merged["value"],
+            }
+        )
+
+        # Ensure constraints are met
+        for column, lowest, highest in PLAYER_CLAMPS:
+            result[column] = result[column].clip(lowest, highest).astype(np.int64)
+
+        # Derived columns stored for SQL filtering and sorting (same rules
+        # as the PlayerDisplayMixin properties)
+        result["growth_potential"] = result["potential"] - result["overallrating"]
+        result["is_named"] = (firstname != "") & ~firstname.str.startswith("Unknown_")
+
+        # PlayerInfo keeps the resolved names for reference, plus the
+        # identity fields of the players table
+        info = pd.DataFrame(
+            {
+                "playerid": players["playerid"],
+                "firstname": firstname,
+                "surname": surname,
+                "commonname": commonname,
+                "nationality": players["nationality"],
+                "birthdate": players["birthdate"],
+            }
+        )
+
+        return result, info
+
+    def _sync_table(self, db: Session, model, frame: pd.DataFrame) -> Dict[str, int]:
+        """
+        Make a table match the frame, writing only what changed.
 
-                # Ensure constraints are met (simple validation)
-                if player_dict["overallrating"] < 40:
-                    player_dict["overallrating"] = 40
-                if player_dict["potential"] < 40:
-                    player_dict["potential"] = 40
-                if player_dict["age"] < 16:
-                    player_dict["age"] = 16
-
-                # Upsert Player
-                stmt = insert(Player).values(**player_dict)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["playerid"], set_=player_dict
+        Each row's content hash is compared with the row_hash stored at the
+        previous import: new and changed rows are upserted (bumping
+        updated_at), unchanged rows are not touched and rows whose playerid
+        is no longer in the frame are deleted.
+
+        Args:
+            db: Open session (committed by the caller)
+            model: Mapped class with playerid and row_hash columns
+            frame: Every row the table should hold
+
+        Returns:
+            {"imported", "updated", "unchanged", "removed"} row counts
+        """
+        table = model.__table__
+        with self._timed("compare"):
+            frame = frame.assign(row_hash=row_hashes(frame, table))
+            is_new, is_changed, removed = self._compare(db, table, frame)
+            self._record_changes(table, frame, is_new | is_changed, removed)
+
+        with self._timed("write"):
+            self._bulk_upsert(db, table, frame[is_new | is_changed])
+            if removed:
+                db.connection().execute(
+                    table.delete().where(table.c.playerid == bindparam("id")),
+                    [{"id": playerid} for playerid in removed],
                 )
-                result = db.execute(stmt)
-
-                if result.rowcount > 0:
-                    # Check if this was an insert or update
-                    # (This check is approximate with on_conflict_do_update)
-                    updated += 1  # Assume update/insert happened
-
-                # Also update PlayerInfo for reference (optional but good for debugging)
-                info_dict = {
-                    "playerid": playerid,
-                    "firstname": player_row.get(
-                        "firstname"
-                    ),  # Original from table (likely None/empty)
-                    "surname": player_row.get("surname"),
-                    "commonname": player_row.get("commonname"),
-                    "nationality": player_row.get("nationality"),
-                    "birthdate": player_row.get("birthdate"),
-                    # Store IDs too if we added columns for them, but PlayerInfo model
-                    # currently has firstname/surname columns which are strings.
-                    # The user's PlayerInfo model (from previous steps) had:
-                    # firstname, surname, commonname, nationality, birthdate.
-                    # It did NOT have firstnameid.
-                    # So we can't store IDs there unless we update the model.
-                    # For now, let's skip PlayerInfo upsert or just store what we have.
-                    # Actually, we should probably store the RESOLVED names in PlayerInfo too if we want to keep it.
-                    # But Player model now has the resolved names.
-                    # Let's just stick to Player model for now to keep it simple and efficient.
-                }
 
-                # If we want to keep PlayerInfo populated:
-                info_dict["firstname"] = firstname
-                info_dict["surname"] = surname
-                info_dict["commonname"] = commonname
+        return self._change_counts(frame, is_new, is_changed, removed)
+
+    @staticmethod
+    def _compare(
+        db: Session, table: SQLTable, frame: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+        """
+        Compare a hashed frame with the rows stored in a table.
+
+        Returns:
+            (is_new, is_changed) masks over the frame rows, and the playerids
+            stored in the table but missing from the frame
+        """
+        stored = pd.DataFrame(
+            db.execute(select(table.c.playerid, table.c.row_hash)).all(),
+            columns=["playerid", "stored_hash"],
+        ).astype({"playerid": np.int64, "stored_hash": "Int64"})
+        compared = frame[["playerid", "row_hash"]].merge(
+            stored, on="playerid", how="left", indicator=True
+        )
+        is_new = (compared["_merge"] == "left_only").to_numpy()
+        # A NULL stored hash (rows imported before hashing) counts as changed
+        is_changed = ~is_new & (
+            compared["stored_hash"].ne(compared["row_hash"]).fillna(True).to_numpy(dtype=bool)
+        )
+        removed = stored.loc[~stored["playerid"].isin(frame["playerid"]), "playerid"].tolist()
+        return is_new, is_changed, removed
+
+    def _record_changes(
+        self, table: SQLTable, frame: pd.DataFrame, written: np.ndarray, removed: List[int]
+    ):
+        """Keep the playerids a sync writes and deletes (see self.changes)"""
+        self.changes[table.name] = (frame.loc[written, "playerid"].tolist(), removed)
+
+    def _record_snapshot(self, db: Session, frame: pd.DataFrame) -> Optional[int]:
+        """
+        Append a history snapshot holding only the players that changed.
+
+        Rows are compared by content hash with each player's latest stored
+        row; changed and new players get a row in the new snapshot, players
+        gone from the save get a removed row. A save identical to the last
+        snapshot records nothing.
+
+        Args:
+            db: Open session (committed by the caller)
+            frame: Every Player row of the save
+
+        Returns:
+            The new snapshot id, or None if nothing changed
+        """
+        table = PlayerHistory.__table__
+        history = frame[["playerid", *HISTORY_COLUMNS]]
+        # Hashed with the history column dtypes, so an identical save matches
+        # whichever parse path produced the frame
+        history = history.assign(row_hash=row_hashes(history, table))
+
+        previous = latest_snapshot_id(db)
+        stored = pd.DataFrame(
+            []
+            if previous is None
+            else db.execute(
+                select_state(previous, [PlayerHistory.playerid, PlayerHistory.row_hash])
+            ).all(),
+            columns=["playerid", "stored_hash"],
+        ).astype({"playerid": np.int64, "stored_hash": "Int64"})
+
+        compared = history[["playerid", "row_hash"]].merge(stored, on="playerid", how="left")
+        changed = compared["stored_hash"].ne(compared["row_hash"]).fillna(True).to_numpy(dtype=bool)
+        removed = stored.loc[~stored["playerid"].isin(history["playerid"]), "playerid"].tolist()
+
+        if previous is not None and not changed.any() and not removed:
+            print("   History: save matches the last snapshot, nothing recorded")
+            return None
+
+        label = self.label or (Path(self.save_path).name if self.save_path else None)
+        snapshot = Snapshot(
+            label=label,
+            save_path=self.save_path,
+            player_count=len(history),
+            changed_count=int(changed.sum()) + len(removed),
+        )
+        db.add(snapshot)
+        db.flush()
+
+        self._bulk_insert(db, table, history[changed].assign(snapshot_id=snapshot.id, removed=False))
+        self._bulk_insert(
+            db,
+            table,
+            pd.DataFrame({"playerid": removed, "snapshot_id": snapshot.id, "removed": True}),
+        )
+        print(
+            f"   History: snapshot #{snapshot.id} stores {snapshot.changed_count} of "
+            f"{len(history)} players"
+        )
+        return snapshot.id
+
+    @staticmethod
+    def _change_counts(
+        frame: pd.DataFrame, is_new: np.ndarray, is_changed: np.ndarray, removed: List[int]
+    ) -> Dict[str, int]:
+        return {
+            "imported": int(is_new.sum()),
+            "updated": int(is_changed.sum()),
+            "unchanged": int(len(frame) - is_new.sum() - is_changed.sum()),
+            "removed": len(removed),
+        }
+
+    def _fast_load_table(self, db: Session, model, frame: pd.DataFrame) -> Dict[str, int]:
+        """
+        Replace a table's contents through an index-free staging table.
 
-                stmt_info = insert(PlayerInfo).values(**info_dict)
-                stmt_info = stmt_info.on_conflict_do_update(
-                    index_elements=["playerid"], set_=info_dict
+        Rows are bulk-inserted into "<table>_staging", which has the table's
+        columns and constraints but no secondary indexes; the live table is
+        then dropped, the staging table renamed in its place and the indexes
+        built once over the loaded data. All of it runs in the session's
+        transaction, so readers see either the old table or the new one.
+        created_at is carried over for existing players and updated_at for
+        unchanged ones (UPDATE ... FROM where SQLite supports it, a
+        correlated subquery per column before 3.33).
+
+        Args:
+            db: Open session (committed by the caller)
+            model: Mapped class with playerid and row_hash columns
+            frame: Every row the table should hold
+
+        Returns:
+            {"imported", "updated", "unchanged", "removed"} row counts
+        """
+        table = model.__table__
+        staging_name = f"{table.name}_staging"
+        connection = db.connection()
+
+        with self._timed("compare"):
+            frame = frame.assign(row_hash=row_hashes(frame, table))
+            is_new, is_changed, removed = self._compare(db, table, frame)
+            self._record_changes(table, frame, is_new | is_changed, removed)
+
+        with self._timed("stage"):
+            # pysqlite only opens a transaction before DML: open it now so
+            # the staging table, the load and the swap commit (or roll
+            # back) together
+            if not connection.connection.driver_connection.in_transaction:
+                connection.exec_driver_sql("BEGIN")
+
+            staging = table.to_metadata(MetaData(), name=staging_name)
+            for index in list(staging.indexes):
+                staging.indexes.discard(index)
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS "{staging_name}"')
+            staging.create(connection)
+
+            self._bulk_upsert(db, staging, frame)
+
+            kept = [
+                column.name
+                for column in table.columns
+                if column.name not in frame and column.default is not None
+            ]
+            staged = f'"{staging_name}"'
+            unchanged = f"{staged}.row_hash IS live.row_hash"
+            values = {
+                name: f'CASE WHEN {unchanged} THEN live."{name}" ELSE {staged}."{name}" END'
+                if table.c[name].onupdate is not None
+                else f'live."{name}"'
+                for name in kept
+            }
+            if values and UPDATE_FROM:
+                assignments = ", ".join(f'"{name}" = {value}' for name, value in values.items())
+                connection.exec_driver_sql(
+                    f'UPDATE {staged} SET {assignments} '
+                    f'FROM "{table.name}" AS live WHERE {staged}.playerid = live.playerid'
+                )
+            elif values:
+                match = f'FROM "{table.name}" AS live WHERE live.playerid = {staged}.playerid'
+                assignments = ", ".join(
+                    f'"{name}" = (SELECT {value} {match})' for name, value in values.items()
+                )
+                connection.exec_driver_sql(
+                    f'UPDATE {staged} SET {assignments} '
+                    f'WHERE playerid IN (SELECT playerid FROM "{table.name}")'
                 )
-                db.execute(stmt_info)
 
-            db.commit()
+        with self._timed("swap"):
+            connection.exec_driver_sql(f'DROP TABLE "{table.name}"')
+            connection.exec_driver_sql(f'ALTER TABLE "{staging_name}" RENAME TO "{table.name}"')
 
-            print(f"   Processed {len(players_rows)} players")
-            # Since we can't easily distinguish insert/update with sqlite upsert without extra query,
-            # we'll just report total processed.
+        with self._timed("index"):
+            for index in table.indexes:
+                index.create(connection)
 
-            return {"players_imported": len(players_rows), "players_updated": 0}
+        return self._change_counts(frame, is_new, is_changed, removed)
 
-        except Exception as e:
-            db.rollback()
-            print(f"   Error importing players: {e}")
-            raise
-        finally:
-            db.close()
+    def _bulk_upsert(self, db: Session, table: SQLTable, frame: pd.DataFrame):
+        """
+        Upsert the rows of a frame with one compiled statement, in batches.
+
+        The INSERT ... ON CONFLICT DO UPDATE statement is compiled once
+        against the Core table; columns with an onupdate (updated_at) take
+        the new value on conflict. See _execute_bulk() for how rows are sent.
+
+        Args:
+            db: Open session (committed by the caller)
+            table: Table with a playerid primary key
+            frame: One column per table column to write
+        """
+        if frame.empty:
+            return
+
+        stmt = insert(table)
+        updated = [column for column in frame.columns if column != "playerid"]
+        updated += [column.name for column in table.columns if column.onupdate is not None]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["playerid"],
+            set_={column: stmt.excluded[column] for column in updated},
+        )
+        self._execute_bulk(db, table, stmt, frame)
+
+    def _bulk_insert(self, db: Session, table: SQLTable, frame: pd.DataFrame):
+        """Insert the rows of a frame (no conflict handling), in batches"""
+        if frame.empty:
+            return
+        self._execute_bulk(db, table, insert(table), frame)
+
+    def _execute_bulk(self, db: Session, table: SQLTable, stmt, frame: pd.DataFrame):
+        """
+        Run an INSERT statement over every row of a frame.
+
+        The statement is compiled once; rows go to the driver as positional
+        tuples, batch_size rows per executemany() call, skipping
+        SQLAlchemy's per-row parameter processing. Column defaults (the
+        timestamps) are evaluated once for the whole import.
+
+        Args:
+            db: Open session (committed by the caller)
+            table: Table the statement writes
+            stmt: INSERT statement against the table
+            frame: One column per table column to write
+        """
+        dialect = db.get_bind().dialect
+
+        # Bind processors run per value only for types that need one (none of
+        # the data columns on SQLite); defaults are processed once
+        values = frame_columns(frame, table)
+        for name in values:
+            process = table.c[name].type.dialect_impl(dialect).bind_processor(dialect)
+            if process is not None:
+                values[name] = [process(value) for value in values[name]]
+        for column in table.columns:
+            if column.name not in values and column.default is not None:
+                default = column.default.arg(None) if column.default.is_callable else column.default.arg
+                process = column.type.dialect_impl(dialect).bind_processor(dialect)
+                if process is not None:
+                    default = process(default)
+                values[column.name] = [default] * len(frame)
+
+        compiled = stmt.compile(dialect=dialect, column_keys=list(values))
+
+        sql = str(compiled)
+        rows = list(zip(*(values[name] for name in compiled.positiontup)))
+        connection = db.connection()
+        for start in range(0, len(rows), self.batch_size):
+            connection.exec_driver_sql(sql, rows[start:start + self.batch_size])
 
 
 # Singleton instance
@@ -0,0 +1,126 @@
+"""
+Merge of per-database parser results into one table index.
+A save embeds several databases; tables are merged in a single pass.
+"""
+
+from typing import Dict, Any, Iterator, List, Tuple, Union
+
+# Key of the merge metadata in parse_save.js output (see parser/lib/merge.js)
+MERGE_META_KEY = "_merge"
+
+# Shadowed tables are written as "<table>@db<index>"
+SHADOW_SEPARATOR = "@db"
+
+
+def shadow_name(table_name: str, db: int) -> str:
+    """Output key of a table shadowed by a later database"""
+    return f"{table_name}{SHADOW_SEPARATOR}{db}"
+
+
+class TableMerger:
+    """
+    Builds the merged table index incrementally, without copying tables.
+
+    Batches of the same table from the same database are appended. When a
+    table name shows up again in a later database, the later one wins (as
+    the parser's merged output always did), but the earlier table is kept
+    in `shadowed` and the clash is reported in `conflicts` instead of being
+    silently dropped.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, List[dict]] = {}
+        self.source_db: Dict[str, int] = {}
+        self.shadowed: Dict[Tuple[str, int], List[dict]] = {}
+
+    def add(self, db: int, table_name: str, rows: List[dict]):
+        """
+        Add a batch of rows for a table of a given database.
+
+        Args:
+            db: Index of the database in the save
+            table_name: Table name
+            rows: Row batch (appended, not copied)
+        """
+        current_db = self.source_db.get(table_name)
+
+        if current_db is None:
+            self.tables[table_name] = list(rows)
+            self.source_db[table_name] = db
+        elif current_db == db:
+            self.tables[table_name].extend(rows)
+        else:
+            # Duplicate table name across databases: keep both
+            self.shadowed[(table_name, current_db)] = self.tables[table_name]
+            self.tables[table_name] = list(rows)
+            self.source_db[table_name] = db
+
+    @classmethod
+    def from_output(cls, data: Union[List[Dict[str, Any]], Dict[str, Any]]) -> "TableMerger":
+        """
+        Rebuild the merge from a parse_save.js JSON document.
+
+        Accepts a list of databases (raw parser result) or a merged object,
+        with or without the "_merge" metadata and "<table>@db<n>" shadowed
+        tables written by the parser.
+        """
+        merger = cls()
+        if isinstance(data, list):
+            for db, tables in enumerate(data):
+                merger.add_database(db, tables)
+            return merger
+
+        sources = data.get(MERGE_META_KEY, {}).get("sources", {})
+        shadowed = []
+        for name, rows in data.items():
+            if not isinstance(rows, list):
+                continue
+            table_name, separator, db = name.rpartition(SHADOW_SEPARATOR)
+            if separator and db.isdigit():
+                shadowed.append((int(db), table_name, rows))
+            else:
+                merger.add(sources.get(name, 0), name, rows)
+
+        for db, table_name, rows in shadowed:
+            merger.shadowed[(table_name, db)] = rows
+        return merger
+
+    def add_database(self, db: int, tables: Dict[str, Any]):
+        """Add every table of one database result"""
+        for table_name, rows in tables.items():
+            if isinstance(rows, list):
+                self.add(db, table_name, rows)
+
+    @property
+    def conflicts(self) -> Dict[str, List[int]]:
+        """Table name -> databases that contain it, for duplicated tables"""
+        conflicts: Dict[str, List[int]] = {}
+        for table_name, db in self.shadowed:
+            conflicts.setdefault(table_name, []).append(db)
+        for table_name, dbs in conflicts.items():
+            dbs.append(self.source_db[table_name])
+            dbs.sort()
+        return conflicts
+
+    def iter_all(self) -> Iterator[Tuple[int, str, List[dict]]]:
+        """Every (db, table_name, rows), shadowed ones included, in database order"""
+        entries = [(db, name, rows) for (name, db), rows in self.shadowed.items()]
+        entries += [(self.source_db[name], name, rows) for name, rows in self.tables.items()]
+        entries.sort(key=lambda entry: entry[0])
+        return iter(entries)
+
+    def with_shadowed(self) -> Dict[str, List[dict]]:
+        """Merged tables plus shadowed ones under "<table>@db<n>" keys"""
+        data = dict(self.tables)
+        for (table_name, db), rows in self.shadowed.items():
+            data[shadow_name(table_name, db)] = rows
+        return data
+
+    def report(self):
+        """Print duplicate-table conflicts, if any"""
+        for table_name, dbs in self.conflicts.items():
+            kept = self.source_db[table_name]
+            print(
+                f"Warning: table '{table_name}' found in databases {dbs}; "
+                f"using database {kept}, others kept as shadowed"
+            )
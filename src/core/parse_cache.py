@@ -0,0 +1,376 @@
+"""
+Content-addressed cache for parsed saves.
+Entries are keyed by save file hash, parser mode, projection and format;
+single tables are also cached by the fingerprint of their raw bytes.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.columnar import ColumnarTable, is_columnar_dir, load_columnar
+from src.core.projection import Projection, dump_projection
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "parse_cache"
+
+# Bump when the entry layout changes so stale entries are never read
+CACHE_FORMAT_VERSION = 3
+
+# Disk budget in MB (override with FC26_PARSE_CACHE_MB)
+DEFAULT_CACHE_MB = 512
+
+ENTRY_SUFFIX = ".pkl"
+TABLE_PREFIX = "table-"
+ROWS_SUFFIX = ".rows"
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed tables with LRU eviction.
+
+    Three entry formats share one budget:
+    - rows: <key>.rows/ directory with one file per table (per database it
+      appears in, in stream order): a {"db", "table"} header followed by
+      one pickle per streamed batch, each as a column list plus row tuples
+      (no repeated key strings), pickled with the highest protocol. It is
+      written and read back batch by batch, so a save is never held whole.
+    - table: table-<key>.pkl, one decoded table in the batch layout, keyed
+      by its fingerprint so unchanged tables are shared between saves
+    - columnar: <key>/ directory written by the parser (see columnar.py)
+
+    Entry mtime doubles as the LRU clock: a hit touches the entry, eviction
+    removes the oldest.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Disk budget (defaults to FC26_PARSE_CACHE_MB or 512 MB)
+        """
+        self.cache_dir = cache_dir
+        if max_bytes is None:
+            max_bytes = int(os.getenv("FC26_PARSE_CACHE_MB", DEFAULT_CACHE_MB)) << 20
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+        """Streaming BLAKE2b digest of a file (never loads it whole)"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(
+        file_hash: str,
+        parser_mode: int,
+        projection: Optional[Projection],
+        fmt: str = "rows",
+    ) -> str:
+        """Cache key for a save hash parsed in a given mode, projection and format"""
+        spec = dump_projection(projection) if projection is not None else "*"
+        raw = f"v{CACHE_FORMAT_VERSION}:{fmt}:{file_hash}:{parser_mode}:{spec}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def make_table_key(
+        fingerprint: str,
+        parser_mode: int,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+    ) -> str:
+        """Cache key for one table's rows, from its raw-bytes fingerprint"""
+        spec = ",".join(columns) if columns is not None else "*"
+        raw = f"v{CACHE_FORMAT_VERSION}:table:{fingerprint}:{parser_mode}:{table_name}:{spec}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def _load(self, path: Path) -> Any:
+        """Unpickle an entry and mark it as recently used (None on miss)"""
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Corrupt or incompatible entry: drop it and re-parse
+            print(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        os.utime(path)  # Mark as recently used
+        return entry
+
+    def _store(self, path: Path, entry: Any):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp-{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)  # Atomic: readers never see partial entries
+
+    @staticmethod
+    def _pack_rows(rows: List[dict]) -> Dict[str, Any]:
+        # Union of keys in first-seen order (rows may have missing columns)
+        columns = list(dict.fromkeys(k for row in rows for k in row))
+        return {"columns": columns, "rows": [tuple(row.get(c) for c in columns) for row in rows]}
+
+    @staticmethod
+    def _unpack_rows(table: Dict[str, Any]) -> List[dict]:
+        return [dict(zip(table["columns"], row)) for row in table["rows"]]
+
+    def _rows_dir(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ROWS_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Open a cached rows entry.
+
+        Returns:
+            Iterator over {"db": int, "table": str, "rows": [dict, ...]}
+            batches in stream order, read from disk one at a time, or None
+            on miss
+        """
+        directory = self._rows_dir(key)
+        if not directory.is_dir():
+            return None
+
+        paths = sorted(directory.glob(f"*{ENTRY_SUFFIX}"))
+        try:
+            # Headers only: catches entries of an incompatible layout early
+            headers = []
+            for path in paths:
+                with open(path, "rb") as f:
+                    headers.append(pickle.load(f))
+        except Exception as e:
+            print(f"Discarding unreadable cache entry {directory.name}: {e}")
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+
+        os.utime(directory)  # Mark as recently used
+        return self._iter_rows(directory, paths)
+
+    def _iter_rows(self, directory: Path, paths: List[Path]) -> Iterator[Dict[str, Any]]:
+        try:
+            for path in paths:
+                with open(path, "rb") as f:
+                    header = pickle.load(f)
+                    while True:
+                        try:
+                            batch = pickle.load(f)
+                        except EOFError:
+                            break
+                        yield {**header, "rows": self._unpack_rows(batch)}
+        except (OSError, pickle.UnpicklingError) as e:
+            # Batches were already handed out: the caller has to parse again
+            shutil.rmtree(directory, ignore_errors=True)
+            raise RuntimeError(
+                f"Cache entry {directory.name} became unreadable and was discarded: {e}"
+            ) from e
+
+    def new_rows_writer(self, key: str) -> "RowsEntryWriter":
+        """Writer that builds the rows entry for key batch by batch (see RowsEntryWriter)"""
+        staging = self.cache_dir / f"{key}{ROWS_SUFFIX}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        return RowsEntryWriter(self, key, staging)
+
+    def commit_rows(self, key: str, staging: Path):
+        """Publish a staging directory as the rows entry for key and enforce the budget"""
+        directory = self._rows_dir(key)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)  # Readers only ever see complete entries
+        self.evict(keep=directory)
+
+    def put(self, key: str, tables: Iterable[Tuple[int, str, List[dict]]]):
+        """
+        Store parsed tables and enforce the disk budget.
+
+        Args:
+            key: Cache key from make_key()
+            tables: (db, table_name, rows) batches in stream order, duplicates
+                across databases included (see TableMerger.iter_all())
+        """
+        writer = self.new_rows_writer(key)
+        try:
+            for db, name, rows in tables:
+                writer.add(db, name, rows)
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+
+    # Table entries
+    def _table_path(self, key: str) -> Path:
+        return self.cache_dir / f"{TABLE_PREFIX}{key}{ENTRY_SUFFIX}"
+
+    def get_table(self, key: str) -> Optional[List[dict]]:
+        """
+        Load one cached table.
+
+        Returns:
+            Rows as dicts, or None on miss
+        """
+        entry = self._load(self._table_path(key))
+        return self._unpack_rows(entry) if entry is not None else None
+
+    def put_table(self, key: str, rows: List[dict]):
+        """
+        Store one decoded table.
+
+        The budget is not enforced here, so a parse storing many tables
+        calls evict() once at the end.
+
+        Args:
+            key: Cache key from make_table_key()
+            rows: Decoded rows
+        """
+        self._store(self._table_path(key), self._pack_rows(rows))
+
+    # Columnar entries
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def get_columnar(self, key: str) -> Optional[Dict[str, ColumnarTable]]:
+        """
+        Open a cached columnar entry (columns are memory-mapped, not loaded).
+
+        Returns:
+            {table_name: ColumnarTable} or None on miss
+        """
+        directory = self._entry_dir(key)
+        if not is_columnar_dir(directory):
+            return None
+
+        try:
+            tables = load_columnar(directory)
+        except Exception as e:
+            print(f"Discarding unreadable cache entry {directory.name}: {e}")
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+
+        os.utime(directory)  # Mark as recently used
+        return tables
+
+    def new_columnar_dir(self, key: str) -> Path:
+        """Empty staging directory for the parser to write a columnar entry into"""
+        staging = self.cache_dir / f"{key}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        return staging
+
+    def commit_columnar(self, key: str, staging: Path) -> Dict[str, ColumnarTable]:
+        """
+        Publish a staging directory as the entry for key and enforce the budget.
+
+        Returns:
+            The committed tables
+        """
+        directory = self._entry_dir(key)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)  # Readers only ever see complete entries
+
+        self.evict(keep=directory)
+        return load_columnar(directory)
+
+    # Housekeeping
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.iterdir())
+        return path.stat().st_size
+
+    def _entries(self) -> List[Path]:
+        """Committed entries (table pickles, rows and columnar directories)"""
+        if not self.cache_dir.exists():
+            return []
+        return [
+            path
+            for path in self.cache_dir.iterdir()
+            if ".tmp" not in path.name
+            and (path.suffix in (ENTRY_SUFFIX, ROWS_SUFFIX) or is_columnar_dir(path))
+        ]
+
+    def evict(self, keep: Optional[Path] = None):
+        """
+        Delete least recently used entries until the cache fits its budget
+
+        Args:
+            keep: Entry to spare even if over budget (the one just written)
+        """
+        entries = []
+        for path in self._entries():
+            entries.append((path.stat().st_mtime, self._entry_size(path), path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink(missing_ok=True)
+            except OSError:
+                continue  # Still memory-mapped (Windows): try again next time
+            total -= size
+
+    def clear(self):
+        """Remove every cache entry"""
+        for path in self._entries():
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+
+class RowsEntryWriter:
+    """
+    Builds a rows entry in a staging directory as batches stream by.
+
+    Every batch goes to disk as soon as it is added, appended to the file
+    of its (database, table); commit() publishes the entry atomically,
+    discard() drops it (parse failed or stopped early).
+    """
+
+    def __init__(self, cache: ParseCache, key: str, staging: Path):
+        self.cache = cache
+        self.key = key
+        self.staging = staging
+        self._file: Optional[BinaryIO] = None
+        self._table: Optional[Tuple[int, str]] = None
+        self._files = 0
+
+    def add(self, db: int, table_name: str, rows: List[dict]):
+        """Append one batch of a table"""
+        if (db, table_name) != self._table:
+            self._close()
+            # Zero-padded sequence number: file name order is stream order
+            self._file = open(self.staging / f"{self._files:06d}{ENTRY_SUFFIX}", "wb")
+            pickle.dump({"db": db, "table": table_name}, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._table = (db, table_name)
+            self._files += 1
+        pickle.dump(ParseCache._pack_rows(rows), self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def commit(self):
+        """Publish the entry"""
+        self._close()
+        self.cache.commit_rows(self.key, self.staging)
+
+    def discard(self):
+        """Drop the staging directory"""
+        self._close()
+        shutil.rmtree(self.staging, ignore_errors=True)
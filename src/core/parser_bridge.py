@@ -3,35 +3,413 @@ Bridge between Python and Node.js parser.
 Handles calling the Node.js fifa-career-save-parser.
 """
 
+import gzip
+import io
 import json
+import os
+import shutil
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterator, List, Optional, TextIO, Tuple
+
+from dotenv import load_dotenv
+
+from src.core.columnar import ColumnarTable, load_columnar
+from src.core.fifa_db import SaveReader
+from src.core.merge import TableMerger
+from src.core.parse_cache import ParseCache
+from src.core.parser_worker import ParserWorker
+from src.core.progress import (
+    DEFAULT_STALL_TIMEOUT,
+    PROGRESS_TYPES,
+    ParseProgress,
+    StallWatchdog,
+)
+from src.core.projection import Projection, dump_projection, project_rows
+
+load_dotenv()
+
+# Magic bytes of compressed parser output (parse_save.js --compress)
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+PARSER_MODE = 21  # FIFA 21 mode for FC 26 compatibility (see parser/lib/tables.js)
+DEFAULT_SAVE_NAME = "CmMgrC20251119080713440"
+
+# "node": fifa-career-save-parser via Node.js; "native": src/core/fifa_db
+ENGINES = ("node", "native")
+
+
+def open_output(path: Path) -> TextIO:
+    """
+    Open a parser JSON output as text, decompressing gzip/zstd transparently.
+
+    Compression is detected from the file's magic bytes, not its extension.
+
+    Raises:
+        RuntimeError: If the file is zstd-compressed and zstandard is not installed
+    """
+    with open(path, "rb") as f:
+        magic = f.read(4)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+
+    if magic.startswith(ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                f"{path} is zstd-compressed; install 'zstandard' to read it"
+            )
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+
+    return open(path, "r", encoding="utf-8")
 
 
 class ParserBridge:
     """
     Bridge to call Node.js parser from Python.
+
+    With engine="native" the save is decoded in-process by the NumPy reader
+    (src/core/fifa_db) instead, with no Node.js process or JSON in between.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        stall_timeout: Optional[float] = None,
+        batch_size: int = 5000,
+        use_worker: bool = True,
+        cache: Optional[ParseCache] = None,
+        jobs: Optional[int] = None,
+        progress_callback: Optional[Callable[[ParseProgress], None]] = None,
+        lazy: Optional[bool] = None,
+        engine: Optional[str] = None,
+    ):
+        """
+        Args:
+            stall_timeout: Seconds without any parser progress before the
+                parse is aborted (defaults to FC26_PARSER_STALL_TIMEOUT or 60).
+                There is no wall-clock limit while the parser makes progress.
+            batch_size: Max rows per streamed message
+            use_worker: Reuse a persistent parser worker instead of spawning
+                `node parse_save.js` for every parse
+            cache: Parse cache (defaults to data/parse_cache)
+            jobs: Threads used to parse the save's databases in parallel
+                (defaults to FC26_PARSER_JOBS, else one per core; 1 = serial)
+            progress_callback: Called with the ParseProgress after every
+                parser progress event (e.g. to drive a progress bar)
+            lazy: Read the save one database segment at a time instead of
+                loading it whole, skipping segments without projected tables
+                (defaults to FC26_PARSER_LAZY)
+            engine: "node" or "native" (defaults to FC26_PARSER_ENGINE, else node)
+
+        Raises:
+            ValueError: If the engine is unknown
+        """
         self.parser_dir = Path(__file__).parent.parent.parent / "parser"
         self.parser_script = self.parser_dir / "parse_save.js"
         self.output_file = self.parser_dir / "output" / "test_parse.json"
+        self.columnar_dir = self.parser_dir / "output" / "columnar"
+        if stall_timeout is None:
+            stall_timeout = float(
+                os.getenv("FC26_PARSER_STALL_TIMEOUT", DEFAULT_STALL_TIMEOUT)
+            )
+        self.stall_timeout = stall_timeout
+        self.batch_size = batch_size
+        self.use_worker = use_worker
+        self.worker = ParserWorker(self.parser_dir)
+        self.cache = cache or ParseCache()
+        if jobs is None and os.getenv("FC26_PARSER_JOBS"):
+            jobs = int(os.getenv("FC26_PARSER_JOBS"))
+        self.jobs = jobs
+        self.progress_callback = progress_callback
+        self.progress = ParseProgress()
+        if lazy is None:
+            lazy = os.getenv("FC26_PARSER_LAZY", "").lower() in ("1", "true", "yes")
+        self.lazy = lazy
+        engine = engine or os.getenv("FC26_PARSER_ENGINE", "node")
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown parser engine: {engine} (expected one of {ENGINES})")
+        self.engine = engine
+
+    @staticmethod
+    def resolve_save_path(save_path: str = None) -> Optional[str]:
+        """Save path as the parser will see it (.env default if not provided)"""
+        if save_path:
+            return save_path
+        saves_dir = os.getenv("FC26_SAVES_PATH")
+        if saves_dir:
+            return str(Path(saves_dir) / DEFAULT_SAVE_NAME)
+        return None
+
+    def _build_command(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        columnar_dir: Optional[Path] = None,
+    ) -> List[str]:
+        """Build the node command line for stream mode."""
+        cmd = ["node", str(self.parser_script)]
+        if save_path:
+            cmd.append(save_path)
+            print(f"Using save file: {save_path}")
+        cmd += ["--stream", "--progress", "--batch-size", str(self.batch_size)]
+        if self.jobs is not None:
+            cmd += ["--jobs", str(self.jobs)]
+        if self.lazy:
+            cmd.append("--lazy")
+        if projection is not None:
+            cmd += ["--projection", dump_projection(projection)]
+        if columnar_dir is not None:
+            cmd += ["--columnar", str(columnar_dir)]
+        return cmd
 
-    def parse_save(self, save_path: str = None) -> Dict[str, Any]:
+    def _iter_messages(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Parse FC 26 save file using Node.js parser.
+        Parse a save and yield its table messages as they are serialized.
+
+        Each message is {"type": "table", "db": int, "table": str, "rows": list}.
+        When a projection is given, the parser drops everything else before
+        serializing; tables or columns that still slip through are dropped here.
+        With use_cache, Node.js parses are served from / stored in the parse
+        cache by save hash; the native reader caches table by table instead
+        (see _iter_native_messages()), so each path has one cache layer.
+
+        Raises:
+            RuntimeError: If parser fails, times out or its stream is truncated
+            FileNotFoundError: If parser script not found
+        """
+        cache_key = None
+        resolved_path = self.resolve_save_path(save_path)
+        if use_cache and self.engine == "node" and resolved_path and os.path.isfile(resolved_path):
+            start = time.perf_counter()
+            file_hash = self.cache.hash_file(resolved_path)
+            cache_key = self.cache.make_key(file_hash, PARSER_MODE, projection)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"Parse cache hit for {resolved_path} ({elapsed_ms:.0f} ms)")
+                for table in cached:
+                    yield {"type": "table", **table}
+                return
+
+        if self.engine == "native":
+            messages = self._iter_native_messages(resolved_path, projection, use_cache)
+        else:
+            messages = self._iter_parser_messages(save_path, projection)
+
+        if cache_key is None:
+            yield from messages
+            return
+
+        # Cache miss: every batch is written to the entry as it streams by,
+        # so the save is never held in memory; the entry is published once
+        # the stream is complete
+        writer = self.cache.new_rows_writer(cache_key)
+        try:
+            for message in messages:
+                writer.add(message["db"], message["table"], message["rows"])
+                yield message
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+
+    def _iter_parser_messages(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        columnar_dir: Optional[Path] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run the parser (worker or one-shot) and validate its stream.
+
+        With columnar_dir, the parser writes columnar files there and the
+        stream carries only the end marker. Progress events update
+        self.progress and are not yielded.
+        """
+        self.progress = ParseProgress(self.progress_callback)
+        if self.use_worker:
+            messages = self._iter_worker_messages(save_path, projection, columnar_dir)
+        else:
+            messages = self._iter_process_messages(save_path, projection, columnar_dir)
+
+        ended = False
+        for message in messages:
+            if message.get("type") in PROGRESS_TYPES:
+                self.progress.update(message)
+                continue
+            if message.get("type") == "end":
+                ended = True
+                print(
+                    f"Parser produced {message.get('tableCount', 0)} tables "
+                    f"({message.get('totalRecords', 0)} records)"
+                )
+                continue
+            if projection is not None:
+                message = self._project_message(message, projection)
+                if message is None:
+                    continue
+            yield message
+
+        if not ended:
+            raise RuntimeError("Parser output stream ended unexpectedly")
+
+        print(f"Parser completed successfully ({self.progress.describe()})")
+
+    def _iter_native_messages(
+        self,
+        save_path: Optional[str],
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Decode the save in-process with the native reader.
+
+        Only projected tables and columns are decoded; messages have the
+        same shape as the Node.js parser's. With use_cache, every table is
+        fingerprinted and only tables whose bytes changed since they were
+        last decoded (e.g. by the previous save of the same career) are
+        decoded again; the others come from the parse cache. Saves with
+        projected tables the native reader cannot decode (compressed strings)
+        are parsed by the Node.js parser instead.
+
+        Raises:
+            FileNotFoundError: If the save file does not exist
+        """
+        if not save_path or not os.path.isfile(save_path):
+            raise FileNotFoundError(f"Save file not found at: {save_path}")
+
+        with SaveReader(save_path, PARSER_MODE) as reader:
+            compressed = reader.compressed_tables(projection)
+        if compressed:
+            print(
+                f"Native reader cannot decode compressed strings ({', '.join(compressed)}); "
+                "using the Node.js parser"
+            )
+            yield from self._iter_parser_messages(save_path, projection)
+            return
+
+        print(f"Reading save natively: {save_path}")
+        self.progress = ParseProgress(self.progress_callback)
+        start = time.perf_counter()
+        table_count = total_records = decoded = 0
+
+        with SaveReader(save_path, PARSER_MODE) as reader:
+            for db, table_name, segment, columns in reader.iter_segments(projection):
+                rows = None
+                if use_cache:
+                    table_key = self.cache.make_table_key(
+                        segment.fingerprint(table_name), PARSER_MODE, table_name, columns
+                    )
+                    rows = self.cache.get_table(table_key)
+                if rows is None:
+                    rows = segment.table(table_name).to_rows(columns)
+                    decoded += 1
+                    if use_cache:
+                        self.cache.put_table(table_key, rows)
+
+                table_count += 1
+                total_records += len(rows)
+                elapsed = time.perf_counter() - start
+                self.progress.update(
+                    {
+                        "type": "progress",
+                        "stage": "decode",
+                        "tablesParsed": table_count,
+                        "rows": total_records,
+                        "rowsPerSec": int(total_records / elapsed) if elapsed else None,
+                        "elapsed": elapsed,
+                    }
+                )
+                yield {"type": "table", "db": db, "table": table_name, "rows": rows}
+
+        if use_cache:
+            self.cache.evict()
+            print(
+                f"Decoded {decoded} changed tables, "
+                f"{table_count - decoded} unchanged served from cache"
+            )
+        print(f"Native reader produced {table_count} tables ({total_records} records)")
+
+    def read_table(
+        self,
+        table_name: str,
+        save_path: str = None,
+        columns: Optional[List[str]] = None,
+        db: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Decode a single table with the native reader, without touching the rest.
 
         Args:
+            table_name: Table to read
             save_path: Path to save file (optional, uses .env default if not provided)
+            columns: Columns to decode (all if not provided)
+            db: Database index (defaults to the last one holding the table)
 
         Returns:
-            Dictionary with parsed tables
+            {column: numpy array}
 
         Raises:
-            RuntimeError: If parser fails
-            FileNotFoundError: If parser script or output not found
+            FileNotFoundError: If the save file does not exist
+            KeyError: If the table is not in the save
+        """
+        resolved_path = self.resolve_save_path(save_path)
+        if not resolved_path or not os.path.isfile(resolved_path):
+            raise FileNotFoundError(f"Save file not found at: {resolved_path}")
+
+        with SaveReader(resolved_path, PARSER_MODE) as reader:
+            return reader.table(table_name, db).read(columns)
+
+    def _iter_worker_messages(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        columnar_dir: Optional[Path] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run the parse on the persistent worker."""
+        print("Calling Node.js parser worker...")
+        if save_path:
+            print(f"Using save file: {save_path}")
+
+        request = {
+            "cmd": "parse",
+            "savePath": save_path,
+            "projection": projection,
+            "batchSize": self.batch_size,
+            "progress": True,
+            "lazy": self.lazy,
+        }
+        if self.jobs is not None:
+            request["jobs"] = self.jobs
+        if columnar_dir is not None:
+            request["columnar"] = str(columnar_dir)
+        yield from self.worker.request(request, stall_timeout=self.stall_timeout)
+
+    def _iter_process_messages(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        columnar_dir: Optional[Path] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run `node parse_save.js --stream` once and yield its NDJSON messages.
+
+        Progress events are read from the parser's stderr as they arrive; its
+        other log lines are passed through to our stderr. The parser is killed
+        if it sends no progress, table or end message for stall_timeout
+        seconds (heartbeats and log lines do not count).
         """
         print("Calling Node.js parser...")
 
@@ -39,59 +417,296 @@ class ParserBridge:
         if not self.parser_script.exists():
             raise FileNotFoundError(f"Parser script not found: {self.parser_script}")
 
-        # Build command with save_path if provided
-        cmd = ["node", str(self.parser_script)]
-        if save_path:
-            cmd.append(save_path)
-            print(f"Using save file: {save_path}")
+        cmd = self._build_command(save_path, projection, columnar_dir)
 
-        # Call Node.js parser
         try:
-            # Run parser script
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
                 cwd=str(self.parser_dir),
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding="utf-8",
-                timeout=60,  # 60 second timeout
             )
+        except Exception as e:
+            raise RuntimeError(f"Failed to run parser: {e}")
 
-            # Check if parser succeeded
-            if result.returncode != 0:
-                print("Parser failed!")
-                print("STDOUT:", result.stdout)
-                print("STDERR:", result.stderr)
-                raise RuntimeError(f"Parser exited with code {result.returncode}")
+        watchdog = StallWatchdog(self.stall_timeout, process.kill)
+        stderr_reader = threading.Thread(
+            target=self._read_stderr, args=(process, watchdog), daemon=True
+        )
 
-            print("Parser completed successfully")
-            print(result.stdout)  # Show parser output
+        with watchdog:
+            stderr_reader.start()
+            try:
+                for line in process.stdout:
+                    if line.strip():
+                        message = json.loads(line)
+                        watchdog.observe(message)
+                        yield message
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Parser timed out after 60 seconds")
-        except Exception as e:
-            raise RuntimeError(f"Failed to run parser: {e}")
+                returncode = process.wait()
+            finally:
+                if process.poll() is None:
+                    # Consumer stopped early: don't leave the parser running
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+                stderr_reader.join(timeout=5)
+
+        if watchdog.stalled.is_set():
+            raise RuntimeError(
+                f"Parser stalled: no progress for {self.stall_timeout:g} seconds"
+            )
+
+        # Check if parser succeeded
+        if returncode != 0:
+            print("Parser failed!")
+            raise RuntimeError(f"Parser exited with code {returncode}")
+
+    def _read_stderr(self, process: subprocess.Popen, watchdog: StallWatchdog):
+        """Reader thread: progress events to self.progress, logs to our stderr"""
+        for line in process.stderr:
+            if line.startswith("{"):
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = None
+                if isinstance(event, dict) and event.get("type") in PROGRESS_TYPES:
+                    watchdog.observe(event)
+                    self.progress.update(event)
+                    continue
+            sys.stderr.write(line)
+        process.stderr.close()
 
-        # Read JSON output
-        if not self.output_file.exists():
-            raise FileNotFoundError(f"Parser output not found: {self.output_file}")
+    @staticmethod
+    def _project_message(
+        message: Dict[str, Any], projection: Projection
+    ) -> Optional[Dict[str, Any]]:
+        """Apply the projection to one table message (None if table is dropped)."""
+        table_name = message["table"]
+        if table_name not in projection:
+            return None
 
-        print(f"Reading parsed data from: {self.output_file}")
+        columns = projection[table_name]
+        rows = message["rows"]
+        # Parser already projected this batch: skip the copy
+        if columns is None or not rows or set(rows[0]) <= set(columns):
+            return message
+
+        return {**message, "rows": project_rows(rows, columns)}
+
+    def iter_tables(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Iterator[Tuple[str, List[dict]]]:
+        """
+        Stream parsed tables as they are serialized by the Node.js parser.
 
-        with open(self.output_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        Large tables arrive in several row batches, so the same table name
+        can be yielded more than once.
+
+        Args:
+            save_path: Path to save file (optional, uses .env default if not provided)
+            projection: Tables/columns to keep (optional, keeps everything if not provided)
+            use_cache: Serve unchanged saves from the parse cache
+
+        Yields:
+            (table_name, rows) tuples
+        """
+        for _, table_name, rows in self.iter_database_tables(save_path, projection, use_cache):
+            yield table_name, rows
 
-        # Merge list of databases if necessary
-        if isinstance(data, list):
-            merged_data = {}
-            for db in data:
-                merged_data.update(db)
-            data = merged_data
+    def iter_database_tables(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Iterator[Tuple[int, str, List[dict]]]:
+        """
+        Like iter_tables(), with the index of the database each batch comes
+        from (feed a TableMerger to get the same tables as merge_save()).
+
+        Yields:
+            (db, table_name, rows) tuples
+        """
+        for message in self._iter_messages(save_path, projection, use_cache):
+            yield message["db"], message["table"], message["rows"]
+
+    def merge_save(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> TableMerger:
+        """
+        Parse a save and merge its databases, keeping provenance.
+
+        Args:
+            save_path: Path to save file (optional, uses .env default if not provided)
+            projection: Tables/columns to keep (optional, keeps everything if not provided)
+            use_cache: Serve unchanged saves from the parse cache
+
+        Returns:
+            TableMerger with merged tables, source_db and duplicate-table conflicts
+
+        Raises:
+            RuntimeError: If parser fails
+            FileNotFoundError: If parser script not found
+        """
+        merger = TableMerger()
+        for message in self._iter_messages(save_path, projection, use_cache):
+            merger.add(message["db"], message["table"], message["rows"])
+
+        merger.report()
+        return merger
+
+    def parse_save(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Parse FC 26 save file using Node.js parser.
+
+        Args:
+            save_path: Path to save file (optional, uses .env default if not provided)
+            projection: Tables/columns to keep (optional, keeps everything if not provided)
+            use_cache: Serve unchanged saves from the parse cache
+
+        Returns:
+            Dictionary with parsed tables (later database wins for duplicate
+            names; use merge_save() to get the shadowed tables too)
+
+        Raises:
+            RuntimeError: If parser fails
+            FileNotFoundError: If parser script not found
+        """
+        data = self.merge_save(save_path, projection, use_cache).tables
 
         print(f"Loaded {len(data)} tables from parser output")
 
         return data
 
+    def read_output(self, path: Optional[Path] = None) -> TableMerger:
+        """
+        Read a JSON file written by `node parse_save.js` (pretty, compact or
+        compressed) with its merge provenance.
+
+        Args:
+            path: Output file (defaults to the newest of test_parse.json[.gz|.zst])
+
+        Returns:
+            TableMerger rebuilt from the file (see TableMerger.from_output())
+
+        Raises:
+            FileNotFoundError: If no parser output exists
+        """
+        if path is None:
+            candidates = [
+                candidate
+                for candidate in (
+                    self.output_file,
+                    self.output_file.with_name(self.output_file.name + ".gz"),
+                    self.output_file.with_name(self.output_file.name + ".zst"),
+                )
+                if candidate.exists()
+            ]
+            if not candidates:
+                raise FileNotFoundError(f"Parser output not found: {self.output_file}")
+            path = max(candidates, key=lambda candidate: candidate.stat().st_mtime)
+
+        print(f"Reading parsed data from: {path}")
+
+        with open_output(path) as f:
+            merger = TableMerger.from_output(json.load(f))
+
+        merger.report()
+        return merger
+
+    def load_output(self, path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Load the tables of a JSON file written by `node parse_save.js`.
+
+        Args:
+            path: Output file (defaults to the newest of test_parse.json[.gz|.zst])
+
+        Returns:
+            Dictionary with parsed tables (databases merged, later wins)
+
+        Raises:
+            FileNotFoundError: If no parser output exists
+        """
+        data = self.read_output(path).tables
+
+        print(f"Loaded {len(data)} tables from parser output")
+
+        return data
+
+    def parse_columnar(
+        self,
+        save_path: str = None,
+        projection: Optional[Projection] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, ColumnarTable]:
+        """
+        Parse a save into columnar tables (memory-mapped, read zero-copy).
+
+        The parser writes typed column files straight into the parse cache,
+        so a cache hit only opens the existing files. This always runs the
+        Node.js parser; the native engine exposes columns via read_table().
+
+        Args:
+            save_path: Path to save file (optional, uses .env default if not provided)
+            projection: Tables/columns to keep (optional, keeps everything if not provided)
+            use_cache: Serve unchanged saves from the parse cache
+
+        Returns:
+            Mapping of table name to ColumnarTable
+
+        Raises:
+            RuntimeError: If parser fails
+            FileNotFoundError: If parser script not found
+        """
+        cache_key = None
+        resolved_path = self.resolve_save_path(save_path)
+        if use_cache and resolved_path and os.path.isfile(resolved_path):
+            start = time.perf_counter()
+            file_hash = self.cache.hash_file(resolved_path)
+            cache_key = self.cache.make_key(
+                file_hash, PARSER_MODE, projection, fmt="columnar"
+            )
+            tables = self.cache.get_columnar(cache_key)
+            if tables is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"Parse cache hit for {resolved_path} ({elapsed_ms:.0f} ms)")
+                return tables
+
+        if cache_key is not None:
+            output_dir = self.cache.new_columnar_dir(cache_key)
+        else:
+            output_dir = self.columnar_dir
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        try:
+            for _ in self._iter_parser_messages(save_path, projection, output_dir):
+                pass
+        except Exception:
+            if cache_key is not None:
+                shutil.rmtree(output_dir, ignore_errors=True)
+            raise
+
+        if cache_key is not None:
+            tables = self.cache.commit_columnar(cache_key, output_dir)
+        else:
+            tables = load_columnar(output_dir)
+
+        print(f"Loaded {len(tables)} columnar tables")
+        return tables
+
 
 # Singleton instance
 parser_bridge = ParserBridge()
@@ -0,0 +1,234 @@
+"""
+Persistent Node.js parser worker.
+Keeps parser/parser_worker.js running so imports skip Node startup and module load.
+"""
+
+import atexit
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+
+from src.core.progress import ACTIVITY_TYPES
+
+
+class ParserWorker:
+    """
+    Long-lived parser process driven over a stdin/stdout NDJSON protocol.
+
+    The worker is started lazily on the first request, health-checked with
+    ping, and restarted automatically if it dies or stops responding.
+    """
+
+    def __init__(
+        self,
+        parser_dir: Path,
+        startup_timeout: float = 30,
+        ping_timeout: float = 5,
+    ):
+        """
+        Initialize worker handle (does not start the process)
+
+        Args:
+            parser_dir: Directory containing parser_worker.js
+            startup_timeout: Seconds to wait for the worker's ready message
+            ping_timeout: Seconds to wait for a health check reply
+        """
+        self.parser_dir = parser_dir
+        self.worker_script = parser_dir / "parser_worker.js"
+        self.startup_timeout = startup_timeout
+        self.ping_timeout = ping_timeout
+
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        atexit.register(self.close)
+
+    # Lifecycle
+    def is_alive(self) -> bool:
+        """True if the worker process is running"""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """
+        Start the worker and wait for its ready message.
+
+        Raises:
+            FileNotFoundError: If worker script not found
+            RuntimeError: If the worker fails to start
+        """
+        if not self.worker_script.exists():
+            raise FileNotFoundError(f"Worker script not found: {self.worker_script}")
+
+        try:
+            self.process = subprocess.Popen(
+                ["node", str(self.worker_script)],
+                cwd=str(self.parser_dir),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to start parser worker: {e}")
+
+        # Fresh queue so stale messages from a dead worker are never read
+        self._messages = queue.Queue()
+        threading.Thread(
+            target=self._read_stdout,
+            args=(self.process, self._messages),
+            daemon=True,
+        ).start()
+
+        message = self._next_message(self.startup_timeout)
+        if message is None or message.get("type") != "ready":
+            self._kill()
+            raise RuntimeError("Parser worker did not become ready")
+
+        print(f"Parser worker started (pid {message.get('pid')})")
+
+    def restart(self):
+        """Kill and start the worker again"""
+        self._kill()
+        self.restarts += 1
+        print(f"Restarting parser worker (restart #{self.restarts})...")
+        self.start()
+
+    def close(self):
+        """Ask the worker to exit, killing it if it does not comply"""
+        if not self.is_alive():
+            return
+        try:
+            self._send({"id": next(self._ids), "cmd": "shutdown"})
+            self.process.wait(timeout=5)
+        except Exception:
+            self._kill()
+
+    def _kill(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+    # Protocol
+    @staticmethod
+    def _read_stdout(process: subprocess.Popen, messages: queue.Queue):
+        """
+        Reader thread: move worker stdout lines into the message queue.
+
+        Lines that are not JSON (stray output of the worker or a dependency)
+        are echoed to stderr and skipped; the EOF sentinel is always queued,
+        so a dying reader never leaves the caller waiting for a stall.
+        """
+        try:
+            for line in process.stdout:
+                if not line.strip():
+                    continue
+                try:
+                    messages.put(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"[parser worker] {line.rstrip()}", file=sys.stderr)
+        finally:
+            messages.put(None)  # EOF: worker exited
+
+    def _send(self, request: Dict[str, Any]):
+        self.process.stdin.write(json.dumps(request) + "\n")
+        self.process.stdin.flush()
+
+    def _next_message(self, timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Next worker message; None on EOF. Raises queue.Empty on timeout."""
+        return self._messages.get(timeout=timeout)
+
+    def ping(self) -> bool:
+        """
+        Health check: True if the worker answers a ping within ping_timeout
+        """
+        if not self.is_alive():
+            return False
+
+        with self._lock:
+            request_id = next(self._ids)
+            try:
+                self._send({"id": request_id, "cmd": "ping"})
+                deadline = time.monotonic() + self.ping_timeout
+                while True:
+                    message = self._next_message(deadline - time.monotonic())
+                    if message is None:
+                        return False
+                    if message.get("id") == request_id:
+                        return message.get("type") == "pong"
+            except (queue.Empty, ValueError, OSError):
+                return False
+
+    def ensure_running(self):
+        """Start the worker, or restart it if it is dead or unresponsive"""
+        if self.process is None:
+            self.start()
+        elif not self.ping():
+            self.restart()
+
+    def request(
+        self, payload: Dict[str, Any], stall_timeout: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Send a request and yield its response messages until "end".
+
+        Args:
+            payload: Request body (cmd and arguments)
+            stall_timeout: Max seconds without progress, table or end
+                messages; heartbeats do not count (None waits forever)
+
+        Yields:
+            Response messages tagged with this request's id
+
+        Raises:
+            RuntimeError: On worker error, crash or stall
+        """
+        self.ensure_running()
+
+        with self._lock:
+            request_id = next(self._ids)
+            self._send({**payload, "id": request_id})
+
+            finished = False
+            last_activity = time.monotonic()
+            try:
+                while True:
+                    timeout = None
+                    if stall_timeout is not None:
+                        timeout = max(0.0, last_activity + stall_timeout - time.monotonic())
+                    try:
+                        message = self._next_message(timeout)
+                    except queue.Empty:
+                        raise RuntimeError(
+                            f"Parser stalled: no progress for {stall_timeout} seconds"
+                        )
+
+                    if message is None:
+                        raise RuntimeError("Parser worker exited unexpectedly")
+                    if message.get("id") != request_id:
+                        continue  # Late reply to an abandoned request
+                    if message.get("type") in ACTIVITY_TYPES:
+                        last_activity = time.monotonic()
+                    if message["type"] == "error":
+                        finished = True
+                        raise RuntimeError(f"Parser failed: {message['message']}")
+
+                    yield message
+
+                    if message["type"] == "end":
+                        finished = True
+                        return
+            finally:
+                if not finished:
+                    # Crash, stall or consumer stopped early: the worker may
+                    # still be busy, so replace it rather than reuse it
+                    self._kill()
@@ -0,0 +1,138 @@
+"""
+Live parser progress and stall detection.
+Consumes the parser's progress events (see parser/lib/progress.js).
+"""
+
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+
+# Message types that carry progress rather than table data
+PROGRESS_TYPES = ("progress", "heartbeat")
+
+# Message types that prove the parse is moving. Heartbeats are sent from a
+# timer whenever the parser's event loop is idle, including while a parse
+# thread hangs, so they only refresh the display.
+ACTIVITY_TYPES = ("progress", "table", "end")
+
+# Default seconds without parser progress before it is considered stalled
+DEFAULT_STALL_TIMEOUT = 60
+
+
+class ParseProgress:
+    """
+    State of the running parse, updated from parser events.
+
+    Tracks the current stage, its counters and the throughput, and calls
+    the optional callback after every event (e.g. to drive a progress bar).
+    """
+
+    def __init__(self, callback: Optional[Callable[["ParseProgress"], None]] = None):
+        """
+        Args:
+            callback: Called with this object after each event
+        """
+        self.callback = callback
+        self.stage: Optional[str] = None
+        self.counters: Dict[str, Any] = {}
+        self.elapsed = 0.0
+        self.events = 0
+
+    def update(self, event: Dict[str, Any]):
+        """Apply one progress or heartbeat event"""
+        self.events += 1
+        self.elapsed = event.get("elapsed", self.elapsed)
+        if event.get("type") == "progress":
+            if event.get("stage") != self.stage:
+                self.stage = event.get("stage")
+                self.counters = {}
+            self.counters.update(
+                {
+                    key: value
+                    for key, value in event.items()
+                    if key not in ("id", "type", "stage", "elapsed")
+                }
+            )
+        if self.callback is not None:
+            self.callback(self)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction of the current stage, if the parser knows the total"""
+        if self.stage == "read" and self.counters.get("totalBytes"):
+            return self.counters["bytesRead"] / self.counters["totalBytes"]
+        if self.stage == "parse" and self.counters.get("totalDatabases"):
+            return self.counters.get("databasesParsed", 0) / self.counters["totalDatabases"]
+        return None
+
+    @property
+    def rows_per_sec(self) -> Optional[int]:
+        """Row throughput reported for the current stage"""
+        return self.counters.get("rowsPerSec")
+
+    def describe(self) -> str:
+        """One-line summary, e.g. 'stream: 12 tables, 52,000 rows (48,000 rows/s)'"""
+        counters = self.counters
+        if self.stage == "read":
+            text = f"read: {counters.get('bytesRead', 0) / 1048576:.1f} MB"
+        elif self.stage == "parse":
+            text = (
+                f"parse: {counters.get('databasesParsed', 0)}/"
+                f"{counters.get('totalDatabases', '?')} databases"
+            )
+        elif self.stage is not None:
+            text = (
+                f"{self.stage}: {counters.get('tablesParsed', 0)} tables, "
+                f"{counters.get('rows', 0):,} rows"
+            )
+            if self.rows_per_sec:
+                text += f" ({self.rows_per_sec:,} rows/s)"
+        else:
+            text = "starting"
+        return f"{text} [{self.elapsed:.1f}s]"
+
+
+class StallWatchdog:
+    """
+    Calls on_stall when touch() has not been called for stall_timeout seconds.
+
+    Replaces a fixed wall-clock timeout: a parse may take as long as it
+    needs, as long as the parser keeps reporting progress. Feed parser
+    messages through observe() so heartbeats and log lines do not count.
+    """
+
+    def __init__(self, stall_timeout: float, on_stall: Callable[[], None]):
+        """
+        Args:
+            stall_timeout: Seconds without activity before on_stall is called
+            on_stall: Called once, from the watchdog thread
+        """
+        self.stall_timeout = stall_timeout
+        self.on_stall = on_stall
+        self.stalled = threading.Event()
+        self._last_activity = time.monotonic()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+
+    def touch(self):
+        """Record parser activity"""
+        self._last_activity = time.monotonic()
+
+    def observe(self, message: Any):
+        """Record activity if a parser message shows progress (see ACTIVITY_TYPES)"""
+        if isinstance(message, dict) and message.get("type") in ACTIVITY_TYPES:
+            self.touch()
+
+    def _watch(self):
+        while not self._stopped.wait(min(1.0, self.stall_timeout)):
+            if time.monotonic() - self._last_activity > self.stall_timeout:
+                self.stalled.set()
+                self.on_stall()
+                return
+
+    def __enter__(self) -> "StallWatchdog":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopped.set()
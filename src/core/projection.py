@@ -0,0 +1,55 @@
+"""
+Table projection shared by parse_save.js and ParserBridge.
+Lists the tables (and columns per table) to keep from a parsed save.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+# Spec read by both sides; see parser/projection.json
+PROJECTION_FILE = Path(__file__).parent.parent.parent / "parser" / "projection.json"
+
+# Table name -> columns to keep (None keeps every column)
+Projection = Dict[str, Optional[List[str]]]
+
+
+def load_projection(path: Path = PROJECTION_FILE) -> Projection:
+    """
+    Load a projection spec from JSON.
+
+    Args:
+        path: Spec file (defaults to the importer projection)
+
+    Returns:
+        Mapping of table name to column list
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_projection(projection: Projection) -> str:
+    """Serialize a projection as compact, canonical JSON (stable across runs)."""
+    return json.dumps(projection, sort_keys=True, separators=(",", ":"))
+
+
+def project_rows(
+    rows: List[Dict[str, Any]], columns: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """
+    Keep only the given columns of each row.
+
+    Args:
+        rows: Table rows
+        columns: Columns to keep (None keeps the rows untouched)
+
+    Returns:
+        Projected rows
+    """
+    if columns is None:
+        return rows
+    return [{c: row[c] for c in columns if c in row} for row in rows]
+
+
+# Tables and columns consumed by SaveImporter
+IMPORT_PROJECTION: Projection = load_projection()
@@ -5,6 +5,8 @@ Query Router - Decide se usa SQL direto ou Gemini.
 from typing import Tuple, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from src.database.models import Player
+from src.database.queries import count_players, player_views
+from src.database.search import search_players
 import re
 
 
@@ -69,7 +71,7 @@ class QueryRouter:
 
     # SQL Handlers
     def _handle_count_players(self, match, query: str) -> str:
-        count = self.db.query(Player).count()
+        count = count_players(self.db)
         return f"Há **{count} jogadores** no seu save."
 
     def _handle_top_players(self, match, query: str) -> str:
@@ -77,11 +79,8 @@ class QueryRouter:
         top_match = re.search(r"top (\d+)", query)
         limit = int(top_match.group(1)) if top_match else 5
 
-        players = (
-            self.db.query(Player)
-            .order_by(Player.overallrating.desc())
-            .limit(limit)
-            .all()
+        players = player_views(
+            self.db, order_by=[Player.overallrating.desc()], limit=limit
         )
 
         result = f"**Top {limit} Jogadores:**\n\n"
@@ -92,11 +91,10 @@ class QueryRouter:
 
     def _handle_rating_above(self, match, query: str) -> str:
         threshold = int(match.group(1))
-        players = (
-            self.db.query(Player)
-            .filter(Player.overallrating >= threshold)
-            .order_by(Player.overallrating.desc())
-            .all()
+        players = player_views(
+            self.db,
+            Player.overallrating >= threshold,
+            order_by=[Player.overallrating.desc()],
         )
 
         result = (
@@ -111,33 +109,24 @@ class QueryRouter:
         return result
 
     def _handle_young_players(self, match, query: str) -> str:
-        players = (
-            self.db.query(Player)
-            .filter(Player.age <= 21)
-            .order_by(Player.potential.desc())
-            .limit(10)
-            .all()
+        players = player_views(
+            self.db, Player.age <= 21, order_by=[Player.potential.desc()], limit=10
         )
 
         result = "**Jogadores Jovens (≤21 anos) com Alto Potencial:**\n\n"
         for p in players:
-            growth = p.potential - p.overallrating if p.potential else 0
-            result += f"- {p.display_name} ({p.age} anos): OVR {p.overallrating} → POT {p.potential} (+{growth})\n"
+            result += f"- {p.display_name} ({p.age} anos): OVR {p.overallrating} → POT {p.potential} (+{p.growth_potential})\n"
 
         return result
 
     def _handle_age_below(self, match, query: str) -> str:
         max_age = int(match.group(1))
-        count = self.db.query(Player).filter(Player.age < max_age).count()
+        count = count_players(self.db, Player.age < max_age)
         return f"Há **{count} jogadores** com menos de {max_age} anos."
 
     def _handle_old_players(self, match, query: str) -> str:
-        players = (
-            self.db.query(Player)
-            .filter(Player.age >= 35)
-            .order_by(Player.age.desc())
-            .limit(10)
-            .all()
+        players = player_views(
+            self.db, Player.age >= 35, order_by=[Player.age.desc()], limit=10
         )
 
         result = "**Jogadores Veteranos (≥35 anos):**\n\n"
@@ -147,34 +136,27 @@ class QueryRouter:
         return result if players else "Nenhum jogador com 35+ anos encontrado."
 
     def _handle_high_potential(self, match, query: str) -> str:
-        players = (
-            self.db.query(Player)
-            .filter(Player.potential >= 85)
-            .order_by(Player.potential.desc())
-            .limit(10)
-            .all()
+        players = player_views(
+            self.db, Player.potential >= 85, order_by=[Player.potential.desc()], limit=10
         )
 
         result = "**Jogadores com Alto Potencial (≥85):**\n\n"
         for p in players:
-            growth = p.potential - p.overallrating
-            result += f"- {p.display_name}: OVR {p.overallrating} → POT {p.potential} (+{growth})\n"
+            result += f"- {p.display_name}: OVR {p.overallrating} → POT {p.potential} (+{p.growth_potential})\n"
 
         return result
 
     def _handle_potential_above(self, match, query: str) -> str:
         threshold = int(match.group(1))
-        count = self.db.query(Player).filter(Player.potential >= threshold).count()
+        count = count_players(self.db, Player.potential >= threshold)
         return f"Há **{count} jogadores** com potencial ≥ {threshold}."
 
     def _handle_player_info(self, match, query: str) -> str:
-        # Buscar jogador por nome (parcial)
+        # Buscar jogador por nome (prefixo, sem acentos)
         name = match.group(1)
-        player = (
-            self.db.query(Player).filter(Player.display_name.ilike(f"%{name}%")).first()
-        )
+        players = search_players(self.db, name, limit=1)
 
-        if not player:
+        if not players:
             return None  # Fallback to Gemini
 
-        return player.detailed_display()
+        return players[0].detailed_display
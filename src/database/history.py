@@ -0,0 +1,125 @@
+"""
+Point-in-time and evolution queries over the snapshot history.
+
+player_history only holds a player's row when it changed, so the squad as
+of snapshot S is, per player, the latest row with snapshot_id <= S (unless
+that row marks the player as removed). The timeline index on (playerid,
+snapshot_id, removed, row_hash) answers the "latest row" step from the
+index alone; evolution queries read one player's slice of it.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.database.models import PlayerHistory, Snapshot
+from src.database.models.snapshot import HISTORY_COLUMNS
+from src.database.queries import LIST_COLUMNS, PlayerView
+
+
+def latest_snapshot_id(db: Session) -> Optional[int]:
+    """Id of the most recent snapshot (None before the first import)"""
+    return db.query(func.max(Snapshot.id)).scalar()
+
+
+def latest_snapshot_ids(db: Session, count: int) -> List[int]:
+    """Ids of the count most recent snapshots, oldest first"""
+    ids = db.scalars(select(Snapshot.id).order_by(Snapshot.id.desc()).limit(count)).all()
+    return ids[::-1]
+
+
+def list_snapshots(db: Session) -> List[Snapshot]:
+    """Every snapshot, oldest first"""
+    return db.query(Snapshot).order_by(Snapshot.id).all()
+
+
+def select_state(
+    snapshot_id: int,
+    columns: Sequence[Any] = (),
+    include_removed: bool = False,
+) -> Select:
+    """
+    SELECT of every player's row as of a snapshot.
+
+    Args:
+        snapshot_id: Snapshot to reconstruct
+        columns: PlayerHistory columns (playerid plus HISTORY_COLUMNS and
+            row_hash by default)
+        include_removed: Also return the rows marking removed players
+    """
+    latest = (
+        select(
+            PlayerHistory.playerid,
+            func.max(PlayerHistory.snapshot_id).label("snapshot_id"),
+        )
+        .where(PlayerHistory.snapshot_id <= snapshot_id)
+        .group_by(PlayerHistory.playerid)
+        .subquery()
+    )
+    if not columns:
+        columns = [PlayerHistory.playerid]
+        columns += [PlayerHistory.__table__.c[name] for name in HISTORY_COLUMNS]
+        columns += [PlayerHistory.row_hash]
+
+    statement = select(*columns).join(
+        latest,
+        and_(
+            PlayerHistory.playerid == latest.c.playerid,
+            PlayerHistory.snapshot_id == latest.c.snapshot_id,
+        ),
+    )
+    if not include_removed:
+        statement = statement.where(PlayerHistory.removed.is_(False))
+    return statement
+
+
+def state_at(db: Session, snapshot_id: int) -> List[Row]:
+    """Every player present at a snapshot (playerid, HISTORY_COLUMNS, row_hash)"""
+    return list(db.execute(select_state(snapshot_id)).all())
+
+
+def players_at(
+    db: Session,
+    snapshot_id: int,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+) -> List[PlayerView]:
+    """
+    Players as of a snapshot, as PlayerViews.
+
+    order_by/limit take PlayerHistory columns (e.g.
+    PlayerHistory.overallrating.desc()).
+    """
+    columns = [PlayerHistory.__table__.c[column.key] for column in LIST_COLUMNS]
+    statement = select_state(snapshot_id, columns).order_by(*order_by)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return [PlayerView(*row) for row in db.execute(statement).all()]
+
+
+def player_evolution(db: Session, playerid: int) -> List[Row]:
+    """
+    A player's stored rows across snapshots, oldest first.
+
+    Only snapshots where the player changed (or was removed) appear; the
+    values hold until the next row.
+
+    Returns:
+        Rows of (snapshot_id, label, imported_at, removed, HISTORY_COLUMNS)
+    """
+    statement = (
+        select(
+            Snapshot.id.label("snapshot_id"),
+            Snapshot.label,
+            Snapshot.imported_at,
+            PlayerHistory.removed,
+            *(PlayerHistory.__table__.c[name] for name in HISTORY_COLUMNS),
+        )
+        .join(Snapshot, Snapshot.id == PlayerHistory.snapshot_id)
+        .where(PlayerHistory.playerid == playerid)
+        .order_by(PlayerHistory.snapshot_id)
+    )
+    return list(db.execute(statement).all())
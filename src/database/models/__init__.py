@@ -2,8 +2,23 @@
 Database models package.
 """
 
-from .base import Base, engine, SessionLocal, get_db
+from .base import Base, engine, SessionLocal, get_db, ensure_schema, profile_engine
 from .player import Player
 from .player_info import PlayerInfo
+from .squad_stats import SquadStats
+from .snapshot import Snapshot, PlayerHistory
+from . import player_search  # noqa: F401 (registers the FTS5 table DDL)
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db", "Player", "PlayerInfo"]
+__all__ = [
+    "Base",
+    "engine",
+    "SessionLocal",
+    "get_db",
+    "ensure_schema",
+    "profile_engine",
+    "Player",
+    "PlayerInfo",
+    "SquadStats",
+    "Snapshot",
+    "PlayerHistory",
+]
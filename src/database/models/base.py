@@ -2,8 +2,12 @@
 SQLAlchemy base configuration and database engine.
 """
 
+import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from typing import Dict
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -11,14 +15,92 @@ from sqlalchemy.orm import sessionmaker
 DB_DIR = Path(__file__).parent.parent.parent.parent / "data"
 DB_DIR.mkdir(exist_ok=True)
 
-DATABASE_URL = f"sqlite:///{DB_DIR}/fc26_career.db"
+DATABASE_URL = os.getenv("FC26_DATABASE_URL", f"sqlite:///{DB_DIR}/fc26_career.db")
+
+# PRAGMAs applied to every new connection, by profile (see profile_engine()):
+# - read: WAL so queries never wait on a writer, large page cache and
+#   memory-mapped reads for the info/query commands
+# - import: same durability as read (WAL with synchronous=NORMAL cannot
+#   corrupt the file on a crash or power loss, which matters now that it
+#   holds the snapshot history), with a bigger cache for the bulk writes
+# - safe: SQLite defaults (rollback journal, synchronous=FULL)
+SQLITE_PROFILES = {
+    "read": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # KiB (64 MB)
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms
+    },
+    "import": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -262144,  # KiB (256 MB)
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+}
+
+# Profile of the shared engine's connections (FC26_DB_PROFILE)
+DEFAULT_PROFILE = os.getenv("FC26_DB_PROFILE", "read")
+if DEFAULT_PROFILE not in SQLITE_PROFILES:
+    raise ValueError(
+        f"Unknown database profile: {DEFAULT_PROFILE} (expected one of {tuple(SQLITE_PROFILES)})"
+    )
+
+
+def _create_engine(profile: str) -> Engine:
+    """Engine whose new SQLite connections get the profile's PRAGMAs"""
+    bind = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},  # Needed for SQLite
+        echo=False,  # Set True for SQL logging during development
+    )
+
+    @event.listens_for(bind, "connect")
+    def _apply_profile(dbapi_connection, connection_record):
+        if bind.dialect.name != "sqlite":
+            return
+        cursor = dbapi_connection.cursor()
+        for pragma, value in SQLITE_PROFILES[profile].items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    return bind
+
 
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
-    echo=False,  # Set True for SQL logging during development
-)
+engine = _create_engine(DEFAULT_PROFILE)
+
+# Engines of the other profiles, created on first use
+_profile_engines: Dict[str, Engine] = {DEFAULT_PROFILE: engine}
+
+
+def profile_engine(name: str) -> Engine:
+    """
+    Engine over the same database whose connections use another profile
+    (e.g. "import").
+
+    Each profile has its own engine and pool, so a bulk import never
+    changes the PRAGMAs of connections other sessions are using.
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if name not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown database profile: {name} (expected one of {tuple(SQLITE_PROFILES)})"
+        )
+    if name not in _profile_engines:
+        _profile_engines[name] = _create_engine(name)
+    return _profile_engines[name]
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -39,10 +121,46 @@ def get_db():
         db.close()
 
 
+def ensure_schema(bind=engine):
+    """
+    Create missing tables and add columns missing from existing ones.
+
+    create_all() never alters an existing table, so columns added to a model
+    after the database was created are added with ALTER TABLE ... ADD COLUMN
+    (and filled from the SQL expression in their info["backfill"], if any),
+    indexes added to a model are created and the ones listed in the table's
+    info["retired_indexes"] are dropped. Only nullable columns without
+    server-side constraints can be added this way in SQLite, which is what
+    new model columns must be.
+    """
+    Base.metadata.create_all(bind=bind)
+
+    inspector = inspect(bind)
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            missing = [column for column in table.columns if column.name not in existing]
+            for column in missing:
+                column_type = column.type.compile(dialect=bind.dialect)
+                connection.exec_driver_sql(
+                    f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                )
+                print(f"Added column {table.name}.{column.name}")
+                backfill = column.info.get("backfill")
+                if backfill:
+                    connection.exec_driver_sql(
+                        f'UPDATE "{table.name}" SET "{column.name}" = {backfill}'
+                    )
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+            for name in table.info.get("retired_indexes", ()):
+                connection.exec_driver_sql(f'DROP INDEX IF EXISTS "{name}"')
+
+
 def init_db():
     """
     Initialize database by creating all tables.
-    Safe to call multiple times - only creates tables that don't exist.
+    Safe to call multiple times - only creates tables and columns that don't exist.
     """
-    Base.metadata.create_all(bind=engine)
+    ensure_schema()
     print(f"✅ Database initialized at: {DATABASE_URL}")
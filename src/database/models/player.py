@@ -3,12 +3,93 @@ Player model representing career_playergrowthuserseason table.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, CheckConstraint
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, CheckConstraint, Index, text
 from sqlalchemy.orm import validates, relationship
 from .base import Base
 
 
-class Player(Base):
+# Columns read by listings (PlayerView), appended to the listing indexes so
+# listing queries are answered from the index alone (playerid is the rowid)
+LISTING_INDEX_COLUMNS = (
+    "firstname",
+    "surname",
+    "commonname",
+    "overallrating",
+    "potential",
+    "age",
+    "preferredposition1",
+)
+
+
+def _default_growth_potential(context):
+    """growth_potential for rows inserted outside the importer"""
+    params = context.get_current_parameters()
+    potential, overall = params.get("potential"), params.get("overallrating")
+    return potential - overall if potential and overall else 0
+
+
+def _default_is_named(context):
+    """is_named for rows inserted outside the importer"""
+    firstname = context.get_current_parameters().get("firstname")
+    return bool(firstname) and not firstname.startswith("Unknown_")
+
+
+def _listing_index(name, *columns):
+    keys = list(columns) + [c for c in LISTING_INDEX_COLUMNS if c not in columns]
+    return Index(name, *keys)
+
+
+class PlayerDisplayMixin:
+    """
+    Display helpers shared by the Player model and the PlayerView read model.
+
+    Only reads the listing columns (playerid, names, overallrating,
+    potential, preferredposition1). Player replaces growth_potential with
+    the stored column of the same name.
+    """
+
+    __slots__ = ()
+
+    @property
+    def full_name(self):
+        """Returns the player's full name (resolved at import, same as PlayerInfo)."""
+        if self.commonname:
+            return self.commonname
+        if self.firstname or self.surname:
+            return f"{self.firstname or ''} {self.surname or ''}".strip()
+        return f"Player {self.playerid}"  # Fallback if no names
+
+    @property
+    def growth_potential(self):
+        """Returns the potential for growth (potential - current overall)."""
+        if self.potential and self.overallrating:
+            return self.potential - self.overallrating
+        return 0
+
+    @property
+    def display_name(self) -> str:
+        """
+        User-friendly display name
+        Returns actual name if available, formatted ID if not
+        """
+        # Check if we have a valid name that isn't an "Unknown_" placeholder
+        if self.firstname and not self.firstname.startswith("Unknown_"):
+            return self.full_name
+        return f"Player #{self.playerid}"
+
+    @property
+    def detailed_display(self) -> str:
+        """
+        Detailed display with key stats
+        Example: "Player #71055 (OVR 85, ST)"
+        """
+        name = self.display_name
+        ovr = f"OVR {self.overallrating}" if self.overallrating else "OVR ?"
+        pos = self.preferredposition1 or "?"
+        return f"{name} ({ovr}, {pos})"
+
+
+class Player(Base, PlayerDisplayMixin):
     """
     Represents a player in the user's squad.
     Maps to career_playergrowthuserseason table from FC 26 save.
@@ -25,7 +106,7 @@ class Player(Base):
     commonname = Column(String(50), nullable=True)
 
     # Ratings (40-99 range)
-    overallrating = Column(Integer, nullable=False, index=True)
+    overallrating = Column(Integer, nullable=False)
     potential = Column(Integer, nullable=True)
 
     # Physical Attributes
@@ -41,13 +122,35 @@ class Player(Base):
     # Value and Contract
     value = Column(Integer, nullable=True)  # in currency units
 
-    # Relationship to PlayerInfo (names)
+    # Derived at import so they can be filtered and sorted on in SQL.
+    # "backfill" fills them when ensure_schema() adds them to an old database.
+    growth_potential = Column(
+        Integer,
+        nullable=True,
+        default=_default_growth_potential,
+        info={"backfill": "COALESCE(potential - overallrating, 0)"},
+    )
+    is_named = Column(
+        Boolean,
+        nullable=True,
+        default=_default_is_named,
+        info={
+            "backfill": "COALESCE(firstname, '') != '' AND substr(firstname, 1, 8) != 'Unknown_'"
+        },
+    )
+
+    # Hash of the imported columns, compared on re-import to skip unchanged rows
+    row_hash = Column(Integer, nullable=True)
+
+    # Relationship to PlayerInfo (identity data). Loaded on access; callers
+    # that need it for many players opt in with joinedload (see
+    # src/database/queries.py), the resolved names are on Player itself.
     info = relationship(
         "PlayerInfo",
         foreign_keys="Player.playerid",
         primaryjoin="Player.playerid == PlayerInfo.playerid",
         uselist=False,
-        lazy="joined",  # Always load names with player
+        lazy="select",
     )
 
     # Timestamps
@@ -72,6 +175,23 @@ class Player(Base):
         CheckConstraint(
             "skillmoves >= 1 AND skillmoves <= 5", name="check_skillmoves_range"
         ),
+        # Every index is one more write per player, so only the listing
+        # that can return many rows (rating thresholds, no LIMIT) is
+        # covering; the others feed LIMIT 10 listings (ten row lookups)
+        # and counts (answered from the index):
+        # rankings and thresholds on overall
+        _listing_index("ix_players_overall_listing", "overallrating"),
+        # potential thresholds, and young players by potential (age read
+        # from the index while scanning in potential order)
+        Index("ix_players_potential", "potential", "age"),
+        # age counts and veterans by age
+        Index("ix_players_age", "age"),
+        # resolved-name samples and counts (same condition as stats.NAMED)
+        Index("ix_players_named", "is_named", sqlite_where=text("is_named IS 1")),
+        # Indexes of earlier versions, dropped by ensure_schema(): the
+        # single-column overallrating index is superseded by the overall
+        # listing index
+        {"info": {"retired_indexes": ("ix_players_overallrating",)}},
     )
 
     # Validators
@@ -93,44 +213,5 @@ class Player(Base):
             raise ValueError(f"Age must be between 16-50, got {value}")
         return value
 
-    # Properties
-    @property
-    def full_name(self):
-        """Returns the player's full name from PlayerInfo table."""
-        if self.info:
-            if self.info.commonname:
-                return self.info.commonname
-            return f"{self.info.firstname} {self.info.surname}".strip()
-        return f"Player {self.playerid}"  # Fallback if no info
-
-    @property
-    def growth_potential(self):
-        """Returns the potential for growth (potential - current overall)."""
-        if self.potential and self.overallrating:
-            return self.potential - self.overallrating
-        return 0
-
-    @property
-    def display_name(self) -> str:
-        """
-        User-friendly display name
-        Returns actual name if available, formatted ID if not
-        """
-        # Check if we have a valid name that isn't an "Unknown_" placeholder
-        if self.firstname and not self.firstname.startswith("Unknown_"):
-            return self.full_name
-        return f"Player #{self.playerid}"
-
-    @property
-    def detailed_display(self) -> str:
-        """
-        Detailed display with key stats
-        Example: "Player #71055 (OVR 85, ST)"
-        """
-        name = self.display_name
-        ovr = f"OVR {self.overallrating}" if self.overallrating else "OVR ?"
-        pos = self.preferredposition1 or "?"
-        return f"{name} ({ovr}, {pos})"
-
     def __repr__(self):
         return f"<Player {self.detailed_display}>"
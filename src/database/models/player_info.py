@@ -27,5 +27,8 @@ class PlayerInfo(Base):
     nationality = Column(Integer, nullable=True)
     birthdate = Column(Integer, nullable=True)
 
+    # Hash of the imported columns, compared on re-import to skip unchanged rows
+    row_hash = Column(Integer, nullable=True)
+
     def __repr__(self):
         return f"<PlayerInfo {self.firstname} {self.surname} (ID: {self.playerid})>"
@@ -0,0 +1,49 @@
+"""
+player_search: FTS5 index of the resolved player names.
+
+Not a mapped table (SQLAlchemy has no virtual tables), so it is created and
+dropped with the metadata through DDL events. Queried and kept in sync by
+src/database/search.py.
+"""
+
+from sqlalchemy import event
+from .base import Base
+
+SEARCH_TABLE = "player_search"
+
+# unicode61 folds case and diacritics ("joao" matches "João"); the prefix
+# indexes serve 2- and 3-character word prefixes directly
+CREATE_SEARCH_TABLE = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "firstname, surname, commonname, "
+    "tokenize = 'unicode61 remove_diacritics 2', "
+    "prefix = '2 3'"
+    ")"
+)
+
+# Rows indexed: named players only ("Unknown_<id>" placeholders are not names)
+SEARCH_ROWS = "SELECT playerid, firstname, surname, commonname FROM players WHERE is_named"
+
+INSERT_SEARCH_ROWS = f"INSERT INTO {SEARCH_TABLE}(rowid, firstname, surname, commonname) {SEARCH_ROWS}"
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_table(target, connection, **kw):
+    """
+    Create player_search on create_all(), empty: on an existing database
+    the players table may still lack columns ensure_schema() adds next, so
+    the importer fills it (see sync_search_index()).
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).first()
+    if exists is None:
+        connection.exec_driver_sql(CREATE_SEARCH_TABLE)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_table(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
@@ -0,0 +1,84 @@
+"""
+Snapshot and PlayerHistory models: append-only history of imported saves.
+"""
+
+from datetime import datetime
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
+from .base import Base
+
+# Player columns kept per snapshot (the imported data, not derived columns)
+HISTORY_COLUMNS = (
+    "firstname",
+    "surname",
+    "commonname",
+    "overallrating",
+    "potential",
+    "age",
+    "height",
+    "weight",
+    "preferredposition1",
+    "weakfootabilitytypecode",
+    "skillmoves",
+    "value",
+)
+
+
+class Snapshot(Base):
+    """
+    One import of a save, in import order. Later snapshots only store the
+    players that changed (see PlayerHistory).
+    """
+
+    __tablename__ = "snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    label = Column(String(100), nullable=True)  # e.g. season, defaults to the save name
+    save_path = Column(String(500), nullable=True)
+    imported_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Squad size and rows stored for this snapshot
+    player_count = Column(Integer, nullable=False, default=0)
+    changed_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Snapshot #{self.id} {self.label or ''} ({self.player_count} players)>"
+
+
+class PlayerHistory(Base):
+    """
+    A player's row as of a snapshot, stored only when it differs from the
+    player's previous stored row. The state at snapshot S is, per player,
+    the latest row with snapshot_id <= S; removed rows mark players that
+    left the save (their data columns are null).
+    """
+
+    __tablename__ = "player_history"
+
+    snapshot_id = Column(Integer, ForeignKey("snapshots.id"), primary_key=True)
+    playerid = Column(Integer, primary_key=True)
+    removed = Column(Boolean, nullable=False, default=False)
+
+    # Content hash of the player row (same as Player.row_hash)
+    row_hash = Column(Integer, nullable=True)
+
+    firstname = Column(String(50), nullable=True)
+    surname = Column(String(50), nullable=True)
+    commonname = Column(String(50), nullable=True)
+    overallrating = Column(Integer, nullable=True)
+    potential = Column(Integer, nullable=True)
+    age = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    weight = Column(Integer, nullable=True)
+    preferredposition1 = Column(String(10), nullable=True)
+    weakfootabilitytypecode = Column(Integer, nullable=True)
+    skillmoves = Column(Integer, nullable=True)
+    value = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # Per-player timeline: latest row at or before a snapshot, and
+        # evolution of one player (covers the point-in-time lookup)
+        Index("ix_player_history_timeline", "playerid", "snapshot_id", "removed", "row_hash"),
+    )
+
+    def __repr__(self):
+        return f"<PlayerHistory player {self.playerid} @ snapshot {self.snapshot_id}>"
@@ -0,0 +1,38 @@
+"""
+SquadStats model: squad aggregates materialized at import time.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, DateTime, JSON
+from .base import Base
+
+
+class SquadStats(Base):
+    """
+    One-row snapshot of the squad aggregates shown by `info` and the LLM
+    summary context, rewritten by the importer after every import.
+    See src/database/stats.py.
+    """
+
+    __tablename__ = "squad_stats"
+
+    # Always 1: there is a single snapshot
+    id = Column(Integer, primary_key=True)
+
+    # Counts
+    total_players = Column(Integer, nullable=False, default=0)
+    named_players = Column(Integer, nullable=False, default=0)
+
+    # Averages (None for an empty squad)
+    avg_overall = Column(Float, nullable=True)
+    avg_potential = Column(Float, nullable=True)
+    avg_age = Column(Float, nullable=True)
+
+    # Listings as lists of PlayerView rows (LIST_COLUMNS order)
+    top_players = Column(JSON, nullable=False, default=list)
+    named_sample = Column(JSON, nullable=False, default=list)
+
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SquadStats {self.total_players} players ({self.computed_at})>"
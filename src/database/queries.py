@@ -0,0 +1,167 @@
+"""
+Read queries over the players tables, with the loading strategy chosen per call.
+
+Counts and listings never touch player_info unless asked to: Player carries
+its own resolved name columns, so PlayerInfo is only joined for callers that
+need identity data (nationality, birthdate). Listings are read into
+PlayerView objects rather than ORM entities.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import Select
+
+from src.database.models import Player, PlayerInfo
+from src.database.models.player import PlayerDisplayMixin
+
+# Columns needed to list a player (name, rating line and growth)
+LIST_COLUMNS = (
+    Player.playerid,
+    Player.firstname,
+    Player.surname,
+    Player.commonname,
+    Player.overallrating,
+    Player.potential,
+    Player.age,
+    Player.preferredposition1,
+)
+
+
+class PlayerView(PlayerDisplayMixin):
+    """
+    Read-only player for listings, built from a LIST_COLUMNS row.
+
+    Same display_name / detailed_display / growth_potential as Player, but
+    a plain slotted object: no session tracking, instrumentation or
+    validators, and a fraction of an ORM instance's memory.
+    """
+
+    __slots__ = tuple(column.key for column in LIST_COLUMNS)
+
+    def __init__(
+        self,
+        playerid: int,
+        firstname: Optional[str],
+        surname: Optional[str],
+        commonname: Optional[str],
+        overallrating: Optional[int],
+        potential: Optional[int],
+        age: Optional[int],
+        preferredposition1: Optional[str],
+    ):
+        set_ = object.__setattr__
+        set_(self, "playerid", playerid)
+        set_(self, "firstname", firstname)
+        set_(self, "surname", surname)
+        set_(self, "commonname", commonname)
+        set_(self, "overallrating", overallrating)
+        set_(self, "potential", potential)
+        set_(self, "age", age)
+        set_(self, "preferredposition1", preferredposition1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PlayerView is read-only: {name}")
+
+    def __repr__(self):
+        return f"<PlayerView {self.detailed_display}>"
+
+
+# Identity columns added by with_info=True
+INFO_COLUMNS = (
+    PlayerInfo.nationality,
+    PlayerInfo.birthdate,
+)
+
+
+def count_players(db: Session, *criteria: Any) -> int:
+    """
+    Number of players matching the criteria.
+
+    Counts the primary key directly instead of wrapping a full-entity
+    SELECT in a subquery like Query.count() does.
+    """
+    return db.query(func.count(Player.playerid)).filter(*criteria).scalar() or 0
+
+
+def select_players(
+    *criteria: Any,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+    columns: Sequence[Any] = LIST_COLUMNS,
+    with_info: bool = False,
+) -> Select:
+    """
+    Core SELECT of player columns.
+
+    Args:
+        criteria: Filter expressions on Player (or PlayerInfo with with_info)
+        order_by: ORDER BY expressions
+        limit: Max rows
+        columns: Player columns to select
+        with_info: Outer join player_info and add its identity columns
+    """
+    statement = select(*columns)
+    if with_info:
+        statement = statement.add_columns(*INFO_COLUMNS).outerjoin(
+            PlayerInfo, PlayerInfo.playerid == Player.playerid
+        )
+    statement = statement.where(*criteria).order_by(*order_by)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def player_rows(
+    db: Session,
+    *criteria: Any,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+    columns: Sequence[Any] = LIST_COLUMNS,
+    with_info: bool = False,
+) -> List[Row]:
+    """
+    Players as named tuples of the selected columns, for lists and rankings.
+
+    No ORM objects are built: rows are not tracked by the session and carry
+    only the columns asked for.
+    """
+    statement = select_players(
+        *criteria, order_by=order_by, limit=limit, columns=columns, with_info=with_info
+    )
+    return list(db.execute(statement).all())
+
+
+def player_views(
+    db: Session,
+    *criteria: Any,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+) -> List[PlayerView]:
+    """Players as PlayerView objects, for listings and rankings"""
+    statement = select_players(*criteria, order_by=order_by, limit=limit)
+    return [PlayerView(*row) for row in db.execute(statement).all()]
+
+
+def load_players(
+    db: Session,
+    *criteria: Any,
+    order_by: Sequence[Any] = (),
+    limit: Optional[int] = None,
+    with_info: bool = False,
+) -> List[Player]:
+    """
+    Players as ORM entities, for callers that need the full model.
+
+    PlayerInfo is only loaded (in the same query) with with_info=True;
+    otherwise accessing player.info issues its own SELECT.
+    """
+    query = db.query(Player)
+    if with_info:
+        query = query.options(joinedload(Player.info))
+    query = query.filter(*criteria).order_by(*order_by)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
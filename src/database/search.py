@@ -0,0 +1,135 @@
+"""
+Player name search over an SQLite FTS5 index.
+
+player_search indexes the resolved names (firstname, surname, commonname)
+of named players, with the player's playerid as rowid. The unicode61
+tokenizer folds case and diacritics on both sides, so "joao" finds "João"
+and "Pele" finds "Pelé"; prefix indexes make word-prefix queries a direct
+index lookup. The table is created with the schema (see
+src/database/models/player_search.py); the importer keeps it in sync with
+the players table.
+"""
+
+import re
+from typing import Iterable, List
+
+from sqlalchemy import or_, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.database.models import Player
+from src.database.models.player_search import INSERT_SEARCH_ROWS, SEARCH_TABLE
+from src.database.queries import LIST_COLUMNS, PlayerView, player_views
+
+# Above this many changed players a full rebuild beats per-row updates
+REBUILD_ROWS = 5000
+
+# Words shorter than this are ignored by fuzzy search (too unselective)
+FUZZY_MIN_LENGTH = 3
+
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def rebuild_search_index(db: Session):
+    """Refill player_search from the players table (caller's transaction)"""
+    connection = db.connection()
+    connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE}")
+    connection.exec_driver_sql(INSERT_SEARCH_ROWS)
+
+
+def sync_search_index(db: Session, written: Iterable[int], removed: Iterable[int]):
+    """
+    Update player_search for the players the importer wrote or deleted.
+
+    Runs in the caller's transaction, after the players table was written.
+    An empty index (new table on an existing database) is filled from
+    scratch, as are large changes.
+
+    Args:
+        db: Open session
+        written: playerids inserted or updated
+        removed: playerids deleted
+    """
+    written, removed = list(written), list(removed)
+    connection = db.connection()
+    empty = connection.exec_driver_sql(f"SELECT 1 FROM {SEARCH_TABLE} LIMIT 1").first() is None
+    if empty or len(written) + len(removed) > REBUILD_ROWS:
+        rebuild_search_index(db)
+        return
+
+    stale = [(playerid,) for playerid in written + removed]
+    if stale:
+        connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = ?", stale)
+    if written:
+        connection.exec_driver_sql(
+            f"{INSERT_SEARCH_ROWS} AND playerid = ?", [(playerid,) for playerid in written]
+        )
+
+
+def match_expression(query: str, fuzzy: bool = False) -> str:
+    """
+    FTS5 MATCH expression for a free-text name query.
+
+    Every word becomes a quoted prefix term ("joa"*), so user input never
+    reaches the FTS5 query syntax. Plain search requires every word;
+    fuzzy search accepts any word of FUZZY_MIN_LENGTH or more.
+    """
+    words = WORD.findall(query)
+    if fuzzy:
+        words = [word for word in words if len(word) >= FUZZY_MIN_LENGTH]
+    terms = [f'"{word}"*' for word in words]
+    return (" OR " if fuzzy else " ").join(terms)
+
+
+def search_players(db: Session, query: str, limit: int = 10, fuzzy: bool = False) -> List[PlayerView]:
+    """
+    Players whose names match a query, best matches first.
+
+    Args:
+        db: Database session
+        query: Name or name prefixes ("cristiano ron", "joao")
+        limit: Max players
+        fuzzy: Match players with any of the words instead of all of them
+
+    Returns:
+        PlayerViews ranked by FTS5 bm25, then overall rating
+    """
+    expression = match_expression(query, fuzzy)
+    if not expression:
+        return []
+
+    columns = ", ".join(f"p.{column.key}" for column in LIST_COLUMNS)
+    statement = text(
+        f"SELECT {columns} FROM {SEARCH_TABLE} "
+        f"JOIN players AS p ON p.playerid = {SEARCH_TABLE}.rowid "
+        f"WHERE {SEARCH_TABLE} MATCH :expression "
+        f"ORDER BY {SEARCH_TABLE}.rank, p.overallrating DESC LIMIT :limit"
+    )
+    try:
+        rows = db.execute(statement, {"expression": expression, "limit": limit}).all()
+    except OperationalError:
+        # No search index in this database yet: scan the name columns
+        db.rollback()
+        return _search_by_like(db, query, limit, fuzzy)
+    return [PlayerView(*row) for row in rows]
+
+
+def _search_by_like(db: Session, query: str, limit: int, fuzzy: bool) -> List[PlayerView]:
+    """Fallback for databases imported before player_search existed"""
+    words = WORD.findall(query)
+    if fuzzy:
+        words = [word for word in words if len(word) >= FUZZY_MIN_LENGTH]
+    if not words:
+        return []
+    matches = [
+        or_(*(column.ilike(f"%{word}%") for column in (Player.firstname, Player.surname, Player.commonname)))
+        for word in words
+    ]
+    criteria = [or_(*matches)] if fuzzy else matches
+    return player_views(
+        db,
+        *criteria,
+        Player.is_named.is_(True),
+        order_by=[Player.overallrating.desc()],
+        limit=limit,
+    )
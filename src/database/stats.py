@@ -0,0 +1,156 @@
+"""
+Squad stats snapshot: every aggregate `info` and the summary context show.
+
+The importer computes the snapshot once per import (one aggregate scan of
+players plus two indexed listings) and stores it in squad_stats; readers get
+it back with a single primary-key lookup.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func, not_
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.database.models import Player, SquadStats
+from src.database.queries import PlayerView, player_views
+
+SNAPSHOT_ID = 1
+TOP_PLAYERS = 10
+NAMED_SAMPLE = 5
+
+# Players whose names were resolved (not an "Unknown_<id>" placeholder)
+NAMED = Player.is_named.is_(True)
+# The same rule on the name itself, for databases that predate is_named
+NAMED_BY_NAME = and_(
+    Player.firstname != "", not_(Player.firstname.startswith("Unknown_", autoescape=True))
+)
+
+
+class StatsSnapshot:
+    """Squad aggregates and the listings shown alongside them"""
+
+    def __init__(
+        self,
+        total_players: int,
+        named_players: int,
+        avg_overall: Optional[float],
+        avg_potential: Optional[float],
+        avg_age: Optional[float],
+        top_players: List[PlayerView],
+        named_sample: List[PlayerView],
+        computed_at: Optional[datetime] = None,
+    ):
+        self.total_players = total_players
+        self.named_players = named_players
+        self.avg_overall = avg_overall
+        self.avg_potential = avg_potential
+        self.avg_age = avg_age
+        self.top_players = top_players
+        self.named_sample = named_sample
+        self.computed_at = computed_at
+
+    @property
+    def unknown_players(self) -> int:
+        return self.total_players - self.named_players
+
+    @property
+    def top_player(self) -> Optional[PlayerView]:
+        return self.top_players[0] if self.top_players else None
+
+    @classmethod
+    def from_row(cls, row: SquadStats) -> "StatsSnapshot":
+        return cls(
+            row.total_players,
+            row.named_players,
+            row.avg_overall,
+            row.avg_potential,
+            row.avg_age,
+            [PlayerView(*values) for values in row.top_players],
+            [PlayerView(*values) for values in row.named_sample],
+            row.computed_at,
+        )
+
+    def __repr__(self):
+        return f"<StatsSnapshot {self.total_players} players>"
+
+
+def _view_values(views: List[PlayerView]) -> List[list]:
+    return [[getattr(view, name) for name in PlayerView.__slots__] for view in views]
+
+
+def compute_snapshot(db: Session, named_filter=NAMED) -> StatsSnapshot:
+    """
+    Compute the snapshot from the players table.
+
+    Args:
+        db: Database session
+        named_filter: Condition for resolved names (NAMED_BY_NAME where the
+            is_named column may not exist yet)
+    """
+    total, named, avg_overall, avg_potential, avg_age = db.query(
+        func.count(Player.playerid),
+        func.sum(case((named_filter, 1), else_=0)),
+        func.avg(Player.overallrating),
+        func.avg(Player.potential),
+        func.avg(Player.age),
+    ).one()
+
+    return StatsSnapshot(
+        total_players=total,
+        named_players=named or 0,
+        avg_overall=avg_overall,
+        avg_potential=avg_potential,
+        avg_age=avg_age,
+        top_players=player_views(
+            db,
+            Player.overallrating.isnot(None),
+            order_by=[Player.overallrating.desc()],
+            limit=TOP_PLAYERS,
+        ),
+        named_sample=player_views(db, named_filter, limit=NAMED_SAMPLE),
+        computed_at=datetime.utcnow(),
+    )
+
+
+def refresh_snapshot(db: Session) -> StatsSnapshot:
+    """
+    Recompute the snapshot and store it in squad_stats.
+
+    Runs in the caller's transaction (the importer commits it along with
+    the players it wrote).
+    """
+    snapshot = compute_snapshot(db)
+    db.merge(
+        SquadStats(
+            id=SNAPSHOT_ID,
+            total_players=snapshot.total_players,
+            named_players=snapshot.named_players,
+            avg_overall=snapshot.avg_overall,
+            avg_potential=snapshot.avg_potential,
+            avg_age=snapshot.avg_age,
+            top_players=_view_values(snapshot.top_players),
+            named_sample=_view_values(snapshot.named_sample),
+            computed_at=snapshot.computed_at,
+        )
+    )
+    db.flush()
+    return snapshot
+
+
+def get_snapshot(db: Session) -> StatsSnapshot:
+    """
+    Stored snapshot, or a live one if none was stored yet (databases
+    imported before squad_stats existed, or filled outside the importer).
+    The live one reads names rather than is_named, which such databases
+    may not have yet (ensure_schema() adds it on the next import).
+    """
+    try:
+        row = db.get(SquadStats, SNAPSHOT_ID)
+    except OperationalError:
+        db.rollback()  # No squad_stats table in this database yet
+        row = None
+    if row is None:
+        return compute_snapshot(db, NAMED_BY_NAME)
+    return StatsSnapshot.from_row(row)
@@ -6,6 +6,9 @@ Converts database data into LLM-friendly context strings
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from src.database.models import Player, PlayerInfo
+from src.database.queries import player_views
+from src.database.search import search_players
+from src.database.stats import get_snapshot
 
 
 class ContextBuilder:
@@ -46,12 +49,10 @@ class ContextBuilder:
         Returns:
             Formatted context string
         """
-        # Base query
-        query = self.db.query(Player)
-
-        # Apply filters
+        # Filter criteria
+        criteria = []
         if player_ids:
-            query = query.filter(Player.playerid.in_(player_ids))
+            criteria.append(Player.playerid.in_(player_ids))
 
         if filters:
             for key, value in filters.items():
@@ -60,14 +61,14 @@ class ContextBuilder:
                     column = getattr(Player, field)
 
                     if op == "gte":
-                        query = query.filter(column >= value)
+                        criteria.append(column >= value)
                     elif op == "lte":
-                        query = query.filter(column <= value)
+                        criteria.append(column <= value)
                     elif op == "eq":
-                        query = query.filter(column == value)
+                        criteria.append(column == value)
 
         # Get players
-        players = query.limit(limit).all()
+        players = player_views(self.db, *criteria, limit=limit)
 
         if not players:
             return "⚠️ Nenhum jogador encontrado com os critérios especificados."
@@ -99,12 +100,8 @@ class ContextBuilder:
     ) -> str:
         """Build context with top N players"""
         column = getattr(Player, order_by)
-        players = (
-            self.db.query(Player)
-            .filter(column.isnot(None))
-            .order_by(column.desc())
-            .limit(top_n)
-            .all()
+        players = player_views(
+            self.db, column.isnot(None), order_by=[column.desc()], limit=top_n
         )
 
         if not players:
@@ -117,47 +114,96 @@ class ContextBuilder:
 
         return "\n".join(lines)
 
-    def build_summary_context(self) -> str:
-        """Build a summary context of the career save"""
-        total_players = self.db.query(Player).count()
+    def build_search_context(self, query: str, limit: int = 10) -> str:
+        """Build context with the players whose names match a query"""
+        players = search_players(self.db, query, limit=limit, fuzzy=True)
 
-        if total_players == 0:
-            return "⚠️ Nenhum dado carregado."
+        if not players:
+            return "⚠️ Nenhum jogador encontrado com esse nome."
 
-        # Get top player
-        top_player = (
-            self.db.query(Player)
-            .filter(Player.overallrating.isnot(None))
-            .order_by(Player.overallrating.desc())
-            .first()
-        )
+        lines = [f"🔎 Jogadores encontrados para '{query}':\n"]
+        for player in players:
+            lines.append(
+                f"• {player.detailed_display}\n"
+                f"  ID: {player.playerid}, "
+                f"Age: {player.age or '?'}, "
+                f"Potential: {player.potential or '?'}"
+            )
+
+        return "\n".join(lines)
 
-        # Average stats
-        from sqlalchemy import func
+    def build_summary_context(self) -> str:
+        """Build a summary context of the career save"""
+        stats = get_snapshot(self.db)
 
-        avg_ovr = self.db.query(func.avg(Player.overallrating)).scalar() or 0
-        avg_age = self.db.query(func.avg(Player.age)).scalar() or 0
+        if stats.total_players == 0:
+            return "⚠️ Nenhum dado carregado."
 
+        top_player = stats.top_player
         summary = f"""📊 Resumo da Carreira:
-- Total de jogadores: {total_players}
-- Overall médio: {avg_ovr:.1f}
-- Idade média: {avg_age:.1f} anos
+- Total de jogadores: {stats.total_players}
+- Overall médio: {stats.avg_overall or 0:.1f}
+- Idade média: {stats.avg_age or 0:.1f} anos
 - Melhor jogador: {top_player.detailed_display if top_player else 'N/A'}
 """
         return summary
 
-    def build_context(self, context_type: str, limit: int = 10) -> str:
+    def build_diff_context(self, limit: int = 10) -> str:
+        """Build context with the player evolution between the last two imports"""
+        # Imported here: the diff engine pulls in pandas and the parser bridge
+        from src.core.diff import diff_sources
+
+        diff = diff_sources(self.db)
+
+        if diff is None:
+            return "⚠️ São necessárias duas importações para comparar a evolução."
+
+        counts = diff.counts
+        lines = [
+            f"📈 Evolução entre {diff.before_label} e {diff.after_label}:",
+            f"- Evoluíram: {counts['improved']}, regrediram: {counts['declined']}",
+            f"- Potencial subiu: {counts['potential_up']}, caiu: {counts['potential_down']}",
+            f"- Novos: {counts['appeared']}, saíram: {counts['disappeared']}",
+            f"- Mudaram de posição: {counts['position_changed']}, de valor: {counts['value_changed']}",
+        ]
+
+        for title, frame in (("Maiores evoluções", diff.improved), ("Maiores quedas", diff.declined)):
+            if frame.empty:
+                continue
+            lines.append(f"\n{title}:")
+            for player, row in zip(diff.views(frame, limit=limit), frame.itertuples()):
+                lines.append(
+                    f"• {player.detailed_display}: OVR {row.overallrating_before} → "
+                    f"{row.overallrating_after}, POT {row.potential_before} → {row.potential_after}"
+                )
+
+        for title, frame in (("Novos jogadores", diff.appeared), ("Saíram", diff.disappeared)):
+            if frame.empty:
+                continue
+            lines.append(f"\n{title}:")
+            lines.extend(f"• {player.detailed_display}" for player in diff.views(frame, limit=limit))
+
+        return "\n".join(lines)
+
+    def build_context(
+        self, context_type: str, limit: int = 10, query: Optional[str] = None
+    ) -> str:
         """
         Build context based on type
 
         Args:
-            context_type: Type of context (summary, top_players, filtered)
+            context_type: Type of context (summary, top_players, search, diff, filtered)
             limit: Limit for lists
+            query: Question or names to look up (search context)
 
         Returns:
             Context string
         """
-        if context_type == "summary":
+        if context_type == "search" and query:
+            return self.build_search_context(query, limit=limit)
+        elif context_type == "diff":
+            return self.build_diff_context(limit=limit)
+        elif context_type == "summary":
             return self.build_summary_context()
         elif context_type == "top_players":
             return self.build_top_players_context(top_n=limit)
@@ -10,6 +10,7 @@ from sqlalchemy import func
 import re
 
 from src.database.models import Player
+from src.database.queries import count_players, player_views
 from .gemini_client import GeminiClient
 from .prompt_builder import PromptBuilder
 from .context_builder import ContextBuilder
@@ -105,7 +106,7 @@ class QueryRouter:
         """Handle queries that can be answered with SQL"""
         try:
             if query_type == QueryType.SIMPLE_COUNT:
-                count = self.db.query(Player).count()
+                count = count_players(self.db)
                 answer = f"Você tem **{count} jogadores** no seu elenco."
 
             elif query_type == QueryType.SIMPLE_TOP_N:
@@ -114,12 +115,11 @@ class QueryRouter:
                 top_n = int(numbers[0]) if numbers else 10
                 top_n = min(top_n, 50)  # Cap at 50
 
-                players = (
-                    self.db.query(Player)
-                    .filter(Player.overallrating.isnot(None))
-                    .order_by(Player.overallrating.desc())
-                    .limit(top_n)
-                    .all()
+                players = player_views(
+                    self.db,
+                    Player.overallrating.isnot(None),
+                    order_by=[Player.overallrating.desc()],
+                    limit=top_n,
                 )
 
                 answer = f"**Top {top_n} Jogadores por Overall:**\n\n"
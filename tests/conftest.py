@@ -1,5 +1,29 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
 import pytest
-from src.database.models import Base, engine, SessionLocal
+
+# The engine is created when src.database.models is first imported, from
+# FC26_DATABASE_URL (default: the user's data/fc26_career.db). Point it at a
+# throwaway database first, so db_session's drop_all() never wipes real data.
+TEST_DB_DIR = Path(tempfile.mkdtemp(prefix="fc26-tests-"))
+os.environ["FC26_DATABASE_URL"] = f"sqlite:///{TEST_DB_DIR / 'fc26_test.db'}"
+
+from src.core.importer import NameResolver, SaveImporter  # noqa: E402
+from src.database.models import Base, engine, SessionLocal  # noqa: E402
+
+# Generic names most import tests resolve their players to
+DC_NAMES = [{"nameid": 1, "name": "Edson"}, {"nameid": 2, "name": "Arantes"}]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_database():
+    """Remove the throwaway database once the session ends."""
+    yield
+    engine.dispose()
+    shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
 
 
 @pytest.fixture
@@ -10,3 +34,29 @@ def db_session():
     yield session
     session.close()
     Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def make_importer():
+    """
+    Factory of SaveImporters whose name resolver knows the given
+    dcplayernames rows; keyword arguments set importer attributes
+    (label, fast_load, ...).
+    """
+    def make(names=DC_NAMES, batch_size=2, **attributes):
+        importer = SaveImporter(batch_size=batch_size)
+        importer.name_resolver = NameResolver({"dcplayernames": names})
+        for name, value in attributes.items():
+            setattr(importer, name, value)
+        return importer
+
+    return make
+
+
+@pytest.fixture
+def import_players(db_session, make_importer):
+    """Import parsed player tables into the test database, returning the stats."""
+    def run(data, **options):
+        return make_importer(**options)._import_players(data)
+
+    return run
@@ -0,0 +1,122 @@
+"""
+Tests for the save diff engine.
+"""
+
+import pandas as pd
+import pytest
+
+from typer.testing import CliRunner
+
+from src.cli.main import app
+from src.core.diff import DIFF_COLUMNS, diff_frames, diff_sources
+from src.database.models import PlayerHistory, Snapshot
+from src.llm.context_builder import ContextBuilder
+
+
+def frame(*players):
+    """Diff frame from (playerid, overall, potential, position, value) tuples"""
+    rows = [
+        {
+            "playerid": playerid,
+            "firstname": "Edson",
+            "surname": f"Arantes {playerid}",
+            "overallrating": overall,
+            "potential": potential,
+            "age": 20,
+            "preferredposition1": position,
+            "value": value,
+        }
+        for playerid, overall, potential, position, value in players
+    ]
+    return pd.DataFrame(rows).reindex(columns=DIFF_COLUMNS)
+
+
+BEFORE = frame((1, 80, 90, "ST", 1000), (2, 75, 85, "CM", 500), (3, 70, 80, "CB", 300), (4, 60, 70, "GK", 100))
+AFTER = frame((1, 84, 91, "ST", 1500), (2, 73, 85, "CAM", 500), (3, 70, 80, "CB", 300), (5, 65, 88, "LW", 200))
+
+
+class TestDiffFrames:
+    """Test classification of players between two sides."""
+
+    def test_counts(self):
+        diff = diff_frames(BEFORE, AFTER)
+
+        assert diff.counts == {
+            "appeared": 1,
+            "disappeared": 1,
+            "improved": 1,
+            "declined": 1,
+            "potential_up": 1,
+            "potential_down": 0,
+            "position_changed": 1,
+            "value_changed": 1,
+        }
+        assert list(diff.changed["playerid"]) == [1, 2]  # 3 unchanged
+
+    def test_listings(self):
+        diff = diff_frames(BEFORE, AFTER)
+
+        improved = diff.improved.iloc[0]
+        assert (improved.playerid, improved.overallrating_delta, improved.value_delta) == (1, 4, 500)
+        assert diff.declined.iloc[0].overallrating_delta == -2
+        assert diff.position_changes.iloc[0].preferredposition1_after == "CAM"
+        assert [p.detailed_display for p in diff.views(diff.appeared)] == ["Edson Arantes 5 (OVR 65, LW)"]
+        assert [p.overallrating for p in diff.views(diff.declined, side="before")] == [75]
+
+    def test_missing_values_compare_equal(self):
+        before = frame((1, 80, 90, None, None))
+        after = frame((1, 80, 90, None, None))
+
+        assert diff_frames(before, after).changed.empty
+
+
+def store_snapshots(db_session):
+    """Snapshot 1 holds BEFORE, snapshot 2 AFTER"""
+    for snapshot_id, label, players in ((1, "2025/26", BEFORE), (2, "2026/27", AFTER)):
+        db_session.add(Snapshot(id=snapshot_id, label=label, player_count=len(players)))
+        for row in players.astype(object).where(players.notna(), None).to_dict("records"):
+            db_session.add(PlayerHistory(snapshot_id=snapshot_id, **row))
+    db_session.add(PlayerHistory(snapshot_id=2, playerid=4, removed=True))
+    db_session.commit()
+
+
+class TestDiffSources:
+    """Test diffs between snapshots and their defaults."""
+
+    def test_needs_two_snapshots(self, db_session):
+        assert diff_sources(db_session) is None
+        assert "duas importações" in ContextBuilder(db_session).build_diff_context()
+
+    def test_diff_and_context(self, db_session):
+        store_snapshots(db_session)
+
+        diff = diff_sources(db_session)
+        context = ContextBuilder(db_session).build_context("diff")
+
+        assert (diff.before_label, diff.after_label) == ("2025/26", "2026/27")
+        # Player 4 is gone through its removed row, not carried over
+        assert diff.counts["disappeared"] == 1 and diff.counts["improved"] == 1
+        assert "Edson Arantes 1 (OVR 84, ST): OVR 80 → 84" in context
+
+    def test_single_side_compared_with_latest(self, db_session):
+        store_snapshots(db_session)
+
+        assert diff_sources(db_session, "1").counts == diff_sources(db_session, 1, 2).counts
+        assert diff_sources(db_session, 2).changed.empty
+
+    def test_unknown_sources_rejected(self, db_session):
+        store_snapshots(db_session)
+
+        with pytest.raises(ValueError, match="No snapshot #9"):
+            diff_sources(db_session, "9")
+        with pytest.raises(ValueError, match="neither"):
+            diff_sources(db_session, "no-such-save", "2")
+
+    def test_cli_single_argument(self, db_session):
+        store_snapshots(db_session)
+
+        result = CliRunner().invoke(app, ["diff", "1"])
+
+        assert result.exit_code == 0
+        assert "2025/26 → 2026/27" in result.output
+        assert CliRunner().invoke(app, ["diff", "9"]).exit_code != 0
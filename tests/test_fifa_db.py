@@ -0,0 +1,311 @@
+"""
+Tests for the native FIFA database reader.
+"""
+
+import struct
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+from src.core.fifa_db import SaveReader, TableReader, load_meta
+from src.core.fifa_db import meta as fifa_meta
+from src.core.parse_cache import ParseCache
+from src.core.parser_bridge import ParserBridge
+from src.core.fifa_db.reader import (
+    CRC,
+    DB_HEADER,
+    FIELD_DESCRIPTOR,
+    TABLE_ENTRY,
+    TABLE_HEADER,
+)
+
+
+PARSER_DIR = Path(__file__).parent.parent / "parser"
+
+
+def node_parser_available():
+    """True if node runs and resolves fifa-career-save-parser from parser/"""
+    try:
+        result = subprocess.run(
+            ["node", "-e", "require.resolve('fifa-career-save-parser')"],
+            cwd=PARSER_DIR,
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        return False
+    return result.returncode == 0
+
+
+def build_table(fields, rows, compressed_strings=0):
+    """
+    One t3db table: fields are (shortname, type_code, depth), rows are lists
+    of raw stored values (ints already offset by rangelow, bytes for strings).
+    compressed_strings is the compressed strings length of the header.
+    """
+    offsets, bit = [], 0
+    for _, type_code, depth in fields:
+        if type_code in (0, 4):
+            bit = (bit + 7) // 8 * 8  # Strings and reals are byte aligned
+        offsets.append(bit)
+        bit += depth
+    record_size = (bit + 7) // 8
+
+    records = b""
+    for row in rows:
+        value = 0
+        record = bytearray(record_size)
+        for (_, type_code, depth), offset, raw in zip(fields, offsets, row):
+            if type_code == 0:
+                record[offset // 8:offset // 8 + len(raw)] = raw
+            elif type_code == 4:
+                record[offset // 8:offset // 8 + 4] = struct.pack("<f", raw)
+            else:
+                value |= raw << offset
+        packed = value.to_bytes(record_size, "little")
+        records += bytes(a | b for a, b in zip(record, packed))
+
+    header = TABLE_HEADER.pack(
+        0, record_size, bit, compressed_strings, len(rows), len(rows), 0, len(fields), 0
+    )
+    descriptors = b"".join(
+        FIELD_DESCRIPTOR.pack(type_code, offset, shortname.encode(), depth)
+        for (shortname, type_code, depth), offset in zip(fields, offsets)
+    )
+    return header + descriptors + CRC.pack(0) + records
+
+
+def build_database(tables):
+    """One t3db segment from {table_shortname: table_bytes}"""
+    entries, data = b"", b""
+    for shortname, table in tables.items():
+        entries += TABLE_ENTRY.pack(shortname.encode(), len(data))
+        data += table
+    size = DB_HEADER.size + len(entries) + CRC.size + len(data)
+    header = DB_HEADER.pack(b"DB\x00\x08\x00\x00\x00\x00", size, 0, len(tables), 0)
+    return header + entries + CRC.pack(0) + data
+
+
+PLAYERS = [[158023, 92, 40], [20801, 89, 57]]
+
+
+def write_save(path, players_rows=PLAYERS):
+    """Career save with three databases (players rows as raw stored values)"""
+    # dcplayernames: nameid (13 bits, rangelow 44000), name (38-byte string)
+    names = build_table(
+        [("FuiB", 3, 13), ("vIys", 0, 304)],
+        [[1, "Édson".encode()], [2, b"Arantes"]],
+    )
+    # players: playerid (19 bits), overallrating (7 bits, rangelow 1), height (rangelow 130)
+    players = build_table(
+        [("ykFq", 3, 19), ("UERs", 3, 7), ("ypBQ", 3, 7)],
+        players_rows,
+    )
+    # teams in two databases: teamid (18 bits, rangelow 1)
+    teams_db0 = build_table([("mCXg", 3, 18)], [[0]])
+    teams_db1 = build_table([("mCXg", 3, 18)], [[1]])
+    # A table with a real field (cpmorph_ear_tweak_e)
+    reals = build_table([("jOcm", 4, 32)], [[0.5]])
+    reals_table = next(
+        table.shortname
+        for table in load_meta(21).tables.values()
+        if "jOcm" in table.by_shortname
+    )
+
+    path.write_bytes(
+        b"career header"
+        + build_database({"bneD": names, "lyxL": teams_db0})
+        + build_database({"CZUM": players, "lyxL": teams_db1})
+        + build_database({reals_table: reals})
+    )
+    return str(path)
+
+
+@pytest.fixture
+def save_file(tmp_path):
+    return write_save(tmp_path / "CmMgrC0001")
+
+
+class TestMeta:
+    """Test meta XML parsing."""
+
+    def test_fields_have_bit_layout(self):
+        field = load_meta(21).tables["players"].fields["height"]
+
+        assert (field.shortname, field.depth, field.rangelow) == ("ypBQ", 7, 130)
+
+    def test_every_game_version_loads(self):
+        for version in (17, 18, 19, 20, 21):
+            assert "players" in load_meta(version).tables
+
+
+class TestSchemaCache:
+    """Test the compiled schema cache."""
+
+    def test_compiled_schema_written_and_reused(self, tmp_path, monkeypatch):
+        parsed = fifa_meta.load_meta.__wrapped__(21, tmp_path)
+        assert len(list(tmp_path.glob("fifa21-*.schema"))) == 1
+
+        monkeypatch.setattr(fifa_meta, "parse_meta", lambda *args: pytest.fail("XML parsed again"))
+        cached = fifa_meta.load_meta.__wrapped__(21, tmp_path)
+
+        field = cached.tables["players"].fields["height"]
+        assert (field.shortname, field.depth, field.rangelow, field.type) == ("ypBQ", 7, 130, fifa_meta.INTEGER)
+        assert cached.tables.keys() == parsed.tables.keys()
+
+    def test_changed_xml_gets_new_schema(self, tmp_path, monkeypatch):
+        xml_dir = tmp_path / "xml"
+        (xml_dir / "21").mkdir(parents=True)
+        xml = fifa_meta.meta_path(21).read_bytes()
+        (xml_dir / "21" / fifa_meta.META_FILE).write_bytes(xml)
+        monkeypatch.setattr(fifa_meta, "XML_DIR", xml_dir)
+
+        fifa_meta.load_meta.__wrapped__(21, tmp_path / "cache")
+        (xml_dir / "21" / fifa_meta.META_FILE).write_bytes(xml + b"\n")
+        fifa_meta.load_meta.__wrapped__(21, tmp_path / "cache")
+
+        assert len(list((tmp_path / "cache").glob("fifa21-*.schema"))) == 2
+
+    def test_corrupt_schema_rebuilt(self, tmp_path):
+        fifa_meta.load_meta.__wrapped__(21, tmp_path)
+        schema = next(tmp_path.glob("*.schema"))
+        schema.write_bytes(b"garbage")
+
+        meta = fifa_meta.load_meta.__wrapped__(21, tmp_path)
+
+        assert "players" in meta.tables
+        assert fifa_meta.load_compiled(schema.read_bytes()).tables.keys() == meta.tables.keys()
+
+
+class TestReader:
+    """Test decoding tables from a save."""
+
+    def test_integers_apply_rangelow(self, save_file):
+        with SaveReader(save_file) as reader:
+            players = reader.table("players")
+            columns = players.read(["playerid", "overallrating", "height"])
+
+        assert columns["playerid"].tolist() == [158023, 20801]
+        assert columns["overallrating"].tolist() == [93, 90]
+        assert columns["height"].tolist() == [170, 187]
+
+    def test_strings_and_rangelow_offsets(self, save_file):
+        with SaveReader(save_file) as reader:
+            rows = reader.table("dcplayernames").to_rows()
+
+        assert rows == [
+            {"nameid": 44001, "name": "Édson"},
+            {"nameid": 44002, "name": "Arantes"},
+        ]
+
+    def test_reals(self, save_file):
+        with SaveReader(save_file) as reader:
+            table = reader.databases[2].table(reader.databases[2].table_names[0])
+            values = table.column("cpmorph_ear_tweak_e")
+
+        assert values.dtype == np.float32
+        assert values.tolist() == [0.5]
+
+    def test_later_database_wins_like_merged_output(self, save_file):
+        with SaveReader(save_file) as reader:
+            assert reader.table("teams").to_rows() == [{"teamid": 2}]
+            assert reader.table("teams", db=0).to_rows() == [{"teamid": 1}]
+
+    def test_iter_tables_honors_projection(self, save_file):
+        with SaveReader(save_file) as reader:
+            tables = list(reader.iter_tables({"players": ["playerid"]}))
+
+        assert tables == [(1, "players", [{"playerid": 158023}, {"playerid": 20801}])]
+
+    def test_fingerprints_change_only_with_table_bytes(self, tmp_path, save_file):
+        changed = write_save(tmp_path / "CmMgrC0002", [[158023, 93, 40], [20801, 89, 57]])
+
+        with SaveReader(save_file) as before, SaveReader(changed) as after:
+            assert before.databases[1].fingerprint("players") != after.databases[1].fingerprint("players")
+            assert before.databases[1].fingerprint("teams") == after.databases[1].fingerprint("teams")
+            assert before.databases[0].fingerprint("dcplayernames") == after.databases[0].fingerprint(
+                "dcplayernames"
+            )
+
+
+class TestNativeEngine:
+    """Test ParserBridge with engine="native"."""
+
+    @pytest.fixture
+    def bridge(self, tmp_path):
+        return ParserBridge(engine="native", cache=ParseCache(tmp_path / "cache"))
+
+    def test_parse_save_without_node(self, bridge, save_file):
+        data = bridge.parse_save(save_file, projection={"players": None, "teams": None})
+
+        assert data["teams"] == [{"teamid": 2}]
+        assert [row["playerid"] for row in data["players"]] == [158023, 20801]
+
+    def test_read_single_table(self, bridge, save_file):
+        columns = bridge.read_table("players", save_file, columns=["overallrating"])
+
+        assert list(columns) == ["overallrating"]
+        assert columns["overallrating"].tolist() == [93, 90]
+
+    def test_next_save_decodes_only_changed_tables(self, bridge, tmp_path, save_file, monkeypatch):
+        bridge.parse_save(save_file)
+        changed = write_save(tmp_path / "CmMgrC0002", [[158023, 93, 40], [20801, 89, 57]])
+
+        decoded = []
+        to_rows = TableReader.to_rows
+        monkeypatch.setattr(
+            TableReader, "to_rows", lambda self, columns=None: decoded.append(self.name) or to_rows(self, columns)
+        )
+        data = bridge.parse_save(changed)
+
+        assert decoded == ["players"]
+        assert data["players"][0]["overallrating"] == 94
+        assert data["teams"] == [{"teamid": 2}]
+
+    def test_one_cache_layer(self, bridge, save_file, monkeypatch):
+        bridge.parse_save(save_file)
+        decoded = []
+        to_rows = TableReader.to_rows
+        monkeypatch.setattr(
+            TableReader, "to_rows", lambda self, columns=None: decoded.append(self.name) or to_rows(self, columns)
+        )
+        bridge.parse_save(save_file)
+
+        entries = [path.name for path in bridge.cache.cache_dir.iterdir()]
+        assert entries and all(name.startswith("table-") for name in entries)
+        assert decoded == []
+
+    def test_compressed_strings_are_refused(self, tmp_path):
+        names = build_table([("FuiB", 3, 13), ("vIys", 0, 304)], [[1, b"\x9c\x01"]], compressed_strings=2)
+        path = tmp_path / "CmMgrC0003"
+        path.write_bytes(b"career header" + build_database({"bneD": names}))
+
+        with SaveReader(str(path)) as reader:
+            assert reader.compressed_tables() == ["dcplayernames"]
+            with pytest.raises(ValueError, match="compressed strings"):
+                reader.table("dcplayernames").column("nameid")
+
+    def test_compressed_strings_fall_back_to_node(self, bridge, tmp_path, monkeypatch):
+        names = build_table([("FuiB", 3, 13), ("vIys", 0, 304)], [[1, b"\x9c\x01"]], compressed_strings=2)
+        path = tmp_path / "CmMgrC0003"
+        path.write_bytes(b"career header" + build_database({"bneD": names}))
+        from_node = [{"type": "table", "db": 0, "table": "dcplayernames", "rows": [{"nameid": 44001, "name": "Edson"}]}]
+        monkeypatch.setattr(bridge, "_iter_parser_messages", lambda *args: iter(from_node))
+
+        assert bridge.parse_save(str(path)) == {"dcplayernames": [{"nameid": 44001, "name": "Edson"}]}
+
+    @pytest.mark.skipif(not node_parser_available(), reason="Node.js parser not installed")
+    def test_matches_node_parser(self, bridge, save_file, tmp_path):
+        node = ParserBridge(use_worker=False, engine="node", cache=ParseCache(tmp_path / "node"))
+
+        def tables(parser):
+            merged = {}
+            for db, name, rows in parser.iter_database_tables(save_file, use_cache=False):
+                merged.setdefault((db, name), []).extend(rows)
+            return merged
+
+        assert tables(bridge) == tables(node)
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError, match="Unknown parser engine"):
+            ParserBridge(engine="java")
@@ -0,0 +1,93 @@
+"""
+Tests for the snapshot history written by the importer.
+"""
+
+import numpy as np
+import pytest
+
+from src.database.history import latest_snapshot_ids, list_snapshots, player_evolution, players_at, state_at
+from src.database.models import PlayerHistory
+
+
+@pytest.fixture
+def import_overalls(db_session, make_importer):
+    """
+    Import one player per playerid -> overall, as row dicts or (arrays)
+    as {column: array} tables like the columnar path; returns the snapshot id
+    """
+    def run(overalls, label=None, arrays=False):
+        data = {
+            "players": [
+                {"playerid": playerid, "firstnameid": 1, "lastnameid": 2} for playerid in overalls
+            ],
+            "career_playergrowthuserseason": [
+                {"playerid": playerid, "overall": overall, "potential": 95, "age": 20}
+                for playerid, overall in overalls.items()
+            ],
+        }
+        if arrays:
+            data = {
+                name: {column: np.array([row[column] for row in rows]) for column in rows[0]}
+                for name, rows in data.items()
+            }
+        importer = make_importer(label=label)
+        importer._import_players(data)
+        return importer.snapshot_id
+
+    return run
+
+
+class TestHistory:
+    """Test deduplicated snapshots and the queries over them."""
+
+    def test_only_changed_players_are_stored(self, db_session, import_overalls):
+        first = import_overalls({1: 80, 2: 81, 3: 82}, label="2025/26")
+        second = import_overalls({1: 80, 2: 85, 3: 82, 4: 70}, label="2026/27")
+
+        assert db_session.query(PlayerHistory).filter_by(snapshot_id=first).count() == 3
+        assert {row.playerid for row in db_session.query(PlayerHistory).filter_by(snapshot_id=second)} == {2, 4}
+        assert [(s.label, s.player_count, s.changed_count) for s in list_snapshots(db_session)] == [
+            ("2025/26", 3, 3),
+            ("2026/27", 4, 2),
+        ]
+
+    def test_identical_save_records_no_snapshot(self, db_session, import_overalls):
+        import_overalls({1: 80, 2: 81})
+
+        assert import_overalls({1: 80, 2: 81}) is None
+        assert len(list_snapshots(db_session)) == 1
+
+    def test_identical_save_through_other_parse_path(self, db_session, import_overalls):
+        import_overalls({1: 80, 2: 81})
+
+        assert import_overalls({1: 80, 2: 81}, arrays=True) is None
+        assert import_overalls({1: 80, 2: 81}) is None
+        assert len(list_snapshots(db_session)) == 1
+
+    def test_point_in_time_state(self, db_session, import_overalls):
+        first = import_overalls({1: 80, 2: 81, 3: 82})
+        second = import_overalls({1: 88, 3: 82})
+        third = import_overalls({1: 88, 2: 75, 3: 82})
+
+        def overalls(snapshot_id):
+            return {row.playerid: row.overallrating for row in state_at(db_session, snapshot_id)}
+
+        assert overalls(first) == {1: 80, 2: 81, 3: 82}
+        assert overalls(second) == {1: 88, 3: 82}  # 2 removed
+        assert overalls(third) == {1: 88, 2: 75, 3: 82}  # 2 back
+        assert [p.playerid for p in players_at(db_session, first, [PlayerHistory.overallrating.desc()], 2)] == [3, 2]
+        assert latest_snapshot_ids(db_session, 2) == [second, third]
+
+    def test_player_evolution(self, db_session, import_overalls):
+        import_overalls({1: 80, 2: 81}, label="a")
+        import_overalls({2: 81}, label="b")
+        import_overalls({1: 84, 2: 81}, label="c")
+
+        evolution = player_evolution(db_session, 1)
+
+        assert [(row.label, row.removed, row.overallrating) for row in evolution] == [
+            ("a", False, 80),
+            ("b", True, None),
+            ("c", False, 84),
+        ]
+        assert len(player_evolution(db_session, 2)) == 1
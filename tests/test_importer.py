@@ -0,0 +1,278 @@
+"""
+Tests for the save import pipeline.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sqlalchemy import create_engine, inspect
+
+from src.core.importer import NameResolver, SaveImporter, frame_columns
+from src.core.parser_bridge import parser_bridge
+from src.database.models import Player, PlayerInfo, SquadStats, ensure_schema, profile_engine
+from src.database.stats import get_snapshot
+
+
+def parsed(overall=90):
+    return {
+        "players": [
+            {"playerid": playerid, "firstnameid": 1, "lastnameid": 2, "nationality": 54}
+            for playerid in range(1, 6)
+        ],
+        "career_playergrowthuserseason": [
+            {"playerid": playerid, "overall": overall, "potential": 95, "age": 20}
+            for playerid in range(1, 6)
+        ],
+    }
+
+
+class TestBulkUpsert:
+    """Test batched player upserts."""
+
+    def test_players_inserted_across_batches(self, db_session, import_players):
+        stats = import_players(parsed())
+
+        assert stats == {
+            "players_imported": 5,
+            "players_updated": 0,
+            "players_unchanged": 0,
+            "players_removed": 0,
+        }
+        assert db_session.query(Player).count() == 5
+        player = db_session.get(Player, 3)
+        assert (player.firstname, player.surname, player.overallrating) == ("Edson", "Arantes", 90)
+        assert (player.growth_potential, player.is_named) == (5, True)
+        assert db_session.get(PlayerInfo, 3).nationality == 54
+
+    def test_reimport_updates_in_place(self, db_session, import_players):
+        import_players(parsed(overall=90))
+        import_players(parsed(overall=80))
+
+        assert db_session.query(Player).count() == 5
+        assert {player.overallrating for player in db_session.query(Player)} == {80}
+
+
+class TestIncrementalImport:
+    """Test that re-imports only write rows that changed."""
+
+    def test_unchanged_save_touches_nothing(self, db_session, import_players):
+        import_players(parsed())
+        before = {p.playerid: p.updated_at for p in db_session.query(Player)}
+
+        stats = import_players(parsed())
+
+        db_session.expire_all()
+        assert stats["players_unchanged"] == 5
+        assert stats["players_updated"] == stats["players_imported"] == 0
+        assert {p.playerid: p.updated_at for p in db_session.query(Player)} == before
+
+    def test_changed_new_and_removed_players(self, db_session, import_players):
+        import_players(parsed())
+        before = {p.playerid: p.updated_at for p in db_session.query(Player)}
+
+        data = parsed()
+        data["players"] = [row for row in data["players"] if row["playerid"] != 5]
+        data["players"].append({"playerid": 6, "firstnameid": 1})
+        data["career_playergrowthuserseason"][0]["overall"] = 70
+        stats = import_players(data)
+
+        db_session.expire_all()
+        assert stats == {
+            "players_imported": 1,
+            "players_updated": 1,
+            "players_unchanged": 3,
+            "players_removed": 1,
+        }
+        assert db_session.get(Player, 5) is None
+        assert db_session.get(PlayerInfo, 5) is None
+        assert db_session.get(Player, 1).overallrating == 70
+        assert db_session.get(Player, 1).updated_at > before[1]
+        assert db_session.get(Player, 2).updated_at == before[2]
+
+    def test_reimport_through_other_parse_path_is_unchanged(self, db_session, import_players):
+        data = parsed()
+        # {column: array} input, like the columnar path: no all-null columns
+        # (height, weight, ...) as object/None, they are missing entirely
+        arrays = {
+            name: {column: np.array([row[column] for row in rows]) for column in rows[0]}
+            for name, rows in data.items()
+        }
+        import_players(data)
+
+        stats = import_players(arrays)
+
+        assert (stats["players_updated"], stats["players_unchanged"]) == (0, 5)
+
+    def test_import_refreshes_snapshot(self, db_session, import_players):
+        import_players(parsed(overall=90))
+        first = db_session.get(SquadStats, 1)
+        assert (first.total_players, first.avg_overall) == (5, 90)
+
+        import_players(parsed(overall=80))
+
+        db_session.expire_all()
+        assert get_snapshot(db_session).avg_overall == 80
+
+
+class TestProfiles:
+    """Test that imports keep their PRAGMAs to their own connections."""
+
+    def test_import_leaves_shared_connections_alone(self, db_session, import_players):
+        def cache_size(connection):
+            return connection.exec_driver_sql("PRAGMA cache_size").scalar()
+
+        shared = db_session.connection()
+        import_players(parsed())
+
+        assert cache_size(shared) == -65536  # read profile, still pooled
+        with profile_engine("import").connect() as connection:
+            assert cache_size(connection) == -262144
+        assert db_session.query(Player).count() == 5
+
+
+class TestFastLoad:
+    """Test reloading through staging tables."""
+
+    @pytest.mark.parametrize("update_from", [True, False])
+    def test_fast_load_swaps_tables_and_rebuilds_indexes(
+        self, db_session, import_players, make_importer, monkeypatch, update_from
+    ):
+        # False: the correlated-subquery fallback of SQLite < 3.33
+        monkeypatch.setattr(sys.modules[SaveImporter.__module__], "UPDATE_FROM", update_from)
+        import_players(parsed())
+        before = {p.playerid: (p.created_at, p.updated_at) for p in db_session.query(Player)}
+        db_session.close()
+
+        importer = make_importer(fast_load=True)
+        data = parsed()
+        data["career_playergrowthuserseason"][0]["overall"] = 70
+        stats = importer._import_players(data)
+
+        assert stats["players_updated"] == 1 and stats["players_unchanged"] == 4
+        assert {"stage", "swap", "index"} <= set(importer.timings)
+        assert db_session.query(Player).count() == 5
+        player = db_session.get(Player, 1)
+        assert player.overallrating == 70
+        assert player.created_at == before[1][0] and player.updated_at > before[1][1]
+        assert (db_session.get(Player, 2).created_at, db_session.get(Player, 2).updated_at) == before[2]
+
+        inspector = inspect(db_session.get_bind())
+        assert "players_staging" not in inspector.get_table_names()
+        assert {index["name"] for index in inspector.get_indexes("players")} >= {
+            "ix_players_firstname",
+            "ix_players_overall_listing",
+        }
+
+
+class TestEnsureSchema:
+    """Test the lightweight schema migration."""
+
+    def test_missing_columns_added(self, tmp_path):
+        bind = create_engine(f"sqlite:///{tmp_path}/old.db")
+        with bind.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE player_info (playerid INTEGER PRIMARY KEY, firstname VARCHAR(50))"
+            )
+
+        ensure_schema(bind)
+
+        columns = {column["name"] for column in inspect(bind).get_columns("player_info")}
+        assert {"row_hash", "surname", "nationality"} <= columns
+        assert "players" in inspect(bind).get_table_names()
+
+    def test_added_derived_columns_backfilled(self, tmp_path):
+        bind = create_engine(f"sqlite:///{tmp_path}/old.db")
+        with bind.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE players (playerid INTEGER PRIMARY KEY, firstname VARCHAR(50),"
+                " surname VARCHAR(50), overallrating INTEGER, potential INTEGER)"
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO players VALUES (1, 'Edson', 'Arantes', 90, 95), (2, 'Unknown_2', '', 70, NULL)"
+            )
+            connection.exec_driver_sql("CREATE INDEX ix_players_overallrating ON players (overallrating)")
+
+        ensure_schema(bind)
+
+        with bind.connect() as connection:
+            rows = connection.exec_driver_sql(
+                "SELECT growth_potential, is_named FROM players ORDER BY playerid"
+            ).all()
+        assert rows == [(5, 1), (0, 0)]
+        indexes = {index["name"] for index in inspect(bind).get_indexes("players")}
+        assert {"ix_players_named", "ix_players_overall_listing"} <= indexes
+        assert "ix_players_overallrating" not in indexes  # Retired
+
+
+class TestPlayerFrames:
+    """Test the vectorized join, name resolution and clamping."""
+
+    def test_edited_names_take_priority(self):
+        resolver = NameResolver(
+            {
+                "dcplayernames": [{"nameid": 1, "name": "Edson"}, {"nameid": 2, "name": "Arantes"}],
+                "editedplayernames": [{"playerid": 2, "firstname": "", "surname": "Pelé", "commonname": ""}],
+            }
+        )
+        players = pd.DataFrame(
+            {"playerid": [1, 2, 3], "firstnameid": [1, 1, 0], "lastnameid": [2, 2, None], "commonnameid": [0, 0, 9]}
+        )
+
+        names = resolver.resolve_frame(players)
+
+        assert names.to_dict("records") == [
+            {"firstname": "Edson", "surname": "Arantes", "commonname": None},
+            {"firstname": None, "surname": "Pelé", "commonname": None},
+            {"firstname": None, "surname": None, "commonname": None},
+        ]
+
+    def test_join_defaults_and_clamping(self, make_importer):
+        players, info = make_importer()._build_player_frames(
+            [{"playerid": 1, "firstnameid": 7}, {"playerid": 2}, {"firstnameid": 1}],
+            [{"playerid": 1, "overallrating": 30, "potential": 120, "age": 60, "height": 181}],
+        )
+        rows = frame_columns(players)
+
+        assert rows["playerid"] == [1, 2]
+        assert rows["firstname"] == ["Unknown_1", "Unknown_2"]
+        assert rows["surname"] == ["", ""]
+        assert rows["overallrating"] == [40, 40]
+        assert rows["potential"] == [99, 40]
+        assert rows["age"] == [50, 16]
+        assert rows["height"] == [181, None]
+        assert rows["growth_potential"] == [59, 0]
+        assert rows["is_named"] == [False, False]
+        assert frame_columns(info)["firstname"] == ["Unknown_1", "Unknown_2"]
+
+    def test_array_tables_match_row_tables(self, make_importer):
+        data = parsed()
+        arrays = {
+            name: {column: np.array([row[column] for row in rows]) for column in rows[0]}
+            for name, rows in data.items()
+        }
+
+        from_rows = make_importer()._build_player_frames(*data.values())
+        from_arrays = make_importer()._build_player_frames(*arrays.values())
+
+        for expected, actual in zip(from_rows, from_arrays):
+            assert frame_columns(actual) == frame_columns(expected)
+
+    def test_last_database_wins_for_player_tables(self, monkeypatch):
+        batches = [
+            (0, "players", [{"playerid": 1}, {"playerid": 2}]),
+            (1, "players", [{"playerid": 3}]),
+            (1, "players", [{"playerid": 4}]),
+            (0, "dcplayernames", [{"nameid": 1, "name": "Edson"}]),
+        ]
+        monkeypatch.setattr(parser_bridge, "iter_database_tables", lambda *args, **kwargs: iter(batches))
+        importer = SaveImporter()
+        importer.name_resolver = NameResolver()
+
+        tables = importer._collect_tables("save")
+
+        assert tables["players"] == [{"playerid": 3}, {"playerid": 4}]
+        assert tables["career_playergrowthuserseason"] == []
+        assert importer.name_resolver.dcplayernames == {1: "Edson"}
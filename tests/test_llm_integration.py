@@ -6,7 +6,7 @@ import pytest
 import os
 from unittest.mock import Mock, patch
 from llm import GeminiClient, PromptBuilder, ContextBuilder
-from database.models import Player
+from src.database.models import SquadStats
 
 
 class TestGeminiClient:
@@ -83,43 +83,26 @@ class TestContextBuilder:
         """Create mock database session."""
         db = Mock()
 
-        # Mock players
-        mock_player = Mock(spec=Player)
-        mock_player.playerid = 1
-        mock_player.firstname = "Test"
-        mock_player.surname = "Player"
-        mock_player.commonname = "Test Player"
-        mock_player.overallrating = 85
-        mock_player.potential = 90
-        mock_player.age = 22
-        mock_player.preferredposition1 = "ST"
-
-        # Mock detailed_display property
-        mock_player.detailed_display = "Test Player (OVR 85, ST)"
-
-        # Setup mock chain: db.query().filter().order_by().limit().all()
-        query_mock = db.query.return_value
-        filter_mock = query_mock.filter.return_value
-        order_by_mock = filter_mock.order_by.return_value
-        limit_mock = order_by_mock.limit.return_value
-        limit_mock.all.return_value = [mock_player]
-
-        # Also setup for simple query: db.query().limit().all()
-        query_mock.limit.return_value.all.return_value = [mock_player]
-
-        # Count
-        query_mock.count.return_value = 1
-
-        # First (for summary)
-        order_by_mock.first.return_value = mock_player
-
-        # Scalar (for avg)
-        query_mock.scalar.return_value = 85.0
+        # Listings read PlayerView rows: db.execute(select).all()
+        # (playerid, firstname, surname, commonname, overallrating,
+        #  potential, age, preferredposition1)
+        db.execute.return_value.all.return_value = [
+            (1, "Test", "Player", "Test Player", 85, 90, 22, "ST")
+        ]
 
         return db
 
     def test_build_summary_context(self, mock_db):
         """Test summary context building."""
+        # Summary reads the squad stats snapshot
+        mock_db.get.return_value = SquadStats(
+            total_players=1,
+            named_players=1,
+            avg_overall=85.0,
+            avg_age=22.0,
+            top_players=[[1, "Test", "Player", "Test Player", 85, 90, 22, "ST"]],
+            named_sample=[],
+        )
         builder = ContextBuilder(mock_db)
         context = builder.build_context("summary", limit=10)
 
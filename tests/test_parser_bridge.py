@@ -0,0 +1,456 @@
+"""
+Tests for the Node.js parser bridge.
+"""
+
+import gzip
+import io
+import json
+import os
+import queue
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from src.core.columnar import load_columnar
+from src.core.parse_cache import ParseCache
+from src.core.parser_bridge import ParserBridge
+from src.core.parser_worker import ParserWorker
+
+
+class FakeProcess:
+    """Minimal stand-in for subprocess.Popen in stream mode."""
+
+    def __init__(self, messages, returncode=0, stderr=""):
+        lines = "".join(json.dumps(m) + "\n" for m in messages)
+        self.stdout = io.StringIO(lines)
+        self.stderr = io.StringIO(stderr)
+        self.returncode = returncode
+
+    def wait(self):
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+class HungStdout:
+    """stdout of a parser that never writes: blocks until killed is set."""
+
+    def __init__(self, killed):
+        self.killed = killed
+
+    def __iter__(self):
+        self.killed.wait(5)
+        return iter(())
+
+    def close(self):
+        pass
+
+
+class HeartbeatStderr:
+    """stderr of a parser whose parse hangs while its heartbeat timer runs."""
+
+    def __init__(self, killed):
+        self.killed = killed
+
+    def __iter__(self):
+        while not self.killed.wait(0.02):
+            yield json.dumps({"type": "heartbeat", "stage": "parse", "elapsed": 1}) + "\n"
+
+    def close(self):
+        pass
+
+
+def table(db, name, rows):
+    return {"type": "table", "db": db, "table": name, "rows": rows}
+
+
+END = {"type": "end", "tableCount": 0, "totalRecords": 0}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def bridge(cache):
+    return ParserBridge(use_worker=False, cache=cache)
+
+
+class TestStreaming:
+    """Test NDJSON stream consumption."""
+
+    def test_iter_tables_yields_batches(self, bridge):
+        messages = [
+            table(0, "players", [{"playerid": 1}]),
+            table(0, "players", [{"playerid": 2}]),
+            END,
+        ]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            batches = list(bridge.iter_tables("save"))
+
+        assert batches == [
+            ("players", [{"playerid": 1}]),
+            ("players", [{"playerid": 2}]),
+        ]
+
+    def test_parse_save_later_database_wins(self, bridge):
+        messages = [
+            table(0, "teams", [{"teamid": 1}]),
+            table(0, "teams", [{"teamid": 2}]),
+            table(1, "teams", [{"teamid": 3}]),
+            END,
+        ]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            data = bridge.parse_save("save")
+
+        assert data == {"teams": [{"teamid": 3}]}
+
+    def test_merge_save_keeps_shadowed_tables(self, bridge):
+        messages = [
+            table(0, "teams", [{"teamid": 1}]),
+            table(0, "players", [{"playerid": 1}]),
+            table(1, "teams", [{"teamid": 3}]),
+            END,
+        ]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            merger = bridge.merge_save("save")
+
+        assert merger.source_db == {"teams": 1, "players": 0}
+        assert merger.conflicts == {"teams": [0, 1]}
+        assert merger.with_shadowed()["teams@db0"] == [{"teamid": 1}]
+
+    def test_truncated_stream_raises(self, bridge):
+        messages = [table(0, "players", [{"playerid": 1}])]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            with pytest.raises(RuntimeError, match="ended unexpectedly"):
+                bridge.parse_save("save")
+
+    def test_parser_failure_raises(self, bridge):
+        with patch("subprocess.Popen", return_value=FakeProcess([], returncode=1)):
+            with pytest.raises(RuntimeError, match="exited with code 1"):
+                bridge.parse_save("save")
+
+    def test_progress_events_read_from_stderr(self, bridge, capsys):
+        events = [
+            {"type": "progress", "stage": "parse", "databasesParsed": 1, "totalDatabases": 2},
+            {"type": "progress", "stage": "stream", "tablesParsed": 1, "rows": 1, "rowsPerSec": 500},
+        ]
+        stderr = "Parsing...\n" + "".join(json.dumps(e) + "\n" for e in events)
+        seen = []
+        bridge.progress_callback = lambda progress: seen.append(progress.stage)
+        messages = [table(0, "players", [{"playerid": 1}]), END]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages, stderr=stderr)):
+            bridge.parse_save("save")
+
+        assert seen == ["parse", "stream"]
+        assert bridge.progress.rows_per_sec == 500
+        assert "Parsing..." in capsys.readouterr().err  # Plain logs pass through
+
+    def test_stalled_parser_is_killed(self, bridge):
+        bridge.stall_timeout = 0.2
+        process = FakeProcess([])
+        killed = threading.Event()
+        # stdout blocks like a hung parser until kill() closes it
+        process.stdout = HungStdout(killed)
+        process.kill = killed.set
+
+        with patch("subprocess.Popen", return_value=process):
+            with pytest.raises(RuntimeError, match="stalled"):
+                bridge.parse_save("save")
+
+    def test_heartbeats_do_not_hold_off_stall(self, bridge):
+        bridge.stall_timeout = 0.2
+        process = FakeProcess([])
+        killed = threading.Event()
+        process.stdout = HungStdout(killed)
+        process.stderr = HeartbeatStderr(killed)
+        process.kill = killed.set
+
+        with patch("subprocess.Popen", return_value=process):
+            with pytest.raises(RuntimeError, match="stalled"):
+                bridge.parse_save("save")
+        assert bridge.progress.events > 0  # Heartbeats still reached the display
+
+    def test_jobs_passed_to_parser(self, cache):
+        bridge = ParserBridge(use_worker=False, cache=cache, jobs=2)
+        cmd = bridge._build_command("save")
+
+        assert cmd[cmd.index("--jobs") + 1] == "2"
+
+    def test_lazy_mode_passed_to_parser(self, cache):
+        assert "--lazy" in ParserBridge(use_worker=False, cache=cache, lazy=True)._build_command()
+        assert "--lazy" not in ParserBridge(use_worker=False, cache=cache, lazy=False)._build_command()
+
+
+class TestProjection:
+    """Test table/column projection."""
+
+    def test_projection_passed_to_parser(self, bridge):
+        cmd = bridge._build_command("save", {"players": ["playerid"]})
+
+        assert cmd[cmd.index("--projection") + 1] == '{"players":["playerid"]}'
+
+    def test_unprojected_tables_and_columns_dropped(self, bridge):
+        messages = [
+            table(0, "players", [{"playerid": 1, "gkkicking": 12}]),
+            table(0, "teams", [{"teamid": 1}]),
+            END,
+        ]
+        projection = {"players": ["playerid"]}
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            data = bridge.parse_save("save", projection=projection)
+
+        assert data == {"players": [{"playerid": 1}]}
+
+    def test_import_projection_covers_importer_tables(self):
+        from src.core.importer import PLAYER_TABLES, NAME_TABLES
+        from src.core.projection import IMPORT_PROJECTION
+
+        assert set(IMPORT_PROJECTION) == set(PLAYER_TABLES) | set(NAME_TABLES)
+
+
+class TestWorker:
+    """Test routing through the persistent parser worker."""
+
+    def test_parse_uses_worker_request(self, cache):
+        bridge = ParserBridge(use_worker=True, cache=cache)
+        messages = [table(0, "players", [{"playerid": 1}]), END]
+
+        with patch.object(bridge.worker, "request", return_value=iter(messages)) as req:
+            data = bridge.parse_save("save")
+
+        payload = req.call_args[0][0]
+        assert payload["cmd"] == "parse"
+        assert payload["savePath"] == "save"
+        assert data == {"players": [{"playerid": 1}]}
+
+    def test_worker_heartbeats_do_not_hold_off_stall(self, tmp_path):
+        worker = ParserWorker(tmp_path)
+        stop = threading.Event()
+
+        def heartbeats():
+            while not stop.wait(0.02):
+                worker._messages.put({"id": 1, "type": "heartbeat", "stage": "parse"})
+
+        threading.Thread(target=heartbeats, daemon=True).start()
+        try:
+            with patch.object(worker, "ensure_running"), patch.object(worker, "_send"), patch.object(
+                worker, "_kill"
+            ) as kill:
+                with pytest.raises(RuntimeError, match="stalled"):
+                    list(worker.request({"cmd": "parse"}, stall_timeout=0.2))
+        finally:
+            stop.set()
+        kill.assert_called_once()
+
+    def test_worker_skips_non_json_lines(self, capsys):
+        process = FakeProcess([])
+        process.stdout = io.StringIO('{"type": "ready"}\nloading module...\n{"type": "pong"}\n')
+        messages = queue.Queue()
+
+        ParserWorker._read_stdout(process, messages)
+
+        assert [messages.get_nowait() for _ in range(3)] == [{"type": "ready"}, {"type": "pong"}, None]
+        assert "loading module..." in capsys.readouterr().err
+
+
+class TestParseCache:
+    """Test the content-addressed parse cache."""
+
+    @pytest.fixture
+    def save_file(self, tmp_path):
+        path = tmp_path / "CmMgrC0001"
+        path.write_bytes(b"career save bytes")
+        return str(path)
+
+    def test_second_parse_is_cache_hit(self, bridge, save_file):
+        messages = [table(0, "players", [{"playerid": 1}, {"playerid": 2}]), END]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)) as popen:
+            first = bridge.parse_save(save_file)
+            second = bridge.parse_save(save_file)
+
+        assert popen.call_count == 1
+        assert first == second == {"players": [{"playerid": 1}, {"playerid": 2}]}
+
+    def test_cache_hit_keeps_conflicts(self, bridge, save_file):
+        messages = [table(0, "teams", [{"teamid": 1}]), table(1, "teams", [{"teamid": 2}]), END]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            bridge.merge_save(save_file)
+            merger = bridge.merge_save(save_file)
+
+        assert merger.tables == {"teams": [{"teamid": 2}]}
+        assert merger.shadowed == {("teams", 0): [{"teamid": 1}]}
+
+    def test_projection_is_part_of_key(self, bridge, save_file):
+        messages = [table(0, "players", [{"playerid": 1}]), END]
+        with patch("subprocess.Popen", side_effect=lambda *a, **k: FakeProcess(messages)) as popen:
+            bridge.parse_save(save_file)
+            bridge.parse_save(save_file, projection={"players": ["playerid"]})
+
+        assert popen.call_count == 2
+
+    def test_changed_save_misses(self, bridge, save_file):
+        messages = [table(0, "players", [{"playerid": 1}]), END]
+        with patch("subprocess.Popen", side_effect=lambda *a, **k: FakeProcess(messages)) as popen:
+            bridge.parse_save(save_file)
+            with open(save_file, "ab") as f:
+                f.write(b"next season")
+            bridge.parse_save(save_file)
+
+        assert popen.call_count == 2
+
+    def test_miss_writes_batches_as_they_stream(self, bridge, cache, save_file):
+        messages = [
+            table(0, "players", [{"playerid": 1}]),
+            table(0, "players", [{"playerid": 2}]),
+            table(1, "teams", [{"teamid": 1}]),
+            END,
+        ]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            stream = bridge.iter_database_tables(save_file)
+            next(stream)
+            next(stream)
+            # Both batches are on disk before the stream is done
+            (staging,) = cache.cache_dir.glob("*.tmp-*")
+            assert [path.name for path in staging.iterdir()] == ["000000.pkl"]
+            rest = list(stream)
+
+        assert rest == [(1, "teams", [{"teamid": 1}])]
+        assert list(cache.cache_dir.glob("*.tmp-*")) == []
+        with patch("subprocess.Popen") as popen:
+            assert list(bridge.iter_database_tables(save_file)) == [
+                (0, "players", [{"playerid": 1}]),
+                (0, "players", [{"playerid": 2}]),
+                (1, "teams", [{"teamid": 1}]),
+            ]
+        assert popen.call_count == 0
+
+    def test_incomplete_stream_is_not_cached(self, bridge, cache, save_file):
+        messages = [table(0, "players", [{"playerid": 1}])]
+        with patch("subprocess.Popen", return_value=FakeProcess(messages)):
+            with pytest.raises(RuntimeError, match="ended unexpectedly"):
+                bridge.parse_save(save_file)
+
+        assert list(cache.cache_dir.iterdir()) == []
+
+    def test_lru_eviction_drops_least_recently_used(self, tmp_path):
+        entry = [(0, "players", [{"playerid": 1}])]
+        cache = ParseCache(tmp_path / "cache")
+        cache.put("a", entry)
+        entry_size = ParseCache._entry_size(tmp_path / "cache" / "a.rows")
+
+        cache.max_bytes = int(entry_size * 2.5)
+        cache.put("b", entry)
+        os.utime(tmp_path / "cache" / "a.rows", (100, 100))
+        os.utime(tmp_path / "cache" / "b.rows", (200, 200))
+        cache.get("a")  # a becomes most recently used
+        cache.put("c", entry)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+
+class TestColumnar:
+    """Test reading the parser's columnar output."""
+
+    @pytest.fixture
+    def columnar_dir(self, tmp_path):
+        np.array([7, 8, 9], dtype="<i4").tofile(tmp_path / "players.playerid.i32")
+        np.array([1, 0, 1], dtype="u1").tofile(tmp_path / "players.age.valid.u8")
+        np.array([21, 0, 30], dtype="<i4").tofile(tmp_path / "players.age.i32")
+        np.array([0, -1, 0], dtype="<i4").tofile(tmp_path / "players.pos.codes.i32")
+        (tmp_path / "players.pos.dict.json").write_text('["ST"]')
+        manifest = {
+            "version": 1,
+            "tables": {
+                "players": {
+                    "db": 1,
+                    "rows": 3,
+                    "columns": {
+                        "playerid": {"type": "int32", "file": "players.playerid.i32"},
+                        "age": {
+                            "type": "int32",
+                            "file": "players.age.i32",
+                            "valid": "players.age.valid.u8",
+                        },
+                        "pos": {
+                            "type": "string",
+                            "file": "players.pos.codes.i32",
+                            "dictionary": "players.pos.dict.json",
+                        },
+                    },
+                }
+            },
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        return tmp_path
+
+    def test_columns_are_memory_mapped(self, columnar_dir):
+        players = load_columnar(columnar_dir)["players"]
+
+        assert isinstance(players.column("playerid"), np.memmap)
+        assert players.column("playerid").tolist() == [7, 8, 9]
+
+    def test_rows_match_json_format(self, columnar_dir):
+        players = load_columnar(columnar_dir)["players"]
+
+        expected = [
+            {"playerid": 7, "age": 21, "pos": "ST"},
+            {"playerid": 8},
+            {"playerid": 9, "age": 30, "pos": "ST"},
+        ]
+        assert players.to_rows() == expected
+        assert list(players) == expected
+
+
+class TestOutputFile:
+    """Test loading parse_save.js file output."""
+
+    DATA = {"players": [{"playerid": 1}], "teams": [{"teamid": 2}]}
+
+    def test_plain_json(self, bridge, tmp_path):
+        path = tmp_path / "test_parse.json"
+        path.write_text(json.dumps(self.DATA, indent=2), encoding="utf-8")
+
+        assert bridge.load_output(path) == self.DATA
+
+    def test_merge_metadata_restores_provenance(self, bridge, tmp_path):
+        path = tmp_path / "test_parse.json"
+        document = {
+            **self.DATA,
+            "teams@db0": [{"teamid": 1}],
+            "_merge": {
+                "sources": {"players": 1, "teams": 1},
+                "conflicts": [{"table": "teams", "databases": [0, 1], "kept": 1}],
+            },
+        }
+        path.write_text(json.dumps(document), encoding="utf-8")
+
+        merger = bridge.read_output(path)
+
+        assert bridge.load_output(path) == self.DATA
+        assert merger.source_db == {"players": 1, "teams": 1}
+        assert merger.conflicts == {"teams": [0, 1]}
+
+    def test_gzip_detected_by_magic_bytes(self, bridge, tmp_path):
+        path = tmp_path / "test_parse.json"  # No .gz extension on purpose
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.DATA, f, separators=(",", ":"))
+
+        assert bridge.load_output(path) == self.DATA
+
+    def test_newest_output_is_default(self, bridge, tmp_path):
+        bridge.output_file = tmp_path / "test_parse.json"
+        bridge.output_file.write_text('{"old": []}', encoding="utf-8")
+        os.utime(bridge.output_file, (100, 100))
+        with gzip.open(tmp_path / "test_parse.json.gz", "wt", encoding="utf-8") as f:
+            json.dump(self.DATA, f)
+
+        assert bridge.load_output() == self.DATA
@@ -0,0 +1,95 @@
+"""
+Tests for the player read queries.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, inspect
+
+from src.database.models import Player, PlayerInfo
+from src.database.queries import PlayerView, count_players, load_players, player_rows, player_views
+
+
+def add_players(db):
+    db.add_all(
+        [
+            Player(playerid=1, firstname="Edson", surname="Arantes", commonname="Pelé", overallrating=98),
+            Player(playerid=2, firstname="Unknown_2", surname="", overallrating=70, age=19),
+            PlayerInfo(playerid=1, firstname="Edson", surname="Arantes", commonname="Pelé", nationality=54),
+        ]
+    )
+    db.commit()
+
+
+@contextmanager
+def capture_sql(db):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+
+
+class TestPlayerQueries:
+    """Test counts, projections and opt-in PlayerInfo loading."""
+
+    def test_count_players(self, db_session):
+        add_players(db_session)
+
+        assert count_players(db_session) == 2
+        assert count_players(db_session, ~Player.firstname.like("Unknown_%")) == 1
+
+    def test_rows_project_without_join(self, db_session):
+        add_players(db_session)
+        with capture_sql(db_session) as statements:
+            rows = player_rows(db_session, order_by=[Player.overallrating.desc()], limit=1)
+
+        assert [(row.playerid, row.commonname, row.overallrating) for row in rows] == [(1, "Pelé", 98)]
+        assert "player_info" not in statements[-1]
+
+    def test_rows_with_info(self, db_session):
+        add_players(db_session)
+
+        rows = player_rows(db_session, order_by=[Player.playerid], with_info=True)
+
+        assert [row.nationality for row in rows] == [54, None]
+
+    def test_info_loaded_only_on_request(self, db_session):
+        add_players(db_session)
+
+        lean = load_players(db_session, Player.playerid == 1)
+        assert "info" in inspect(lean[0]).unloaded
+        assert lean[0].display_name == "Pelé"
+        db_session.expunge_all()
+
+        full = load_players(db_session, Player.playerid == 1, with_info=True)
+        assert "info" not in inspect(full[0]).unloaded
+        assert full[0].info.nationality == 54
+
+
+class TestPlayerView:
+    """Test the slotted read model."""
+
+    def test_views_match_model_display(self, db_session):
+        add_players(db_session)
+
+        views = player_views(db_session, order_by=[Player.playerid])
+        players = load_players(db_session, order_by=[Player.playerid])
+
+        assert [view.detailed_display for view in views] == ["Pelé (OVR 98, ?)", "Player #2 (OVR 70, ?)"]
+        assert [view.detailed_display for view in views] == [p.detailed_display for p in players]
+        assert [view.growth_potential for view in views] == [p.growth_potential for p in players]
+
+    def test_read_only_and_slotted(self):
+        view = PlayerView(1, "Edson", "Arantes", None, 90, 95, 20, "ST")
+
+        assert view.growth_potential == 5
+        assert not hasattr(view, "__dict__")
+        with pytest.raises(AttributeError):
+            view.overallrating = 99
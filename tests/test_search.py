@@ -0,0 +1,67 @@
+"""
+Tests for the player name search index.
+"""
+
+import pytest
+
+from src.core.query_router import QueryRouter
+from src.database.search import match_expression, search_players
+
+NAMES = [("João", "Félix"), ("Edson", "Arantes"), ("Joaquim", "Silva"), ("Unknown", "")]
+
+
+@pytest.fixture
+def import_names(import_players):
+    """Import one player per (firstname, surname); "Unknown" stays unresolved"""
+    def run(names):
+        dcplayernames, players, growth = [], [], []
+        for playerid, (firstname, surname) in enumerate(names, 1):
+            if firstname != "Unknown":
+                dcplayernames.append({"nameid": playerid * 2, "name": firstname})
+                dcplayernames.append({"nameid": playerid * 2 + 1, "name": surname})
+            players.append({"playerid": playerid, "firstnameid": playerid * 2, "lastnameid": playerid * 2 + 1})
+            growth.append({"playerid": playerid, "overall": 70 + playerid, "potential": 90, "age": 20})
+
+        return import_players(
+            {"players": players, "career_playergrowthuserseason": growth}, names=dcplayernames
+        )
+
+    return run
+
+
+class TestSearch:
+    """Test FTS5 name search and its sync with imports."""
+
+    def test_prefix_search_ignores_accents_and_case(self, db_session, import_names):
+        import_names(NAMES)
+
+        assert [p.playerid for p in search_players(db_session, "joao")] == [1]
+        assert [p.playerid for p in search_players(db_session, "JO")] == [3, 1]  # Then by overall
+        assert [p.display_name for p in search_players(db_session, "edson ara")] == ["Edson Arantes"]
+        assert search_players(db_session, "unknown") == []
+
+    def test_fuzzy_matches_any_word(self, db_session, import_names):
+        import_names(NAMES)
+
+        assert search_players(db_session, "felix arantes") == []
+        assert {p.playerid for p in search_players(db_session, "felix arantes", fuzzy=True)} == {1, 2}
+
+    def test_reimport_updates_index(self, db_session, import_names):
+        import_names(NAMES)
+        import_names([("João", "Félix"), ("Kaká", "Leite")])
+
+        assert search_players(db_session, "edson") == []
+        assert search_players(db_session, "silva") == []
+        assert [p.playerid for p in search_players(db_session, "kaka")] == [2]
+
+    def test_query_syntax_is_escaped(self):
+        assert match_expression('jo" OR x') == '"jo"* "OR"* "x"*'
+        assert match_expression("a bc def", fuzzy=True) == '"def"*'
+
+    def test_router_player_info(self, db_session, import_names):
+        import_names(NAMES)
+
+        source, answer, _ = QueryRouter(db_session).route("informações sobre joão")
+
+        assert source == "sql"
+        assert answer == "João Félix (OVR 71, ?)"
@@ -0,0 +1,70 @@
+"""
+Tests for the squad stats snapshot.
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.database.models import Player, SquadStats
+from src.database.stats import compute_snapshot, get_snapshot, refresh_snapshot
+
+
+def add_players(db):
+    db.add_all(
+        [
+            Player(playerid=1, firstname="Edson", surname="Arantes", overallrating=90, potential=95, age=20),
+            Player(playerid=2, firstname="Unknown_2", surname="", overallrating=70, potential=75, age=30),
+        ]
+    )
+    db.commit()
+
+
+class TestSnapshot:
+    """Test computing, storing and reading the snapshot."""
+
+    def test_compute_aggregates_and_listings(self, db_session):
+        add_players(db_session)
+
+        stats = compute_snapshot(db_session)
+
+        assert (stats.total_players, stats.named_players, stats.unknown_players) == (2, 1, 1)
+        assert (stats.avg_overall, stats.avg_potential, stats.avg_age) == (80, 85, 25)
+        assert [p.playerid for p in stats.top_players] == [1, 2]
+        assert [p.display_name for p in stats.named_sample] == ["Edson Arantes"]
+
+    def test_stored_snapshot_served_without_scanning(self, db_session):
+        add_players(db_session)
+        refresh_snapshot(db_session)
+        db_session.commit()
+
+        db_session.query(Player).filter(Player.playerid == 2).delete()
+        db_session.commit()
+        stats = get_snapshot(db_session)
+
+        assert stats.total_players == 2  # As of the last refresh
+        assert stats.top_player.detailed_display == "Edson Arantes (OVR 90, ?)"
+
+    def test_live_snapshot_without_stored_one(self, db_session):
+        add_players(db_session)
+
+        assert db_session.get(SquadStats, 1) is None
+        assert get_snapshot(db_session).total_players == 2
+
+    def test_live_snapshot_on_database_before_ensure_schema(self, tmp_path):
+        bind = create_engine(f"sqlite:///{tmp_path}/old.db")
+        with bind.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE players (playerid INTEGER PRIMARY KEY, firstname VARCHAR(50),"
+                " surname VARCHAR(50), commonname VARCHAR(100), overallrating INTEGER,"
+                " potential INTEGER, age INTEGER, preferredposition1 VARCHAR(10))"
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO players VALUES (1, 'Edson', 'Arantes', NULL, 90, 95, 20, 'ST'),"
+                " (2, 'Unknown_2', '', NULL, 70, 75, 30, NULL), (3, 'Unknown', '', NULL, 60, 70, 25, NULL)"
+            )
+
+        with Session(bind) as db:
+            stats = get_snapshot(db)
+
+        assert (stats.total_players, stats.named_players) == (3, 2)
+        assert [p.playerid for p in stats.named_sample] == [1, 3]